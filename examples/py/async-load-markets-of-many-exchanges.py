@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt.async_support as ccxt  # noqa: E402
+
+
+async def main():
+    # 20 exchanges at a time, 15 seconds at most for each one
+    async with ccxt.ExchangePool(ccxt.exchanges, {'enableRateLimit': True}, concurrency=20, timeout=15000) as pool:
+        loaded = await pool.load_markets()
+        for id in sorted(loaded.keys()):
+            print(id, len(loaded[id].symbols), 'symbols')
+        for id in sorted(pool.errors.keys()):
+            print(id, 'failed:', type(pool.errors[id]).__name__, str(pool.errors[id])[0:100])
+
+
+asyncio.get_event_loop().run_until_complete(main())
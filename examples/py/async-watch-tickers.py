@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt.async_support as ccxt  # noqa: E402
+
+# all watchers share the rate limiter of the exchange
+exchange = ccxt.binance({'enableRateLimit': True})
+symbols = ['BTC/USDT', 'ETH/USDT', 'ETH/BTC', 'LTC/BTC']
+
+
+async def watch(symbol):
+    async for ticker in exchange.watch_ticker(symbol):
+        print(exchange.iso8601(exchange.milliseconds()), symbol, ticker['bid'], ticker['ask'], ticker['last'])
+
+
+async def main():
+    try:
+        await asyncio.gather(*[watch(symbol) for symbol in symbols])
+    finally:
+        await exchange.close()
+
+
+asyncio.get_event_loop().run_until_complete(main())
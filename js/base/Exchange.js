@@ -405,10 +405,17 @@ module.exports = class Exchange {
 
     defineRestApi (api, methodName, options = {}) {
 
+        // paths are either an array or an object of paths to their costs,
+        // a cost is a number or an object of costs by rate limit bucket name
+        this.apiCosts = {}
+
         for (const type of Object.keys (api)) {
             for (const httpMethod of Object.keys (api[type])) {
 
                 let paths = api[type][httpMethod]
+                const costs = Array.isArray (paths) ? undefined : paths
+                if (costs !== undefined)
+                    paths = Object.keys (costs)
                 for (let i = 0; i < paths.length; i++) {
                     let path = paths[i].trim ()
                     let splitPath = path.split (/[^a-zA-Z0-9]/)
@@ -438,6 +445,9 @@ module.exports = class Exchange {
 
                     this[camelcase]  = partial
                     this[underscore] = partial
+
+                    if (costs !== undefined)
+                        this.apiCosts[type + ' ' + uppercaseMethod + ' ' + path] = costs[paths[i]]
                 }
             }
         }
@@ -640,9 +650,15 @@ module.exports = class Exchange {
             this.currencies = deepExtend (indexBy (sortedCurrencies, 'code'), this.currencies)
         }
         this.currencies_by_id = indexBy (this.currencies, 'id')
+        this.indexMarkets (this.markets)
         return this.markets
     }
 
+    indexMarkets (markets) {
+        // builds the tables of the markets by other keys that an exchange keeps, like markets by uppercase id,
+        // called whenever the markets are set, also when fetchMarkets did not run for them
+    }
+
     async loadMarkets (reload = false) {
         if (!reload && this.markets) {
             if (!this.markets_by_id) {
@@ -132,6 +132,7 @@ module.exports = class bigone extends Exchange {
                 'quote': quote,
                 'baseId': baseId,
                 'quoteId': quoteId,
+                'uuid': uuid,
                 'active': true,
                 'precision': precision,
                 'limits': {
@@ -156,6 +157,10 @@ module.exports = class bigone extends Exchange {
         return result;
     }
 
+    indexMarkets (markets) {
+        this.options['marketsByUuid'] = this.indexBy (markets, 'uuid');
+    }
+
     parseTicker (ticker, market = undefined) {
         //
         //     [
@@ -30,6 +30,21 @@ module.exports = class binance extends Exchange {
                 'withdraw': true,
                 'fetchFundingFees': true,
             },
+            'pagination': {
+                'fetchOHLCV': {
+                    'limit': 1000, // candles per request
+                },
+                'fetchTrades': {
+                    'cursor': 'id',
+                    'param': 'fromId',
+                    'limit': 1000,
+                },
+                'fetchMyTrades': {
+                    'cursor': 'id',
+                    'param': 'fromId',
+                    'limit': 1000,
+                },
+            },
             'timeframes': {
                 '1m': '1m',
                 '3m': '3m',
@@ -86,48 +101,53 @@ module.exports = class binance extends Exchange {
                         'withdrawFee',
                     ],
                 },
+                // the request weights of the weight limit, the weights of some endpoints grow with the limit
+                // or when called without a symbol, the values here are those of the default calls of the methods
                 'v3': {
-                    'get': [
-                        'ticker/price',
-                        'ticker/bookTicker',
-                    ],
+                    'get': {
+                        'ticker/price': 1,
+                        'ticker/bookTicker': 1,
+                    },
                 },
                 'public': {
-                    'get': [
-                        'exchangeInfo',
-                        'ping',
-                        'time',
-                        'depth',
-                        'aggTrades',
-                        'klines',
-                        'ticker/24hr',
-                        'ticker/allPrices',
-                        'ticker/allBookTickers',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'exchangeInfo',
-                    ],
-                    'put': [ 'userDataStream' ],
-                    'post': [ 'userDataStream' ],
-                    'delete': [ 'userDataStream' ],
+                    'get': {
+                        'exchangeInfo': 1,
+                        'ping': 1,
+                        'time': 1,
+                        'depth': 1, // 5 with a limit of 500, 10 with 1000
+                        'aggTrades': 1,
+                        'klines': 1,
+                        'ticker/24hr': 1, // 40 without a symbol
+                        'ticker/allPrices': 1,
+                        'ticker/allBookTickers': 1,
+                        'ticker/price': 1,
+                        'ticker/bookTicker': 1,
+                    },
+                    'put': { 'userDataStream': 1 },
+                    'post': { 'userDataStream': 1 },
+                    'delete': { 'userDataStream': 1 },
                 },
                 'private': {
-                    'get': [
-                        'order',
-                        'openOrders',
-                        'allOrders',
-                        'account',
-                        'myTrades',
-                    ],
-                    'post': [
-                        'order',
-                        'order/test',
-                    ],
-                    'delete': [
-                        'order',
-                    ],
+                    'get': {
+                        'order': 1,
+                        'openOrders': 1, // 40 without a symbol
+                        'allOrders': 5,
+                        'account': 5,
+                        'myTrades': 5,
+                    },
+                    'post': {
+                        'order': { 'weight': 1, 'orders': 1 },
+                        'order/test': 1,
+                    },
+                    'delete': {
+                        'order': 1,
+                    },
                 },
             },
+            'rateLimitBuckets': {
+                'weight': { 'limit': 1200, 'period': 60000, 'api': [ 'public', 'private', 'v1', 'v3' ] },
+                'orders': { 'limit': 10, 'period': 1000, 'api': [] }, // only the endpoints that name it
+            },
             'fees': {
                 'trading': {
                     'tierBased': false,
@@ -921,7 +941,7 @@ module.exports = class binance extends Exchange {
         return { 'url': url, 'method': method, 'body': body, 'headers': headers };
     }
 
-    handleErrors (code, reason, url, method, headers, body) {
+    handleErrors (code, reason, url, method, headers, body, response = undefined) {
         if ((code === 418) || (code === 429))
             throw new DDoSProtection (this.id + ' ' + code.toString () + ' ' + reason + ' ' + body);
         // error response in a form: { "code": -1013, "msg": "Invalid quantity." }
@@ -937,7 +957,8 @@ module.exports = class binance extends Exchange {
         }
         if (body.length > 0) {
             if (body[0] === '{') {
-                let response = JSON.parse (body);
+                if (typeof response === 'undefined')
+                    response = JSON.parse (body);
                 // check success value for wapi endpoints
                 // response in format {'msg': 'The coin does not exist.', 'success': true/false}
                 let success = this.safeValue (response, 'success', true);
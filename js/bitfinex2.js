@@ -34,6 +34,11 @@ module.exports = class bitfinex2 extends bitfinex {
                 'fetchTradingFees': false,
                 'withdraw': true,
             },
+            'pagination': {
+                'fetchOHLCV': {
+                    'limit': 1000, // candles per request
+                },
+            },
             'timeframes': {
                 '1m': '1m',
                 '5m': '5m',
@@ -26,6 +26,11 @@ module.exports = class bitmex extends Exchange {
                 'fetchOpenOrders': true,
                 'fetchClosedOrders': true,
             },
+            'pagination': {
+                'fetchOHLCV': {
+                    'limit': 500, // candles per request
+                },
+            },
             'timeframes': {
                 '1m': '1m',
                 '5m': '5m',
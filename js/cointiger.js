@@ -200,6 +200,10 @@ module.exports = class cointiger extends huobipro {
         return result;
     }
 
+    indexMarkets (markets) {
+        this.options['marketsByUppercaseId'] = this.indexBy (markets, 'uppercaseId');
+    }
+
     parseTicker (ticker, market = undefined) {
         let symbol = undefined;
         if (market)
@@ -30,6 +30,11 @@ module.exports = class cryptopia extends Exchange {
                 'deposit': true,
                 'withdraw': true,
             },
+            'batch': {
+                'fetchOrderBooks': {
+                    'symbols': 5,
+                },
+            },
             'urls': {
                 'logo': 'https://user-images.githubusercontent.com/1294454/29484394-7b4ea6e2-84c6-11e7-83e5-1fccf4b2dc81.jpg',
                 'api': {
@@ -182,6 +187,10 @@ module.exports = class cryptopia extends Exchange {
         return result;
     }
 
+    indexMarkets (markets) {
+        this.options['marketsByLabel'] = this.indexBy (markets, 'label');
+    }
+
     async fetchOrderBook (symbol, limit = undefined, params = {}) {
         await this.loadMarkets ();
         let response = await this.publicGetGetMarketOrdersId (this.extend ({
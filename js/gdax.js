@@ -27,6 +27,32 @@ module.exports = class gdax extends Exchange {
                 'fetchDepositAddress': true,
                 'fetchMyTrades': true,
             },
+            'pagination': {
+                'fetchMyTrades': {
+                    'cursor': 'header',
+                    'header': 'CB-AFTER',
+                    'param': 'after',
+                    'limit': 100,
+                },
+                'fetchOrders': {
+                    'cursor': 'header',
+                    'header': 'CB-AFTER',
+                    'param': 'after',
+                    'limit': 100,
+                },
+                'fetchClosedOrders': {
+                    'cursor': 'header',
+                    'header': 'CB-AFTER',
+                    'param': 'after',
+                    'limit': 100,
+                },
+                'fetchTransactions': {
+                    'cursor': 'header',
+                    'header': 'CB-AFTER',
+                    'param': 'after',
+                    'limit': 100,
+                },
+            },
             'timeframes': {
                 '1m': 60,
                 '5m': 300,
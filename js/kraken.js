@@ -309,6 +309,10 @@ module.exports = class kraken extends Exchange {
         return result;
     }
 
+    indexMarkets (markets) {
+        this.marketsByAltname = this.indexBy (markets, 'altname');
+    }
+
     appendInactiveMarkets (result) {
         // result should be an array to append to
         let precision = { 'amount': 8, 'price': 8 };
@@ -905,7 +909,7 @@ module.exports = class kraken extends Exchange {
         return this.milliseconds ();
     }
 
-    handleErrors (code, reason, url, method, headers, body) {
+    handleErrors (code, reason, url, method, headers, body, response = undefined) {
         if (body.indexOf ('Invalid order') >= 0)
             throw new InvalidOrder (this.id + ' ' + body);
         if (body.indexOf ('Invalid nonce') >= 0)
@@ -917,7 +921,8 @@ module.exports = class kraken extends Exchange {
         if (body.indexOf ('Invalid arguments:volume') >= 0)
             throw new InvalidOrder (this.id + ' ' + body);
         if (body[0] === '{') {
-            let response = JSON.parse (body);
+            if (typeof response === 'undefined')
+                response = JSON.parse (body);
             if (typeof response !== 'string') {
                 if ('error' in response) {
                     let numErrors = response['error'].length;
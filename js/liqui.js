@@ -24,6 +24,16 @@ module.exports = class liqui extends Exchange {
                 'fetchMyTrades': true,
                 'withdraw': true,
             },
+            'batch': {
+                'fetchOrderBooks': {
+                    'length': 2048,
+                    'separator': '-',
+                },
+                'fetchTickers': {
+                    'length': 2048,
+                    'separator': '-',
+                },
+            },
             'urls': {
                 'logo': 'https://user-images.githubusercontent.com/1294454/27982022-75aea828-63a0-11e7-9511-ca584a8edd74.jpg',
                 'api': {
@@ -849,9 +849,19 @@ class Exchange {
     }
 
     public function define_rest_api ($api, $method_name, $options = array ()) {
+        // paths are either a list or an array of paths to their costs,
+        // a cost is a number or an array of costs by rate limit bucket name
+        $this->apiCosts = array ();
         foreach ($api as $type => $methods)
             foreach ($methods as $http_method => $paths)
-                foreach ($paths as $path) {
+                foreach ($paths as $key => $path) {
+
+                    $cost = null;
+                    if (is_string ($key)) {
+                        $cost = $path;
+                        $path = $key;
+                    }
+                    $path = trim ($path);
 
                     $splitPath = mb_split ('[^a-zA-Z0-9]', $path);
 
@@ -878,6 +888,9 @@ class Exchange {
 
                     $this->$camelcase  = $partial;
                     $this->$underscore = $partial;
+
+                    if ($cost !== null)
+                        $this->apiCosts[$type . ' ' . $uppercaseMethod . ' ' . $path] = $cost;
                 }
     }
 
@@ -1248,13 +1261,23 @@ class Exchange {
             $this->currencies = array_replace_recursive ($currencies, $this->currencies);
         }
         $this->currencies_by_id = $this->indexBy (array_values ($this->currencies), 'id');
+        $this->index_markets ($this->markets);
         return $this->markets;
     }
 
+    public function index_markets ($markets) {
+        // builds the tables of the markets by other keys that an exchange keeps, like markets by uppercase id,
+        // called whenever the markets are set, also when fetch_markets did not run for them
+    }
+
     public function setMarkets ($markets) {
         return $this->set_markets ($markets);
     }
 
+    public function indexMarkets ($markets) {
+        return $this->index_markets ($markets);
+    }
+
     public function loadMarkets ($reload = false) {
         return $this->load_markets ($reload);
     }
@@ -133,6 +133,7 @@ class bigone extends Exchange {
                 'quote' => $quote,
                 'baseId' => $baseId,
                 'quoteId' => $quoteId,
+                'uuid' => $uuid,
                 'active' => true,
                 'precision' => $precision,
                 'limits' => array (
@@ -157,6 +158,10 @@ class bigone extends Exchange {
         return $result;
     }
 
+    public function index_markets ($markets) {
+        $this->options['marketsByUuid'] = $this->index_by($markets, 'uuid');
+    }
+
     public function parse_ticker ($ticker, $market = null) {
         //
         //     array (
@@ -31,6 +31,21 @@ class binance extends Exchange {
                 'withdraw' => true,
                 'fetchFundingFees' => true,
             ),
+            'pagination' => array (
+                'fetchOHLCV' => array (
+                    'limit' => 1000, // candles per request
+                ),
+                'fetchTrades' => array (
+                    'cursor' => 'id',
+                    'param' => 'fromId',
+                    'limit' => 1000,
+                ),
+                'fetchMyTrades' => array (
+                    'cursor' => 'id',
+                    'param' => 'fromId',
+                    'limit' => 1000,
+                ),
+            ),
             'timeframes' => array (
                 '1m' => '1m',
                 '3m' => '3m',
@@ -87,48 +102,53 @@ class binance extends Exchange {
                         'withdrawFee',
                     ),
                 ),
+                // the request weights of the weight limit, the weights of some endpoints grow with the limit
+                // or when called without a symbol, the values here are those of the default calls of the methods
                 'v3' => array (
                     'get' => array (
-                        'ticker/price',
-                        'ticker/bookTicker',
+                        'ticker/price' => 1,
+                        'ticker/bookTicker' => 1,
                     ),
                 ),
                 'public' => array (
                     'get' => array (
-                        'exchangeInfo',
-                        'ping',
-                        'time',
-                        'depth',
-                        'aggTrades',
-                        'klines',
-                        'ticker/24hr',
-                        'ticker/allPrices',
-                        'ticker/allBookTickers',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'exchangeInfo',
+                        'exchangeInfo' => 1,
+                        'ping' => 1,
+                        'time' => 1,
+                        'depth' => 1, // 5 with a limit of 500, 10 with 1000
+                        'aggTrades' => 1,
+                        'klines' => 1,
+                        'ticker/24hr' => 1, // 40 without a symbol
+                        'ticker/allPrices' => 1,
+                        'ticker/allBookTickers' => 1,
+                        'ticker/price' => 1,
+                        'ticker/bookTicker' => 1,
                     ),
-                    'put' => array ( 'userDataStream' ),
-                    'post' => array ( 'userDataStream' ),
-                    'delete' => array ( 'userDataStream' ),
+                    'put' => array ( 'userDataStream' => 1 ),
+                    'post' => array ( 'userDataStream' => 1 ),
+                    'delete' => array ( 'userDataStream' => 1 ),
                 ),
                 'private' => array (
                     'get' => array (
-                        'order',
-                        'openOrders',
-                        'allOrders',
-                        'account',
-                        'myTrades',
+                        'order' => 1,
+                        'openOrders' => 1, // 40 without a symbol
+                        'allOrders' => 5,
+                        'account' => 5,
+                        'myTrades' => 5,
                     ),
                     'post' => array (
-                        'order',
-                        'order/test',
+                        'order' => array ( 'weight' => 1, 'orders' => 1 ),
+                        'order/test' => 1,
                     ),
                     'delete' => array (
-                        'order',
+                        'order' => 1,
                     ),
                 ),
             ),
+            'rateLimitBuckets' => array (
+                'weight' => array ( 'limit' => 1200, 'period' => 60000, 'api' => array ( 'public', 'private', 'v1', 'v3' ) ),
+                'orders' => array ( 'limit' => 10, 'period' => 1000, 'api' => array () ), // only the endpoints that name it
+            ),
             'fees' => array (
                 'trading' => array (
                     'tierBased' => false,
@@ -922,7 +942,7 @@ class binance extends Exchange {
         return array ( 'url' => $url, 'method' => $method, 'body' => $body, 'headers' => $headers );
     }
 
-    public function handle_errors ($code, $reason, $url, $method, $headers, $body) {
+    public function handle_errors ($code, $reason, $url, $method, $headers, $body, $response = null) {
         if (($code === 418) || ($code === 429))
             throw new DDoSProtection ($this->id . ' ' . (string) $code . ' ' . $reason . ' ' . $body);
         // $error $response in a form => array ( "$code" => -1013, "msg" => "Invalid quantity." )
@@ -938,7 +958,8 @@ class binance extends Exchange {
         }
         if (strlen ($body) > 0) {
             if ($body[0] === '{') {
-                $response = json_decode ($body, $as_associative_array = true);
+                if ($response === null)
+                    $response = json_decode ($body, $as_associative_array = true);
                 // check $success value for wapi endpoints
                 // $response in format array ('msg' => 'The coin does not exist.', 'success' => true/false)
                 $success = $this->safe_value($response, 'success', true);
@@ -35,6 +35,11 @@ class bitfinex2 extends bitfinex {
                 'fetchTradingFees' => false,
                 'withdraw' => true,
             ),
+            'pagination' => array (
+                'fetchOHLCV' => array (
+                    'limit' => 1000, // candles per request
+                ),
+            ),
             'timeframes' => array (
                 '1m' => '1m',
                 '5m' => '5m',
@@ -27,6 +27,11 @@ class bitmex extends Exchange {
                 'fetchOpenOrders' => true,
                 'fetchClosedOrders' => true,
             ),
+            'pagination' => array (
+                'fetchOHLCV' => array (
+                    'limit' => 500, // candles per request
+                ),
+            ),
             'timeframes' => array (
                 '1m' => '1m',
                 '5m' => '5m',
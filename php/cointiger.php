@@ -200,6 +200,10 @@ class cointiger extends huobipro {
         return $result;
     }
 
+    public function index_markets ($markets) {
+        $this->options['marketsByUppercaseId'] = $this->index_by($markets, 'uppercaseId');
+    }
+
     public function parse_ticker ($ticker, $market = null) {
         $symbol = null;
         if ($market)
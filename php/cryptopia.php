@@ -31,6 +31,11 @@ class cryptopia extends Exchange {
                 'deposit' => true,
                 'withdraw' => true,
             ),
+            'batch' => array (
+                'fetchOrderBooks' => array (
+                    'symbols' => 5,
+                ),
+            ),
             'urls' => array (
                 'logo' => 'https://user-images.githubusercontent.com/1294454/29484394-7b4ea6e2-84c6-11e7-83e5-1fccf4b2dc81.jpg',
                 'api' => array (
@@ -183,6 +188,10 @@ class cryptopia extends Exchange {
         return $result;
     }
 
+    public function index_markets ($markets) {
+        $this->options['marketsByLabel'] = $this->index_by($markets, 'label');
+    }
+
     public function fetch_order_book ($symbol, $limit = null, $params = array ()) {
         $this->load_markets();
         $response = $this->publicGetGetMarketOrdersId (array_merge (array (
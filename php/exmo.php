@@ -29,6 +29,11 @@ class exmo extends Exchange {
                 'fetchTickers' => true,
                 'withdraw' => true,
             ),
+            'batch' => array (
+                'fetchOrderBooks' => array (
+                    'length' => 2048,
+                ),
+            ),
             'urls' => array (
                 'logo' => 'https://user-images.githubusercontent.com/1294454/27766491-1b0ea956-5eda-11e7-9225-40d67b481b8d.jpg',
                 'api' => 'https://api.exmo.com',
@@ -28,6 +28,32 @@ class gdax extends Exchange {
                 'fetchDepositAddress' => true,
                 'fetchMyTrades' => true,
             ),
+            'pagination' => array (
+                'fetchMyTrades' => array (
+                    'cursor' => 'header',
+                    'header' => 'CB-AFTER',
+                    'param' => 'after',
+                    'limit' => 100,
+                ),
+                'fetchOrders' => array (
+                    'cursor' => 'header',
+                    'header' => 'CB-AFTER',
+                    'param' => 'after',
+                    'limit' => 100,
+                ),
+                'fetchClosedOrders' => array (
+                    'cursor' => 'header',
+                    'header' => 'CB-AFTER',
+                    'param' => 'after',
+                    'limit' => 100,
+                ),
+                'fetchTransactions' => array (
+                    'cursor' => 'header',
+                    'header' => 'CB-AFTER',
+                    'param' => 'after',
+                    'limit' => 100,
+                ),
+            ),
             'timeframes' => array (
                 '1m' => 60,
                 '5m' => 300,
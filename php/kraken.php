@@ -310,6 +310,10 @@ class kraken extends Exchange {
         return $result;
     }
 
+    public function index_markets ($markets) {
+        $this->marketsByAltname = $this->index_by($markets, 'altname');
+    }
+
     public function append_inactive_markets ($result) {
         // $result should be an array to append to
         $precision = array ( 'amount' => 8, 'price' => 8 );
@@ -906,7 +910,7 @@ class kraken extends Exchange {
         return $this->milliseconds ();
     }
 
-    public function handle_errors ($code, $reason, $url, $method, $headers, $body) {
+    public function handle_errors ($code, $reason, $url, $method, $headers, $body, $response = null) {
         if (mb_strpos ($body, 'Invalid order') !== false)
             throw new InvalidOrder ($this->id . ' ' . $body);
         if (mb_strpos ($body, 'Invalid nonce') !== false)
@@ -918,7 +922,8 @@ class kraken extends Exchange {
         if (mb_strpos ($body, 'Invalid arguments:volume') !== false)
             throw new InvalidOrder ($this->id . ' ' . $body);
         if ($body[0] === '{') {
-            $response = json_decode ($body, $as_associative_array = true);
+            if ($response === null)
+                $response = json_decode ($body, $as_associative_array = true);
             if (gettype ($response) !== 'string') {
                 if (is_array ($response) && array_key_exists ('error', $response)) {
                     $numErrors = is_array ($response['error']) ? count ($response['error']) : 0;
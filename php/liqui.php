@@ -29,6 +29,16 @@ class liqui extends Exchange {
                 'fetchMyTrades' => true,
                 'withdraw' => true,
             ),
+            'batch' => array (
+                'fetchOrderBooks' => array (
+                    'length' => 2048,
+                    'separator' => '-',
+                ),
+                'fetchTickers' => array (
+                    'length' => 2048,
+                    'separator' => '-',
+                ),
+            ),
             'urls' => array (
                 'logo' => 'https://user-images.githubusercontent.com/1294454/27982022-75aea828-63a0-11e7-9511-ca584a8edd74.jpg',
                 'api' => array (
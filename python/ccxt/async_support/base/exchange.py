@@ -12,15 +12,20 @@ import socket
 import time
 import math
 import random
-import certifi
 import aiohttp
-import ssl
 import sys
+import logging
 import yarl
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.throttle import throttle
+from ccxt.async_support.base.session import create_session
+from ccxt.async_support.base.session import shared_session
+from ccxt.async_support.base.pagination import AsyncPages
+from ccxt.async_support.base.watch import Poller
+from ccxt.async_support.base.watch import ChangedSnapshots
+from ccxt.async_support.base.watch import NewTrades
 
 # -----------------------------------------------------------------------------
 
@@ -32,6 +37,9 @@ from ccxt.base.errors import NotSupported
 # -----------------------------------------------------------------------------
 
 from ccxt.base.exchange import Exchange as BaseExchange
+from ccxt.base.order_book import OrderBook
+from ccxt.base.pagination import Paginator
+from ccxt.base.arrays import aggregate_bids_asks_array
 
 # -----------------------------------------------------------------------------
 
@@ -42,25 +50,38 @@ __all__ = [
 
 # -----------------------------------------------------------------------------
 
+current_task = getattr(asyncio, 'current_task', None) or asyncio.Task.current_task  # python 3.5 and 3.6
+
+# -----------------------------------------------------------------------------
+
 
 class Exchange(BaseExchange):
 
+    tcpConnectorLimit = 100  # connections in total
+    tcpConnectorLimitPerHost = 0  # connections to the same host, 0 is unlimited
+    dnsCacheTTL = 10  # seconds to cache resolved hosts for, None caches them forever
+
     def __init__(self, config={}):
         if 'asyncio_loop' in config:
             self.asyncio_loop = config['asyncio_loop']
         self.asyncio_loop = self.asyncio_loop or asyncio.get_event_loop()
         self.own_session = 'session' not in config
-        self.open()
-        super(Exchange, self).__init__(config)
-        self.init_rest_rate_limiter()
+        self.response_headers_by_task = {}  # the headers of the responses to the tasks of paginate() by task
+        super(Exchange, self).__init__(config)  # opens the session with create_session()
 
     def init_rest_rate_limiter(self):
+        self.check_rate_limit_costs()
         self.throttle = throttle(self.extend({
             'loop': self.asyncio_loop,
         }, self.tokenBucket))
+        self.rateLimiters = {}
+        for name, bucket in (self.rateLimitBuckets or {}).items():
+            self.rateLimiters[name] = throttle(self.extend({
+                'loop': self.asyncio_loop,
+            }, self.rate_limit_bucket_config(bucket)))
 
     def __del__(self):
-        if self.session is not None:
+        if self.session is not None and not self.shareSession:
             self.logger.warning(self.id + " requires to release all resources with an explicit call to the .close() coroutine. If you are creating the exchange instance from within your async coroutine, add exchange.close() to your code into a place when you're done with the exchange and don't need the exchange instance anymore (at the end of your async coroutine).")
 
     if sys.version_info >= (3, 5):
@@ -72,16 +93,24 @@ class Exchange(BaseExchange):
             await self.close()
 
     def open(self):
-        if self.own_session and self.session is None:
-            # Create our SSL context object with our CA cert file
-            context = ssl.create_default_context(cafile=certifi.where())
-            # Pass this SSL context to aiohttp and create a TCPConnector
-            connector = aiohttp.TCPConnector(ssl_context=context, loop=self.asyncio_loop)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector)
+        if self.own_session and (self.session is None or self.session.closed):
+            self.session = self.create_session()
+
+    def create_session(self):
+        options = {
+            'limit': self.tcpConnectorLimit,
+            'limit_per_host': self.tcpConnectorLimitPerHost,
+            'ttl_dns_cache': self.dnsCacheTTL,
+        }
+        if self.shareSession:
+            # the first exchange on the loop determines the connector settings,
+            # the shared session is closed with close_shared_sessions()
+            return shared_session(self.asyncio_loop, **options)
+        return create_session(self.asyncio_loop, **options)
 
     async def close(self):
         if self.session is not None:
-            if self.own_session:
+            if self.own_session and not self.shareSession:
                 await self.session.close()
             self.session = None
 
@@ -108,7 +137,11 @@ class Exchange(BaseExchange):
     async def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None):
         """A better wrapper over request for deferred signing"""
         if self.enableRateLimit:
-            await self.throttle()
+            cost = self.request_cost(path, api, method)
+            if isinstance(cost, dict):
+                await asyncio.gather(*[self.rate_limit_bucket(name)(value) for name, value in cost.items()])
+            else:
+                await self.throttle(cost)
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         return await self.fetch(request['url'], request['method'], request['headers'], request['body'])
@@ -127,6 +160,7 @@ class Exchange(BaseExchange):
         encoded_body = body.encode() if body else None
         session_method = getattr(self.session, method.lower())
         http_status_code = None
+        json_response = None
 
         try:
             async with session_method(yarl.URL(url, encoded=True),
@@ -135,14 +169,24 @@ class Exchange(BaseExchange):
                                       timeout=(self.timeout / 1000),
                                       proxy=self.aiohttp_proxy) as response:
                 http_status_code = response.status
-                text = await response.text()
-                self.last_http_response = text
-                self.last_response_headers = response.headers
-                self.handle_errors(http_status_code, text, url, method, self.last_response_headers, text)
-                self.handle_rest_errors(None, http_status_code, text, url, method)
+                content = await response.read()
+                response_headers = response.headers
+                # the text is decoded from the bytes like response.text() does, when something reads it, the response
+                # is read from locals and only mirrored onto last_http_*, as other coroutines use the same instance
+                text = self.response_text(lambda: content.decode(response.get_encoding()))
+                self.record_response_content(content, text)
+                self.record_response_headers(response_headers)
+                if self.parseJsonResponse:
+                    response_body = text() if self.parse_json_takes_text else content
+                    json_response = self.parse_json(response, response_body, url, method)
+                if self.handles_errors:
+                    self.call_handle_errors(http_status_code, text(), url, method, response_headers, text(), json_response)
+                if http_status_code >= 400:
+                    self.handle_rest_errors(None, http_status_code, text(), url, method)
                 if self.verbose:
-                    print("\nResponse:", method, url, str(http_status_code), str(response.headers), self.last_http_response)
-                self.logger.debug("%s %s, Response: %s %s %s", method, url, response.status, response.headers, self.last_http_response)
+                    print("\nResponse:", method, url, str(http_status_code), str(response_headers), text())
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("%s %s, Response: %s %s %s", method, url, response.status, response_headers, text())
 
         except socket.gaierror as e:
             self.raise_error(ExchangeNotAvailable, url, method, e, None)
@@ -156,8 +200,22 @@ class Exchange(BaseExchange):
         except aiohttp.client_exceptions.ClientError as e:
             self.raise_error(ExchangeError, url, method, e, None)
 
-        self.handle_errors(http_status_code, text, url, method, self.last_response_headers, text)
-        return self.handle_rest_response(text, url, method, headers, body)
+        if self.handles_errors:
+            self.call_handle_errors(http_status_code, text(), url, method, response_headers, text(), json_response)
+        return self.handle_rest_response(text() if json_response is None else None, url, method, headers, body, json_response)
+
+    def record_response_headers(self, headers):
+        self.last_response_headers = headers
+        if self.response_headers_by_task:
+            task = current_task()
+            if task in self.response_headers_by_task:
+                self.response_headers_by_task[task] = headers
+
+    async def refresh_markets(self):
+        try:
+            await self.load_markets(True)
+        except Exception as e:
+            self.logger.warning('%s could not refresh the markets: %s', self.id, e)
 
     async def load_markets(self, reload=False):
         if not reload:
@@ -165,10 +223,22 @@ class Exchange(BaseExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if self.shareMarkets and self.load_shared_markets():
+                return self.markets
+            if self.marketsCacheDirectory:
+                expired = self.load_markets_from_cache()
+                if expired is False:
+                    return self.markets
+                if expired and self.marketsCacheBackgroundRefresh:
+                    asyncio.ensure_future(self.refresh_markets(), loop=self.asyncio_loop)
+                    return self.markets
+        # the currencies are fetched after the markets, as the fetch_markets of some exchanges fetches them
         markets = await self.fetch_markets()
         currencies = None
         if self.has['fetchCurrencies']:
             currencies = await self.fetch_currencies()
+        if self.marketsCacheDirectory:
+            self.save_markets_to_cache(markets, currencies)
         return self.set_markets(markets, currencies)
 
     async def load_fees(self):
@@ -210,6 +280,13 @@ class Exchange(BaseExchange):
 
     async def fetch_l2_order_book(self, symbol, limit=None, params={}):
         orderbook = await self.fetch_order_book(symbol, limit, params)
+        if isinstance(orderbook, OrderBook):  # aggregated and sorted already
+            return orderbook
+        if self.orderBookFormat == 'numpy':
+            return self.extend(orderbook, {
+                'bids': aggregate_bids_asks_array(orderbook['bids'], True),
+                'asks': aggregate_bids_asks_array(orderbook['asks']),
+            })
         return self.extend(orderbook, {
             'bids': self.sort_by(self.aggregate(orderbook['bids']), 0, True),
             'asks': self.sort_by(self.aggregate(orderbook['asks']), 0),
@@ -234,6 +311,98 @@ class Exchange(BaseExchange):
     async def fetchOHLCV(self, symbol, timeframe='1m', since=None, limit=None, params={}):
         return await self.fetch_ohlcv(symbol, timeframe, since, limit, params)
 
+    async def fetch_ohlcv_pages(self, symbol, timeframe, cursor, until, limit=None, params={}, checkpoint=None):
+        ohlcvs = [] if checkpoint is None else checkpoint['ohlcvs']
+        while (cursor is not None) and (cursor < until):
+            page = await self.fetch_ohlcv(symbol, timeframe, cursor, limit, params)
+            ohlcvs.extend(page)
+            cursor = self.next_ohlcv_cursor(page, cursor, timeframe, limit)
+            if checkpoint is not None:
+                checkpoint['since'] = until if cursor is None else min(cursor, until)
+        return ohlcvs
+
+    async def fetch_ohlcv_range(self, symbol, timeframe='1m', since=None, until=None, params={}, checkpoint=None, concurrency=5):
+        """Fetches the candles from since until until (now by default), if the size of the pages is known
+        up to concurrency windows of one page are requested at a time, subject to the rate limiter,
+        a checkpoint dict is updated with the since of the first window not fetched yet and the candles before it"""
+        start, until, limit = self.ohlcv_range_arguments(since, until, checkpoint)
+        since = start if since is None else min(since, start)
+        if checkpoint is not None:
+            checkpoint.setdefault('ohlcvs', [])
+        if not limit:
+            ohlcvs = await self.fetch_ohlcv_pages(symbol, timeframe, start, until, limit, params, checkpoint)
+            return self.returned_ohlcvs(ohlcvs, since, until, checkpoint)
+        step = limit * self.parse_timeframe(timeframe) * 1000
+        windows = list(range(start, until, step))
+        pages = [None] * len(windows)
+        semaphore = asyncio.Semaphore(concurrency)
+        completed = [0]
+
+        async def fetch_window(i):
+            async with semaphore:
+                # a short page is followed up to the end of the window
+                pages[i] = await self.fetch_ohlcv_pages(symbol, timeframe, windows[i], min(windows[i] + step, until), limit, params)
+            while (completed[0] < len(windows)) and (pages[completed[0]] is not None):
+                if checkpoint is not None:
+                    checkpoint['ohlcvs'].extend(pages[completed[0]])
+                completed[0] += 1
+            if checkpoint is not None:
+                checkpoint['since'] = windows[completed[0]] if completed[0] < len(windows) else until
+
+        tasks = [asyncio.ensure_future(fetch_window(i)) for i in range(0, len(windows))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()  # the windows after a failure are fetched when resuming from the checkpoint
+            raise
+        if checkpoint is not None:
+            return self.returned_ohlcvs(checkpoint['ohlcvs'], since, until, checkpoint)
+        return self.merge_ohlcvs([ohlcv for page in pages for ohlcv in page], since, until)
+
+    def paginate(self, method, symbol=None, since=None, params={}):
+        """Returns an async iterator over the pages of a method like fetch_my_trades, use it with async for"""
+        return AsyncPages(Paginator(self, method, symbol, since, params), getattr(self, method))
+
+    async def fetch_batch(self, method, symbols=None, params={}):
+        """Calls a batch method like fetch_order_books or fetch_tickers for chunks of symbols that fit the limits
+        in self.batch, or the single symbol method for every symbol if the exchange has no batch method,
+        the requests run concurrently, returns a dict of the results of the requested symbols by symbol"""
+        await self.load_markets()
+        method, fallback, chunks = self.batch_arguments(method, symbols)
+        result = {}
+        if fallback:
+            fetch = getattr(self, fallback)
+            requested = self.symbols if symbols is None else symbols
+            results = await asyncio.gather(*[fetch(symbol, params=params) for symbol in requested])
+            result = dict(zip(requested, results))
+        else:
+            fetch = getattr(self, method)
+            for chunk_result in await asyncio.gather(*[fetch(chunk, params) for chunk in chunks]):
+                result.update(chunk_result)
+        return self.filter_by_symbols(result, symbols)
+
+    def poll_interval(self, interval=None):
+        # without the rate limiter the polls of one poller are spaced by rateLimit
+        if interval is not None:
+            return interval
+        return 0 if self.enableRateLimit else self.rateLimit
+
+    def watch_ticker(self, symbol, params={}, interval=None):
+        """Returns an async iterator over the tickers of a symbol, unchanged tickers are skipped"""
+        return Poller(self.fetch_ticker, [symbol, params], ChangedSnapshots(), self.poll_interval(interval))
+
+    def watch_order_book(self, symbol, limit=None, params={}, interval=None):
+        """Returns an async iterator over the order books of a symbol, unchanged order books are skipped"""
+        return Poller(self.fetch_order_book, [symbol, limit, params], ChangedSnapshots(), self.poll_interval(interval))
+
+    def watch_trades(self, symbol, params={}, interval=None):
+        """Returns an async iterator over lists of the trades of a symbol, each trade is returned once"""
+        return Poller(self.fetch_trades, [symbol, None, None, params], NewTrades(), self.poll_interval(interval))
+
+    async def fetchOHLCVRange(self, symbol, timeframe='1m', since=None, until=None, params={}, checkpoint=None, concurrency=5):
+        return await self.fetch_ohlcv_range(symbol, timeframe, since, until, params, checkpoint, concurrency)
+
     async def fetch_full_tickers(self, symbols=None, params={}):
         return await self.fetch_tickers(symbols, params)
 
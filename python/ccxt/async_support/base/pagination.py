@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+"""Async iteration over the pages of paginated requests"""
+
+import asyncio
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'AsyncPages',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class AsyncPages(object):
+    """An async iterator over the pages of a paginated method, a page is fetched on every iteration.
+    It is a class and not an async generator to keep python 3.5 support."""
+
+    def __init__(self, paginator, fetch):
+        self.paginator = paginator
+        self.fetch = fetch
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        paginator = self.paginator
+        exchange = paginator.exchange
+        while not paginator.done:
+            # every page is fetched in a task of its own, the exchange keeps the response headers of that task
+            # apart from the last_response_headers of the requests running at the same time
+            task = asyncio.ensure_future(self.fetch(*paginator.arguments()), loop=exchange.asyncio_loop)
+            exchange.response_headers_by_task[task] = None
+            try:
+                page = await task
+            finally:
+                headers = exchange.response_headers_by_task.pop(task, None)
+            page = paginator.update(page, headers)
+            if len(page):
+                return page
+        raise StopAsyncIteration
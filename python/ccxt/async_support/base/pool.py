@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""Concurrent instantiation and market loading of many exchanges"""
+
+# -----------------------------------------------------------------------------
+
+import asyncio
+import importlib
+
+from ccxt.base.errors import RequestTimeout
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'ExchangePool',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class ExchangePool(object):
+    """A set of async exchanges by name, created from a list of ids or instances, or from a dict of configs or
+    instances by name. The name is the exchange id unless given, a config names the exchange of another name in
+    its 'exchange' key, so that one exchange can be in the pool more than once, like two accounts. Names must be unique.
+    load_markets() loads the markets of all exchanges at once, at most concurrency exchanges at a time,
+    each one within timeout milliseconds. The exchanges that fail or time out are left out of the result
+    and their errors are kept in pool.errors by name, so that one slow exchange does not hold up the others.
+
+        async with ExchangePool(['binance', 'kraken'], {'enableRateLimit': True}) as pool:
+            exchanges = await pool.load_markets()
+
+        ExchangePool({'main': {'exchange': 'binance', 'apiKey': ...}, 'hedge': {'exchange': 'binance', 'apiKey': ...}})
+    """
+
+    def __init__(self, exchanges, config={}, concurrency=10, timeout=30000):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.exchanges = {}
+        self.errors = {}
+        if isinstance(exchanges, dict):
+            exchanges = [(name, exchanges[name]) for name in exchanges]
+        created = []
+        try:
+            for exchange in exchanges:
+                if isinstance(exchange, tuple):
+                    name, exchange = exchange
+                else:
+                    name = exchange.id if hasattr(exchange, 'load_markets') else exchange
+                # checked before the exchange is created, so that no session is left open
+                if name in self.exchanges:
+                    raise ValueError('ExchangePool got more than one exchange named ' + str(name) + ', give them names of their own')
+                if isinstance(exchange, str):
+                    exchange = self.create_exchange(exchange, config)
+                    created.append(exchange)
+                elif not hasattr(exchange, 'load_markets'):
+                    options = dict(config, **(exchange or {}))
+                    exchange = self.create_exchange(options.pop('exchange', name), options)
+                    created.append(exchange)
+                self.exchanges[name] = exchange
+        except Exception:
+            # the caller gets no pool to close, the sessions of the exchanges created so far are closed here,
+            # the instances that were passed in are left to the caller
+            self.discard(created)
+            raise
+
+    @staticmethod
+    def discard(exchanges):
+        for exchange in exchanges:
+            if exchange.asyncio_loop.is_running():
+                asyncio.ensure_future(exchange.close(), loop=exchange.asyncio_loop)
+            else:
+                exchange.asyncio_loop.run_until_complete(exchange.close())
+
+    @staticmethod
+    def create_exchange(id, config={}):
+        ccxt = importlib.import_module('ccxt.async_support')
+        return getattr(ccxt, id)(config)
+
+    def __getitem__(self, name):
+        return self.exchanges[name]
+
+    def __iter__(self):
+        return iter(self.exchanges.values())
+
+    def __len__(self):
+        return len(self.exchanges)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def load(self, semaphore, name, exchange, reload=False):
+        async with semaphore:
+            try:
+                if self.timeout:
+                    await asyncio.wait_for(exchange.load_markets(reload), self.timeout / 1000)
+                else:
+                    await exchange.load_markets(reload)
+                self.errors.pop(name, None)
+            except asyncio.TimeoutError:
+                self.errors[name] = RequestTimeout(exchange.id + ' could not load markets in ' + str(self.timeout) + ' ms')
+            except Exception as e:
+                self.errors[name] = e
+
+    async def load_markets(self, reload=False):
+        """Loads the markets of all exchanges, returns a dict of the exchanges with loaded markets by name"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*[self.load(semaphore, name, exchange, reload) for name, exchange in self.exchanges.items()])
+        return self.loaded()
+
+    def loaded(self):
+        return dict((name, exchange) for name, exchange in self.exchanges.items() if exchange.markets and name not in self.errors)
+
+    async def close(self):
+        await asyncio.gather(*[exchange.close() for exchange in self.exchanges.values()], return_exceptions=True)
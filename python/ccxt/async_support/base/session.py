@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import ssl
+
+import aiohttp
+import certifi
+
+__all__ = [
+    'ssl_context',
+    'create_connector',
+    'create_session',
+    'shared_session',
+    'close_shared_sessions',
+]
+
+contexts = []
+shared_sessions = {}
+
+
+def ssl_context():
+    """Returns the process-wide SSL context, the CA certificates of certifi are loaded once"""
+    if not contexts:
+        contexts.append(ssl.create_default_context(cafile=certifi.where()))
+    return contexts[0]
+
+
+def create_connector(loop, limit=100, limit_per_host=0, ttl_dns_cache=10):
+    """Returns a TCPConnector with at most limit connections, limit_per_host to the same host (0 is unlimited),
+    resolved hosts are cached for ttl_dns_cache seconds (None caches them forever)"""
+    return aiohttp.TCPConnector(ssl=ssl_context(), limit=limit, limit_per_host=limit_per_host,
+                                use_dns_cache=True, ttl_dns_cache=ttl_dns_cache, loop=loop)
+
+
+def create_session(loop, **options):
+    return aiohttp.ClientSession(loop=loop, connector=create_connector(loop, **options))
+
+
+def shared_session(loop, **options):
+    """Returns the session shared by all exchanges on the event loop, creating it with the options on first use"""
+    session = shared_sessions.get(loop)
+    if session is None or session.closed:
+        session = shared_sessions[loop] = create_session(loop, **options)
+    return session
+
+
+async def close_shared_sessions(loop=None):
+    """Closes the shared sessions of the loop, or of all loops, exchanges get a new one with .open()"""
+    loops = [loop] if loop else list(shared_sessions.keys())
+    for key in loops:
+        session = shared_sessions.pop(key, None)
+        if session is not None:
+            await session.close()
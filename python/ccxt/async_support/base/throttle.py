@@ -1,50 +1,83 @@
 # -*- coding: utf-8 -*-
 
-from asyncio import Queue, sleep, Future, ensure_future, get_event_loop
+from asyncio import sleep, Future, ensure_future
+from collections import deque
 from time import time
 
 __all__ = [
+    'Throttle',
     'throttle',
 ]
 
 
-def throttle(config=None):
+class Throttle(object):
+    """An asyncio token bucket, waiting requests are released in order, each one consuming its cost in tokens.
+    Instead of polling, the runner sleeps exactly until the bucket has tokens for the next request in line."""
 
-    cfg = {
-        'lastTimestamp': time(),
-        'numTokens': 0,
-        'running': False,
-        'queue': Queue(),
-        'loop': get_event_loop(),
-        'delay': 0.001,
-        'refillRate': 0.001,
-        'defaultCost': 1.000,
-        'capacity': 1.000,
-    }
-
-    cfg.update(config)
-
-    async def run():
-        if not cfg['running']:
-            cfg['running'] = True
-            while not cfg['queue'].empty():
-                now = time()
-                elapsed = (now - cfg['lastTimestamp'])
-                cfg['lastTimestamp'] = now
-                cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
-                if cfg['numTokens'] > 0:
-                    if not cfg['queue'].empty():
-                        cost, future = cfg['queue'].get_nowait()
-                        cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
-                        if not future.done():
-                            future.set_result(None)
-                await sleep(cfg['delay'])
-            cfg['running'] = False
-
-    def throttle(cost=None):
+    def __init__(self, config=None):
+        self.config = {
+            'lastTimestamp': time(),
+            'numTokens': 0,
+            'delay': 0.001,  # unused, kept for backward-compatibility
+            'refillRate': 0.001,  # tokens per millisecond
+            'defaultCost': 1.000,
+            'capacity': 1.000,
+        }
+        self.config.update(config or {})
+        self.queue = deque()
+        self.running = False
+        self.metrics = {
+            'requests': 0,  # number of released requests
+            'waitTime': 0.0,  # seconds spent in the queue by all released requests
+            'maxWaitTime': 0.0,
+            'lastWaitTime': 0.0,
+        }
+
+    @property
+    def queue_depth(self):
+        return len(self.queue)
+
+    def __call__(self, cost=None):
         future = Future()
-        cfg['queue'].put_nowait((cost, future))
-        ensure_future(run())
+        self.queue.append((cost, future, time()))
+        if not self.running:
+            self.running = True
+            ensure_future(self.run())
         return future
 
-    return throttle
+    def refill(self):
+        cfg = self.config
+        now = time()
+        elapsed = now - cfg['lastTimestamp']
+        cfg['lastTimestamp'] = now
+        cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
+        return now
+
+    async def run(self):
+        cfg = self.config
+        try:
+            while self.queue:
+                now = self.refill()
+                if cfg['numTokens'] > 0:
+                    cost, future, timestamp = self.queue.popleft()
+                    if future.done():  # cancelled while waiting, does not consume tokens
+                        continue
+                    cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
+                    self.record_wait_time(now - timestamp)
+                    future.set_result(None)
+                else:
+                    # the exact time until the bucket has a positive amount of tokens again
+                    await sleep(-cfg['numTokens'] / (cfg['refillRate'] * 1000))
+        finally:
+            self.running = False
+
+    def record_wait_time(self, seconds):
+        metrics = self.metrics
+        metrics['requests'] += 1
+        metrics['waitTime'] += seconds
+        metrics['maxWaitTime'] = max(metrics['maxWaitTime'], seconds)
+        metrics['lastWaitTime'] = seconds
+
+
+def throttle(config=None):
+    return Throttle(config)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""Async iterators that poll tickers, order books and trades and return what changed"""
+
+# -----------------------------------------------------------------------------
+
+from asyncio import sleep
+from time import time
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Poller',
+    'ChangedSnapshots',
+    'NewTrades',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class Poller(object):
+    """An async iterator that calls fetch(*arguments) and returns the first result that changes() does not drop.
+    A poll is only made when the next result is awaited, so a slow consumer slows the polling down instead of
+    piling up results. The requests go through the throttle of the exchange, so that many pollers of one exchange
+    share its rate limit in the order they asked, the interval (in milliseconds) only sets the least time between
+    two polls of one poller."""
+
+    def __init__(self, fetch, arguments, changes, interval=0):
+        self.fetch = fetch
+        self.arguments = arguments
+        self.changes = changes
+        self.interval = interval
+        self.polled = None
+        self.polls = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            if self.interval and self.polled is not None:
+                delay = self.polled + self.interval / 1000 - time()
+                if delay > 0:
+                    await sleep(delay)
+            self.polled = time()
+            self.polls += 1
+            result = self.changes(await self.fetch(*self.arguments))
+            if result is not None:
+                return result
+
+
+class ChangedSnapshots(object):
+    """Drops the snapshots that are equal to the previous one, the keys that change with every response are ignored"""
+
+    def __init__(self, ignored=('info', 'timestamp', 'datetime', 'nonce')):
+        self.ignored = ignored
+        self.previous = None
+
+    def fingerprint(self, snapshot):
+        return dict((key, tolist(snapshot[key])) for key in snapshot if key not in self.ignored)
+
+    def __call__(self, snapshot):
+        fingerprint = self.fingerprint(snapshot)
+        if fingerprint == self.previous:
+            return None
+        self.previous = fingerprint
+        return snapshot
+
+
+class NewTrades(object):
+    """Keeps the trades that were not returned before, those newer than the last timestamp seen
+    and, at that timestamp, those not seen before, by id or by (timestamp, price, amount, side) without an id"""
+
+    def __init__(self):
+        self.timestamp = None
+        self.seen = set()
+
+    def __call__(self, trades):
+        fresh = [trade for trade in trades if self.is_new(trade)]
+        if not len(fresh):
+            return None
+        timestamp = max([trade['timestamp'] for trade in fresh if trade.get('timestamp') is not None] or [None])
+        if timestamp is not None and timestamp != self.timestamp:
+            self.timestamp = timestamp
+            self.seen = set()
+        self.seen.update([self.key(trade) for trade in fresh if trade.get('timestamp') in (self.timestamp, None)])
+        self.seen.discard(None)
+        return fresh
+
+    def is_new(self, trade):
+        timestamp = trade.get('timestamp')
+        if self.timestamp is not None and timestamp is not None:
+            if timestamp < self.timestamp:
+                return False
+            if timestamp > self.timestamp:
+                return True
+        key = self.key(trade)
+        return key is None or key not in self.seen
+
+    @staticmethod
+    def key(trade):
+        # the trades with neither an id nor a timestamp cannot be told apart, they are always new
+        if trade.get('id') is not None:
+            return trade['id']
+        if trade.get('timestamp') is None:
+            return None
+        return (trade['timestamp'], trade.get('price'), trade.get('amount'), trade.get('side'))
+
+
+def tolist(value):
+    return value.tolist() if hasattr(value, 'tolist') else value
@@ -143,6 +143,7 @@ class bigone (Exchange):
                 'quote': quote,
                 'baseId': baseId,
                 'quoteId': quoteId,
+                'uuid': uuid,
                 'active': True,
                 'precision': precision,
                 'limits': {
@@ -165,6 +166,9 @@ class bigone (Exchange):
             result.append(entry)
         return result
 
+    def index_markets(self, markets):
+        self.options['marketsByUuid'] = self.index_by(markets, 'uuid')
+
     def parse_ticker(self, ticker, market=None):
         #
         #     [
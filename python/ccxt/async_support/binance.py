@@ -40,6 +40,21 @@ class binance (Exchange):
                 'withdraw': True,
                 'fetchFundingFees': True,
             },
+            'pagination': {
+                'fetchOHLCV': {
+                    'limit': 1000,  # candles per request
+                },
+                'fetchTrades': {
+                    'cursor': 'id',
+                    'param': 'fromId',
+                    'limit': 1000,
+                },
+                'fetchMyTrades': {
+                    'cursor': 'id',
+                    'param': 'fromId',
+                    'limit': 1000,
+                },
+            },
             'timeframes': {
                 '1m': '1m',
                 '3m': '3m',
@@ -96,48 +111,53 @@ class binance (Exchange):
                         'withdrawFee',
                     ],
                 },
+                # the request weights of the weight limit, the weights of some endpoints grow with the limit
+                # or when called without a symbol, the values here are those of the default calls of the methods
                 'v3': {
-                    'get': [
-                        'ticker/price',
-                        'ticker/bookTicker',
-                    ],
+                    'get': {
+                        'ticker/price': 1,
+                        'ticker/bookTicker': 1,
+                    },
                 },
                 'public': {
-                    'get': [
-                        'exchangeInfo',
-                        'ping',
-                        'time',
-                        'depth',
-                        'aggTrades',
-                        'klines',
-                        'ticker/24hr',
-                        'ticker/allPrices',
-                        'ticker/allBookTickers',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'exchangeInfo',
-                    ],
-                    'put': ['userDataStream'],
-                    'post': ['userDataStream'],
-                    'delete': ['userDataStream'],
+                    'get': {
+                        'exchangeInfo': 1,
+                        'ping': 1,
+                        'time': 1,
+                        'depth': 1,  # 5 with a limit of 500, 10 with 1000
+                        'aggTrades': 1,
+                        'klines': 1,
+                        'ticker/24hr': 1,  # 40 without a symbol
+                        'ticker/allPrices': 1,
+                        'ticker/allBookTickers': 1,
+                        'ticker/price': 1,
+                        'ticker/bookTicker': 1,
+                    },
+                    'put': {'userDataStream': 1},
+                    'post': {'userDataStream': 1},
+                    'delete': {'userDataStream': 1},
                 },
                 'private': {
-                    'get': [
-                        'order',
-                        'openOrders',
-                        'allOrders',
-                        'account',
-                        'myTrades',
-                    ],
-                    'post': [
-                        'order',
-                        'order/test',
-                    ],
-                    'delete': [
-                        'order',
-                    ],
+                    'get': {
+                        'order': 1,
+                        'openOrders': 1,  # 40 without a symbol
+                        'allOrders': 5,
+                        'account': 5,
+                        'myTrades': 5,
+                    },
+                    'post': {
+                        'order': {'weight': 1, 'orders': 1},
+                        'order/test': 1,
+                    },
+                    'delete': {
+                        'order': 1,
+                    },
                 },
             },
+            'rateLimitBuckets': {
+                'weight': {'limit': 1200, 'period': 60000, 'api': ['public', 'private', 'v1', 'v3']},
+                'orders': {'limit': 10, 'period': 1000, 'api': []},  # only the endpoints that name it
+            },
             'fees': {
                 'trading': {
                     'tierBased': False,
@@ -864,7 +884,7 @@ class binance (Exchange):
                 url += '?' + self.urlencode(params)
         return {'url': url, 'method': method, 'body': body, 'headers': headers}
 
-    def handle_errors(self, code, reason, url, method, headers, body):
+    def handle_errors(self, code, reason, url, method, headers, body, response=None):
         if (code == 418) or (code == 429):
             raise DDoSProtection(self.id + ' ' + str(code) + ' ' + reason + ' ' + body)
         # error response in a form: {"code": -1013, "msg": "Invalid quantity."}
@@ -879,7 +899,8 @@ class binance (Exchange):
                 raise InvalidOrder(self.id + ' order price exceeds allowed price precision or invalid, use self.price_to_precision(symbol, amount) ' + body)
         if len(body) > 0:
             if body[0] == '{':
-                response = json.loads(body)
+                if response is None:
+                    response = json.loads(body)
                 # check success value for wapi endpoints
                 # response in format {'msg': 'The coin does not exist.', 'success': True/false}
                 success = self.safe_value(response, 'success', True)
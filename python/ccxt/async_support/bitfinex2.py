@@ -39,6 +39,11 @@ class bitfinex2 (bitfinex):
                 'fetchTradingFees': False,
                 'withdraw': True,
             },
+            'pagination': {
+                'fetchOHLCV': {
+                    'limit': 1000,  # candles per request
+                },
+            },
             'timeframes': {
                 '1m': '1m',
                 '5m': '5m',
@@ -47,6 +47,11 @@ class cryptopia (Exchange):
                 'deposit': True,
                 'withdraw': True,
             },
+            'batch': {
+                'fetchOrderBooks': {
+                    'symbols': 5,
+                },
+            },
             'urls': {
                 'logo': 'https://user-images.githubusercontent.com/1294454/29484394-7b4ea6e2-84c6-11e7-83e5-1fccf4b2dc81.jpg',
                 'api': {
@@ -196,6 +201,9 @@ class cryptopia (Exchange):
         self.options['marketsByLabel'] = self.index_by(result, 'label')
         return result
 
+    def index_markets(self, markets):
+        self.options['marketsByLabel'] = self.index_by(markets, 'label')
+
     async def fetch_order_book(self, symbol, limit=None, params={}):
         await self.load_markets()
         response = await self.publicGetGetMarketOrdersId(self.extend({
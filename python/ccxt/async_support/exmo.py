@@ -44,6 +44,11 @@ class exmo (Exchange):
                 'fetchTickers': True,
                 'withdraw': True,
             },
+            'batch': {
+                'fetchOrderBooks': {
+                    'length': 2048,
+                },
+            },
             'urls': {
                 'logo': 'https://user-images.githubusercontent.com/1294454/27766491-1b0ea956-5eda-11e7-9225-40d67b481b8d.jpg',
                 'api': 'https://api.exmo.com',
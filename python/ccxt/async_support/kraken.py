@@ -319,6 +319,9 @@ class kraken (Exchange):
         self.marketsByAltname = self.index_by(result, 'altname')
         return result
 
+    def index_markets(self, markets):
+        self.marketsByAltname = self.index_by(markets, 'altname')
+
     def append_inactive_markets(self, result):
         # result should be an array to append to
         precision = {'amount': 8, 'price': 8}
@@ -863,7 +866,7 @@ class kraken (Exchange):
     def nonce(self):
         return self.milliseconds()
 
-    def handle_errors(self, code, reason, url, method, headers, body):
+    def handle_errors(self, code, reason, url, method, headers, body, response=None):
         if body.find('Invalid order') >= 0:
             raise InvalidOrder(self.id + ' ' + body)
         if body.find('Invalid nonce') >= 0:
@@ -875,7 +878,8 @@ class kraken (Exchange):
         if body.find('Invalid arguments:volume') >= 0:
             raise InvalidOrder(self.id + ' ' + body)
         if body[0] == '{':
-            response = json.loads(body)
+            if response is None:
+                response = json.loads(body)
             if not isinstance(response, basestring):
                 if 'error' in response:
                     numErrors = len(response['error'])
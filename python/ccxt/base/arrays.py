@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""Conversion of order books and candles to numpy arrays, numpy is imported on first use"""
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'load_numpy',
+    'bids_asks_array',
+    'aggregate_bids_asks_array',
+    'ohlcv_array',
+    'numpy_available',
+    'build_ohlcv_array',
+    'resample_ohlcv_array',
+]
+
+# -----------------------------------------------------------------------------
+
+numpy = None
+
+
+def load_numpy():
+    global numpy
+    if numpy is None:
+        try:
+            import numpy as module
+        except ImportError:
+            raise ImportError('numpy is required for the numpy output format, install it with pip install numpy')
+        numpy = module
+    return numpy
+
+
+def numpy_available():
+    try:
+        load_numpy()
+    except ImportError:
+        return False
+    return True
+
+
+def float_columns(rows, columns):
+    """Converts the columns of a list of rows to a float64 array, strings are parsed by numpy in one pass"""
+    np = load_numpy()
+    if not len(rows):
+        return np.empty((0, len(columns)), dtype=np.float64)
+    if isinstance(rows[0], (list, tuple)):
+        try:
+            array = np.array(rows, dtype=np.float64)
+            if array.ndim == 2 and array.shape[1] > max(columns):
+                return array if columns == list(range(0, array.shape[1])) else array[:, columns]
+        except (TypeError, ValueError):
+            pass  # rows of different lengths or with non-numeric columns
+    return np.array([[row[column] for column in columns] for row in rows], dtype=np.float64)
+
+
+def sort_rows(array, descending=False):
+    np = load_numpy()
+    # a stable sort keeps the order of the levels at the same price
+    order = np.argsort(-array[:, 0] if descending else array[:, 0], kind='mergesort')
+    return array[order]
+
+
+def bids_asks_array(bidasks, price_key=0, amount_key=1, descending=False):
+    """Returns a contiguous (n, 2) float64 array of price, amount sorted by price, levels with a zero or missing price or amount are dropped"""
+    np = load_numpy()
+    array = float_columns(bidasks, [price_key, amount_key])
+    array = array[(array[:, 0] != 0) & (array[:, 1] != 0) & ~np.isnan(array).any(axis=1)]
+    return sort_rows(array, descending)
+
+
+def aggregate_bids_asks_array(array, descending=False):
+    """Sums up the amounts of repeated prices of a (n, 2) array"""
+    np = load_numpy()
+    prices, inverse = np.unique(array[:, 0], return_inverse=True)
+    amounts = np.bincount(inverse.reshape(-1), weights=array[:, 1], minlength=len(prices))
+    result = np.column_stack((prices, amounts))
+    result = result[result[:, 1] > 0]
+    return result[::-1].copy() if descending else result
+
+
+def ohlcv_array(ohlcvs, since=None, limit=None):
+    """Returns a contiguous (n, 6) float64 array of candles sorted by timestamp,
+    the first limit candles not older than since are kept, like Exchange.parse_ohlcvs does"""
+    array = float_columns(ohlcvs, [0, 1, 2, 3, 4, 5])
+    if since:
+        array = array[array[:, 0] >= since]
+    if limit:
+        array = array[0:limit]
+    return sort_rows(array)
+
+
+def candle_starts(buckets):
+    """Returns the indices where a new candle opens, candles open at the first time bucket beyond the current candle,
+    so that rows that are out of order are merged into the current candle like in Exchange.build_ohlcv"""
+    np = load_numpy()
+    if not len(buckets):
+        return np.empty(0, dtype=np.intp)
+    opened = np.maximum.accumulate(buckets)
+    starts = np.empty(len(buckets), dtype=bool)
+    starts[0] = True
+    starts[1:] = buckets[1:] > opened[:-1]
+    return np.flatnonzero(starts)
+
+
+def build_ohlcv_array(timestamps, prices, amounts, ms, since=None):
+    """Groups columns of trades sorted by time into an (n, 6) float64 array of candles of ms milliseconds"""
+    np = load_numpy()
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    amounts = np.asarray(amounts, dtype=np.float64)
+    if since is not None:
+        kept = timestamps >= since
+        timestamps, prices, amounts = timestamps[kept], prices[kept], amounts[kept]
+    buckets = np.floor(timestamps / ms) * ms
+    starts = candle_starts(buckets)
+    if not len(starts):
+        return np.empty((0, 6), dtype=np.float64)
+    ends = np.append(starts[1:], len(buckets)) - 1
+    return np.column_stack((
+        buckets[starts],
+        prices[starts],
+        np.maximum.reduceat(prices, starts),
+        np.minimum.reduceat(prices, starts),
+        prices[ends],
+        np.add.reduceat(amounts, starts),
+    ))
+
+
+def resample_ohlcv_array(ohlcvs, ms):
+    """Merges an (n, 6) array of candles sorted by time into candles of ms milliseconds, missing values (nan) are skipped"""
+    np = load_numpy()
+    ohlcvs = np.asarray(ohlcvs, dtype=np.float64)
+    if not len(ohlcvs):
+        return np.empty((0, 6), dtype=np.float64)
+    buckets = np.floor(ohlcvs[:, 0] / ms) * ms
+    starts = candle_starts(buckets)
+    ends = np.append(starts[1:], len(buckets)) - 1
+    return np.column_stack((
+        buckets[starts],
+        ohlcvs[starts, 1],
+        np.fmax.reduceat(ohlcvs[:, 2], starts),
+        np.fmin.reduceat(ohlcvs[:, 3], starts),
+        ohlcvs[ends, 4],
+        np.add.reduceat(np.nan_to_num(ohlcvs[:, 5]), starts),
+    ))
@@ -10,6 +10,9 @@ __all__ = [
     'NO_PADDING',
     'PAD_WITH_ZERO',
     'decimal_to_precision',
+    'precision_formatter',
+    'cached_decimal_to_precision',
+    'decimals_to_precision',
 ]
 
 
@@ -26,41 +29,132 @@ NO_PADDING = 4
 PAD_WITH_ZERO = 5
 
 
-def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+# a context of our own instead of the global one of the thread, which is left as it is,
+# all default traps and decimal.Underflow (raised when a number is rounded to zero)
+context = decimal.Context(
+    prec=28,
+    rounding=decimal.ROUND_HALF_UP,  # rounds 0.5 away from zero
+    traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow, decimal.Underflow])
+
+TEN = decimal.Decimal('10')
+
+
+powers_of_10 = {}
+
+
+def power_of_10(x):
+    power = powers_of_10.get(x)
+    if power is None:
+        power = powers_of_10[x] = context.power(TEN, -x)
+    return power
+
+
+def check_arguments(rounding_mode, precision, counting_mode, padding_mode):
     assert precision is not None and isinstance(precision, numbers.Integral)
     assert rounding_mode in [TRUNCATE, ROUND]
     assert counting_mode in [DECIMAL_PLACES, SIGNIFICANT_DIGITS]
     assert padding_mode in [NO_PADDING, PAD_WITH_ZERO]
+    return min(context.prec - 2, precision)
 
-    context = decimal.getcontext()
 
-    precision = min(context.prec - 2, precision)
+def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    precision = check_arguments(rounding_mode, precision, counting_mode, padding_mode)
+    return to_precision(n, rounding_mode, precision, counting_mode, padding_mode)
+
+
+def precision_formatter(rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    """Returns a function of n that returns decimal_to_precision(n, rounding_mode, precision, counting_mode, padding_mode),
+    the arguments are checked once and the quantum of rounding to decimal places is computed once"""
+    precision = check_arguments(rounding_mode, precision, counting_mode, padding_mode)
+    if rounding_mode == ROUND and counting_mode == DECIMAL_PLACES:
+        quantum = power_of_10(precision)
+
+        def round_to_decimal_places(n):
+            return pad(str(decimal.Decimal(n).quantize(quantum, context=context)), precision, counting_mode, padding_mode)
 
-    # all default except decimal.Underflow (raised when a number is rounded to zero)
-    context.traps[decimal.Underflow] = True
-    context.rounding = decimal.ROUND_HALF_UP  # rounds 0.5 away from zero
+        return round_to_decimal_places
 
+    def format_to_precision(n):
+        return to_precision(n, rounding_mode, precision, counting_mode, padding_mode)
+
+    return format_to_precision
+
+
+formatters = {}
+
+
+def cached_decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    """decimal_to_precision with the formatters of the arguments compiled on the first call and reused afterwards"""
+    key = (rounding_mode, precision, counting_mode, padding_mode)
+    formatter = formatters.get(key)
+    if formatter is None:
+        formatter = formatters[key] = precision_formatter(rounding_mode, precision, counting_mode, padding_mode)
+    return formatter(n)
+
+
+def decimals_to_precision(values, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING, as_float=False):
+    """Returns decimal_to_precision(value, rounding_mode, precision, counting_mode, padding_mode) of every value of a list
+    as a list of strings, or as a list of floats with as_float. A numpy array of any shape gives an array of the same
+    shape, of strings (dtype object) or of float64 with as_float."""
+    shape = getattr(values, 'shape', None)
+    if shape is not None:
+        values = values.ravel().tolist()  # python floats, which take the fast path
+    formatter = batch_formatter(rounding_mode, precision, counting_mode, padding_mode)
+    result = [formatter(value) for value in values]
+    if as_float:
+        result = [float(value) for value in result]
+    if shape is not None:
+        import numpy
+        result = numpy.array(result, dtype=numpy.float64 if as_float else object).reshape(shape)
+    return result
+
+
+def batch_formatter(rounding_mode, precision, counting_mode, padding_mode):
+    formatter = precision_formatter(rounding_mode, precision, counting_mode, padding_mode)
+    if rounding_mode != ROUND or counting_mode != DECIMAL_PLACES or precision < 0:
+        return formatter
+    precision = min(context.prec - 2, precision)
+    # python formats floats from their exact binary value like Decimal(n).quantize does, rounding exact ties
+    # to even instead of away from zero, the ties, the numbers with too many digits for the context
+    # and those that Decimal prints in exponent notation are left to the formatter
+    template = '%.' + str(precision) + 'f'
+    largest = 10.0 ** (context.prec - 1 - precision)
+    smallest = 0.000001 if precision > 6 else -1.0  # the float 0.000001 is a bit less than 10 ** -6
+    tie_denominator = 2 ** (precision + 1)
+    scale = 2 * 10 ** precision
+
+    def round_float_to_decimal_places(n):
+        if type(n) is float and smallest < abs(n) < largest:
+            numerator, denominator = n.as_integer_ratio()
+            if denominator > tie_denominator:
+                return pad(template % n, precision, counting_mode, padding_mode)
+            doubled, remainder = divmod(numerator * scale, denominator)
+            if remainder or not (doubled % 2):
+                return pad(template % n, precision, counting_mode, padding_mode)
+        return formatter(n)
+
+    return round_float_to_decimal_places
+
+
+def to_precision(n, rounding_mode, precision, counting_mode, padding_mode):
     dec = decimal.Decimal(n)
     string = str(dec)
     precise = None
 
-    def power_of_10(x):
-        return decimal.Decimal('10') ** (-x)
-
     if rounding_mode == ROUND:
         if counting_mode == DECIMAL_PLACES:
-            precise = str(dec.quantize(power_of_10(precision)))  # ROUND_HALF_EVEN is default context
+            precise = str(dec.quantize(power_of_10(precision), context=context))
         elif counting_mode == SIGNIFICANT_DIGITS:
             q = precision - dec.adjusted() - 1
             sigfig = power_of_10(q)
             if q < 0:
                 string_to_precision = string[:precision]
                 # string_to_precision is '' when we have zero precision
-                below = sigfig * decimal.Decimal(string_to_precision if string_to_precision else '0')
-                above = below + sigfig
-                precise = str(min((below, above), key=lambda x: abs(x - dec)))
+                below = context.multiply(sigfig, decimal.Decimal(string_to_precision if string_to_precision else '0'))
+                above = context.add(below, sigfig)
+                precise = str(min((below, above), key=lambda x: context.abs(context.subtract(x, dec))))
             else:
-                precise = str(dec.quantize(sigfig))
+                precise = str(dec.quantize(sigfig, context=context))
 
     elif rounding_mode == TRUNCATE:
         # Slice a string
@@ -82,6 +176,10 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
                 precise = string[:end].ljust(dot, '0')
         precise = precise.rstrip('.')
 
+    return pad(precise, precision, counting_mode, padding_mode)
+
+
+def pad(precise, precision, counting_mode, padding_mode):
     if padding_mode == NO_PADDING:
         return precise.rstrip('0').rstrip('.') if '.' in precise else precise
     elif padding_mode == PAD_WITH_ZERO:
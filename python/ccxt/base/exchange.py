@@ -18,8 +18,39 @@ from ccxt.base.errors import InvalidAddress
 
 # -----------------------------------------------------------------------------
 
-from ccxt.base.decimal_to_precision import decimal_to_precision
+from ccxt.base.decimal_to_precision import cached_decimal_to_precision
+from ccxt.base.decimal_to_precision import precision_formatter as decimal_precision_formatter
+from ccxt.base.decimal_to_precision import TRUNCATE
+from ccxt.base.decimal_to_precision import ROUND
 from ccxt.base.decimal_to_precision import DECIMAL_PLACES
+from ccxt.base.decimal_to_precision import SIGNIFICANT_DIGITS
+
+# -----------------------------------------------------------------------------
+
+from ccxt.base.json_backend import get_json_backend
+from ccxt.base.throttle import TokenBucket
+from ccxt.base.throttle import shared_token_bucket
+from ccxt.base.session import create_session
+from ccxt.base.session import shared_session
+from ccxt.base.market_cache import MarketCache
+from ccxt.base.market import Record
+from ccxt.base.market import Market
+from ccxt.base.market import Currency
+from ccxt.base.records import lean_parser
+from ccxt.base.records import lean_iso8601
+from ccxt.base.market_registry import MarketSet
+from ccxt.base.order_book import OrderBook
+from ccxt.base.pagination import Paginator
+from ccxt.base.timestamps import iso8601
+from ccxt.base.timestamps import parse8601
+from ccxt.base.arrays import aggregate_bids_asks_array
+from ccxt.base.arrays import bids_asks_array
+from ccxt.base.arrays import ohlcv_array
+from ccxt.base.arrays import numpy_available
+from ccxt.base.arrays import build_ohlcv_array
+from ccxt.base.arrays import resample_ohlcv_array
+from ccxt.base.market_registry import get_market_set
+from ccxt.base.market_registry import register_market_set
 
 # -----------------------------------------------------------------------------
 
@@ -34,24 +65,27 @@ import logging
 import base64
 import calendar
 import collections
+import copy
 import datetime
 from email.utils import parsedate
 import functools
 import gzip
 import hashlib
 import hmac
+import inspect
 import io
 import json
 import math
 from numbers import Number
 import re
-from requests import Session
+import threading
 from requests.utils import default_user_agent
 from requests.exceptions import HTTPError, Timeout, TooManyRedirects, RequestException
 # import socket
 from ssl import SSLError
 # import sys
 import time
+import types
 import uuid
 import zlib
 from decimal import Decimal
@@ -71,14 +105,41 @@ except ImportError:
     import urllib as _urlencode          # Python 2
 
 # -----------------------------------------------------------------------------
-# web3/0x imports
+# web3/0x imports are deferred until the first call to an ethereum method
 
-try:
-    # from web3.auto import w3
-    from web3 import Web3, HTTPProvider
-    from web3.utils.encoding import hex_encode_abi_type
-except ImportError:
-    Web3 = HTTPProvider = None  # web3/0x not supported in Python 2
+Web3 = HTTPProvider = hex_encode_abi_type = None
+web3_import_attempted = False  # a failed import is not retried on every call
+
+
+def load_web3():
+    global Web3, HTTPProvider, hex_encode_abi_type, web3_import_attempted
+    if not web3_import_attempted:
+        try:
+            # from web3.auto import w3
+            from web3 import Web3, HTTPProvider
+            from web3.utils.encoding import hex_encode_abi_type
+        except ImportError:
+            Web3 = HTTPProvider = hex_encode_abi_type = None  # web3/0x not supported in Python 2
+        web3_import_attempted = True
+    return Web3
+
+# -----------------------------------------------------------------------------
+
+
+class instance_or_class_method(object):
+    """Binds a method to the instance when called on an instance and to the class when called on the class"""
+
+    def __init__(self, function):
+        self.function = function
+
+    def __get__(self, instance, owner):
+        return types.MethodType(self.function, owner if instance is None else instance)
+
+
+# -----------------------------------------------------------------------------
+# the per-class setup in Exchange.__init__ is done by one thread at a time
+
+class_setup_lock = threading.RLock()
 
 # -----------------------------------------------------------------------------
 
@@ -91,11 +152,24 @@ class Exchange(object):
 
     # rate limiter settings
     enableRateLimit = False
+    shareRateLimiter = False  # share the rate limiters with other instances of this exchange with the same apiKey
+    rateLimiter = None
     rateLimit = 2000  # milliseconds = seconds * 1000
+    rateLimitBuckets = None  # named buckets like {'orders': {'limit': 10, 'period': 10000, 'api': ['private']}}
+    rateLimiters = None  # a rate limiter per bucket
+    rateLimiterRateLimit = None  # the rateLimit the rate limiters were configured with
+    apiCosts = None  # request costs from the api definition by (api, method, path)
     timeout = 10000   # milliseconds = seconds * 1000
     asyncio_loop = None
     aiohttp_proxy = None
     session = None  # Session () by default
+    shareSession = False  # use one Session for all instances of this exchange, for polling from many threads
+    sessionPoolConnections = 10  # number of hosts to keep connection pools for
+    sessionPoolMaxSize = 10  # number of connections to keep alive per host, set it to the number of threads
+    sessionPoolBlock = False  # wait for a connection from the pool instead of opening one that is not kept
+    sessionMaxRetries = 0  # retries of failed connections, requests that reached the exchange are never retried
+    keepAlive = True
+    clearCookies = True  # clear the cookies of the session before every request, a shared session stores none instead
     logger = None  # logging.getLogger(__name__) by default
     userAgent = None
     userAgents = {
@@ -104,6 +178,26 @@ class Exchange(object):
     }
     verbose = False
     markets = None
+    precisionFormatters = None  # the formatters of the market precisions by ('price' or 'amount', precision, precisionMode)
+    marketsCacheDirectory = None  # a directory to keep the loaded markets in between restarts, disabled by default
+    marketsCacheTTL = 3600000  # milliseconds
+    marketsCacheBackgroundRefresh = True  # use expired markets from the cache while loading fresh ones
+    shareMarkets = False  # share the loaded markets with the other instances of this exchange, they must not be modified
+    orderBookFormat = 'list'  # parse_order_book returns lists of bids and asks, an OrderBook with 'object', (n, 2) arrays with 'numpy'
+    ohlcvFormat = 'list'  # parse_ohlcvs returns a list of candles, or an (n, 6) array with 'numpy'
+    pagination = {}  # page sizes and cursors of paginated methods, like {'fetchOHLCV': {'limit': 1000}}, see Paginator
+    batch = {}  # symbol limits of batch methods, like {'fetchOrderBooks': {'symbols': 5, 'length': 2048}}, see batch_chunks
+    batchFallbacks = {
+        'fetchOrderBooks': 'fetch_order_book',
+        'fetchTickers': 'fetch_ticker',
+    }
+    numpyThreshold = 10000  # build_ohlcv uses numpy, if installed, from this many trades on
+    # store markets and currencies as slot-based Market and Currency records, the equal precision and limits dicts
+    # of the records are one and the same dict, replace market['precision'] instead of changing it in place
+    compactMarkets = False
+    marketsInfo = 'keep'  # the raw info of compact markets: 'keep', 'lazy' (kept as a json string) or 'drop'
+    leanRecords = False  # parse_trade, parse_order and parse_ticker return dicts with the datetime formatted when used
+    recordsInfo = 'keep'  # the raw info of lean records: 'keep' (by reference), 'lazy' (kept as a json string) or 'drop'
     symbols = None
     fees = {
         'trading': {
@@ -120,6 +214,7 @@ class Exchange(object):
     tickers = None
     api = None
     parseJsonResponse = True
+    jsonBackend = 'json'  # 'json' (stdlib), 'orjson', 'rapidjson', 'ujson' or 'auto' for the fastest one installed but orjson
     proxy = ''
     origin = '*'  # CORS origin
     proxies = None
@@ -197,17 +292,20 @@ class Exchange(object):
     precisionMode = DECIMAL_PLACES
     minFundingAddressLength = 1  # used in check_address
     substituteCommonCurrencyCodes = True
-    lastRestRequestTimestamp = 0
+    lastRestRequestTimestamp = 0  # the time of the last request in milliseconds, the throttle uses the token buckets
     lastRestPollTimestamp = 0
     restRequestQueue = None
     restPollerLoopIsRunning = False
     rateLimitTokens = 16
     rateLimitMaxTokens = 16
     rateLimitUpdateTime = 0
-    last_http_response = None
+    last_http_content = None  # the raw bytes of the last response, decoded by parse_json()
+    last_http_text = None  # the text of the last response, see last_http_response
+    last_http_decoder = None  # decodes last_http_content to last_http_text when the text is first read
     last_json_response = None
     last_response_headers = None
-    web3 = None
+    _web3 = None  # created upon first access to self.web3
+    _shared_web3 = None  # the default Web3 instance shared by all exchanges
 
     commonCurrencies = {
         'XBT': 'BTC',
@@ -229,7 +327,7 @@ class Exchange(object):
         self.currencies = dict() if self.currencies is None else self.currencies
         self.options = dict() if self.options is None else self.options  # Python does not allow to define properties in run-time with setattr
 
-        self.decimalToPrecision = self.decimal_to_precision = decimal_to_precision
+        self.decimalToPrecision = self.decimal_to_precision = cached_decimal_to_precision
 
         # version = '.'.join(map(str, sys.version_info[:3]))
         # self.userAgent = {
@@ -238,7 +336,23 @@ class Exchange(object):
 
         self.userAgent = default_user_agent()
 
-        settings = self.deep_extend(self.describe(), config)
+        cls = type(self)
+        if 'describe_cache' not in cls.__dict__:
+            with class_setup_lock:
+                if 'describe_cache' not in cls.__dict__:
+                    # the describe() result, the implicit api methods and camelcase aliases are built once per exchange
+                    # class, describe_cache is assigned last as other threads skip the setup as soon as it is there
+                    describe = self.describe()
+                    if describe.get('api'):
+                        cls.define_rest_api_on_class(describe['api'], 'request')
+                    cls.define_camelcase_aliases_on_class()
+                    cls.handle_errors_takes_response = cls.accepts_argument(cls.handle_errors, 'response')
+                    cls.handles_errors = cls.overrides('handle_errors')
+                    cls.parse_json_takes_text = cls.overrides('parse_json')
+                    cls.describe_cache = describe
+
+        # every instance gets its own copy of the lists and dicts of the cached describe() result
+        settings = self.deep_extend(copy.deepcopy(cls.describe_cache), config)
 
         for key in settings:
             if hasattr(self, key) and isinstance(getattr(self, key), dict):
@@ -246,17 +360,16 @@ class Exchange(object):
             else:
                 setattr(self, key, settings[key])
 
-        if self.api:
+        if self.api and ('api' in config):
             self.define_rest_api(self.api, 'request')
 
         if self.markets:
             self.set_markets(self.markets)
 
-        # convert all properties from underscore notation foo_bar to camelcase notation fooBar
-        for name in dir(self):
-            if name[0] != '_'and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                camelcase = parts[0] + ''.join(self.capitalize(i) for i in parts[1:])
+        # convert instance properties from underscore notation foo_bar to camelcase notation fooBar
+        for name in list(self.__dict__.keys()):
+            camelcase = self.underscore_to_camelcase(name)
+            if camelcase:
                 setattr(self, camelcase, getattr(self, name))
 
         self.tokenBucket = self.extend({
@@ -265,26 +378,57 @@ class Exchange(object):
             'capacity': 1.0,
             'defaultCost': 1.0,
         }, getattr(self, 'tokenBucket') if hasattr(self, 'tokenBucket') else {})
+        self.init_rest_rate_limiter()
 
-        self.session = self.session if self.session else Session()
+        self.session = self.session if self.session else self.create_session()
         self.logger = self.logger if self.logger else logging.getLogger(__name__)
 
-        if Web3 and not self.web3:
-            # self.web3 = w3 if w3 else Web3(HTTPProvider())
-            self.web3 = Web3(HTTPProvider())
+        if self.leanRecords:
+            self.use_lean_records()
+
+    def use_lean_records(self):
+        """Makes parse_trade, parse_order and parse_ticker of this instance return dicts with a LazyDatetime, which is
+        formatted when used as a string, and the raw info as set by recordsInfo. Use Exchange.json to encode them"""
+        for name in ['parse_trade', 'parse_order', 'parse_ticker']:
+            method = getattr(type(self), name, None)  # not an instance attribute, so that it is never wrapped twice
+            if method is None:
+                continue
+            parse = lean_parser(method, self, self.recordsInfo)
+            setattr(self, name, parse)
+            setattr(self, self.underscore_to_camelcase(name), parse)
+        self.iso8601 = lean_iso8601
 
     def __del__(self):
-        if self.session:
+        if self.session and not self.shareSession:
             self.session.close()
 
+    def create_session(self):
+        options = {
+            'pool_connections': self.sessionPoolConnections,
+            'pool_maxsize': self.sessionPoolMaxSize,
+            'pool_block': self.sessionPoolBlock,
+            'keep_alive': self.keepAlive,
+            'max_retries': self.sessionMaxRetries,
+        }
+        if self.shareSession:
+            # the first instance of this exchange determines the pool settings, the shared session
+            # stores no cookies, so that no cookies pass from one instance to another
+            return shared_session(self.id, keep_cookies=False, **options)
+        return create_session(**options)
+
     def describe(self):
         return {}
 
-    def define_rest_api(self, api, method_name, options={}):
+    @staticmethod
+    def rest_api_endpoints(api, options={}):
+        # urls are either a list of paths or a dict of paths to their costs,
+        # a cost is a number or a dict of costs by rate limit bucket name
         delimiters = re.compile('[^a-zA-Z0-9]')
+        endpoints = []
         for api_type, methods in api.items():
             for http_method, urls in methods.items():
                 for url in urls:
+                    cost = urls[url] if isinstance(urls, dict) else None
                     url = url.strip()
                     split_path = delimiters.split(url)
 
@@ -304,9 +448,60 @@ class Exchange(object):
                         if 'underscore' in options['suffixes']:
                             underscore += options['suffixes']['underscore']
 
-                    partial = functools.partial(getattr(self, method_name), url, api_type, uppercase_method)
-                    setattr(self, camelcase, partial)
-                    setattr(self, underscore, partial)
+                    endpoints.append((camelcase, underscore, url, api_type, uppercase_method, cost))
+        return endpoints
+
+    def define_rest_api(self, api, method_name, options={}):
+        self.apiCosts = {}
+        for camelcase, underscore, url, api_type, uppercase_method, cost in self.rest_api_endpoints(api, options):
+            partial = functools.partial(getattr(self, method_name), url, api_type, uppercase_method)
+            setattr(self, camelcase, partial)
+            setattr(self, underscore, partial)
+            if cost is not None:
+                self.apiCosts[(api_type, uppercase_method, url)] = cost
+
+    @classmethod
+    def define_rest_api_on_class(cls, api, method_name, options={}):
+        """Same as define_rest_api, but installs regular methods on the class instead of partials on the instance"""
+        cls.apiCosts = {}
+        for camelcase, underscore, url, api_type, uppercase_method, cost in cls.rest_api_endpoints(api, options):
+            method = cls.implicit_api_method(method_name, url, api_type, uppercase_method)
+            setattr(cls, camelcase, method)
+            setattr(cls, underscore, method)
+            if cost is not None:
+                cls.apiCosts[(api_type, uppercase_method, url)] = cost
+
+    @staticmethod
+    def implicit_api_method(method_name, path, api_type, http_method):
+        def implicit_api_method(self, *args, **kwargs):
+            return getattr(self, method_name)(path, api_type, http_method, *args, **kwargs)
+        return implicit_api_method
+
+    @staticmethod
+    def underscore_to_camelcase(name):
+        if name[0] != '_' and name[-1] != '_' and '_' in name:
+            parts = name.split('_')
+            return parts[0] + ''.join(Exchange.capitalize(i) for i in parts[1:])
+        return None
+
+    @classmethod
+    def define_camelcase_aliases_on_class(cls):
+        # convert all class properties from underscore notation foo_bar to camelcase notation fooBar
+        for name in dir(cls):
+            camelcase = cls.underscore_to_camelcase(name)
+            if camelcase:
+                # take the raw attribute from the mro to keep staticmethods and classmethods intact
+                value = next(klass.__dict__[name] for klass in cls.__mro__ if name in klass.__dict__)
+                setattr(cls, camelcase, value)
+        # the base classes get the aliases of their own methods too, for the generated code that calls
+        # super(exchange, self).parseJson() and alike
+        for klass in cls.__mro__[1:]:
+            if issubclass(klass, Exchange) and '_camelcase_aliases' not in klass.__dict__:
+                for name in list(klass.__dict__.keys()):
+                    camelcase = klass.underscore_to_camelcase(name)
+                    if camelcase and camelcase not in klass.__dict__:
+                        setattr(klass, camelcase, klass.__dict__[name])
+                klass._camelcase_aliases = True
 
     def raise_error(self, exception_type, url=None, method=None, error=None, details=None):
         if error:
@@ -314,17 +509,84 @@ class Exchange(object):
         output = ' '.join([self.id] + [var for var in (url, method, error, details) if var is not None])
         raise exception_type(output)
 
-    def throttle(self):
-        now = float(self.milliseconds())
-        elapsed = now - self.lastRestRequestTimestamp
-        if elapsed < self.rateLimit:
-            delay = self.rateLimit - elapsed
-            time.sleep(delay / 1000.0)
+    def init_rest_rate_limiter(self):
+        self.check_rate_limit_costs()
+        self.rateLimiterRateLimit = self.rateLimit
+        self.rateLimiter = self.create_token_bucket(None, self.tokenBucket)
+        self.rateLimiters = {}
+        for name, bucket in (self.rateLimitBuckets or {}).items():
+            self.rateLimiters[name] = self.create_token_bucket(name, self.rate_limit_bucket_config(bucket))
+
+    def check_rate_limit_costs(self):
+        """Raises an ExchangeError if a cost of the api definition names a bucket that is not in rateLimitBuckets"""
+        if not self.rateLimitBuckets or not self.apiCosts:
+            return
+        for (api, method, path), cost in self.apiCosts.items():
+            if isinstance(cost, dict):
+                for name in cost:
+                    if name not in self.rateLimitBuckets:
+                        self.raise_error(ExchangeError, details='the cost of ' + method + ' ' + str(api) + '/' + path + ' names the unknown rate limit bucket ' + str(name))
+
+    def rate_limit_bucket(self, name):
+        if name not in self.rateLimiters:
+            self.raise_error(ExchangeError, details='unknown rate limit bucket ' + str(name) + ', declare it in rateLimitBuckets')
+        return self.rateLimiters[name]
+
+    def create_token_bucket(self, name, config):
+        if self.shareRateLimiter:
+            # the first instance for this exchange and apiKey determines the configuration
+            return shared_token_bucket((self.id, self.apiKey, name), config)
+        return TokenBucket(config)
+
+    def rate_limit_bucket_config(self, bucket):
+        # {'limit': 1200, 'period': 60000} stands for 1200 units of cost per minute
+        config = self.extend(self.tokenBucket, {'numTokens': 0})
+        if 'limit' in bucket:
+            config['capacity'] = float(bucket['limit'])
+            config['refillRate'] = float(bucket['limit']) / bucket.get('period', 1000)
+        return self.extend(config, self.omit(bucket, ['limit', 'period', 'api']))
+
+    def request_cost(self, path, api='public', method='GET'):
+        """Returns the cost of a request from the api definition, a dict of costs by bucket name if the exchange declares rateLimitBuckets
+        that apply to the api, the requests no bucket applies to are charged to the default rateLimit bucket"""
+        cost = None
+        if self.apiCosts and isinstance(api, basestring):
+            cost = self.apiCosts.get((api, method.upper(), path))
+        if not self.rateLimitBuckets:
+            return None if isinstance(cost, dict) else cost
+        if isinstance(cost, dict):
+            return cost
+        costs = {}
+        for name, bucket in self.rateLimitBuckets.items():
+            # numeric costs are consumed from every bucket that applies to this api
+            if ('api' not in bucket) or (api in bucket['api']):
+                costs[name] = cost
+        return costs if costs else cost
+
+    def update_rate_limiter(self):
+        # rateLimit was set after the instance was created, the buckets take the refill rate of the new rateLimit
+        # in place, as shared buckets are used by other instances too
+        self.rateLimiterRateLimit = self.rateLimit
+        self.tokenBucket = self.extend(self.tokenBucket, {'refillRate': 1.0 / self.rateLimit})
+        self.rateLimiter.configure({'refillRate': self.tokenBucket['refillRate']})
+        for name, bucket in (self.rateLimitBuckets or {}).items():
+            self.rateLimiters[name].configure({'refillRate': self.rate_limit_bucket_config(bucket)['refillRate']})
+
+    def throttle(self, cost=None):
+        if self.rateLimit != self.rateLimiterRateLimit:
+            self.update_rate_limiter()
+        if isinstance(cost, dict):
+            delays = [self.rate_limit_bucket(name).reserve(value) for name, value in cost.items()]
+            delay = max(delays) if delays else 0
+            if delay > 0:
+                time.sleep(delay)
+            return
+        self.rateLimiter.throttle(cost)
 
     def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None):
         """A better wrapper over request for deferred signing"""
         if self.enableRateLimit:
-            self.throttle()
+            self.throttle(self.request_cost(path, api, method))
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         return self.fetch(request['url'], request['method'], request['headers'], request['body'])
@@ -342,9 +604,21 @@ class Exchange(object):
                 return gzip.GzipFile('', 'rb', 9, io.BytesIO(text)).read()
         return text
 
-    def handle_errors(self, code, reason, url, method, headers, body):
+    def handle_errors(self, code, reason, url, method, headers, body, response=None):
         pass
 
+    def call_handle_errors(self, code, reason, url, method, headers, body, response=None):
+        # handle_errors() overrides that do not take the decoded response still get the raw body only
+        if self.handle_errors_takes_response:
+            return self.handle_errors(code, reason, url, method, headers, body, response)
+        return self.handle_errors(code, reason, url, method, headers, body)
+
+    @staticmethod
+    def accepts_argument(method, name):
+        getargspec = getattr(inspect, 'getfullargspec', None) or inspect.getargspec  # Python 2
+        spec = getargspec(method)
+        return (name in spec.args) or (spec.varargs is not None)
+
     def prepare_request_headers(self, headers=None):
         headers = headers or {}
         headers.update(self.headers)
@@ -371,9 +645,12 @@ class Exchange(object):
         if body:
             body = body.encode()
 
-        self.session.cookies.clear()
+        if self.clearCookies and not self.shareSession:
+            # clearing the cookies of a shared session would clear them in the middle of the requests of other threads
+            self.session.cookies.clear()
 
         response = None
+        json_response = None
         try:
             response = self.session.request(
                 method,
@@ -383,11 +660,19 @@ class Exchange(object):
                 timeout=int(self.timeout / 1000),
                 proxies=self.proxies
             )
-            self.last_http_response = response.text
-            self.last_response_headers = response.headers
+            # the response is read from locals, the last_http_* attributes only mirror it, as other threads
+            # may be using the same instance
+            text = self.response_text(lambda: response.text)
+            self.record_response_content(response.content, text)
+            self.record_response_headers(response.headers)
             if self.verbose:
-                print("\nResponse:", method, url, str(response.status_code), str(response.headers), self.last_http_response)
-            self.logger.debug("%s %s, Response: %s %s %s", method, url, response.status_code, response.headers, self.last_http_response)
+                print("\nResponse:", method, url, str(response.status_code), str(response.headers), text())
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("%s %s, Response: %s %s %s", method, url, response.status_code, response.headers, text())
+            if self.parseJsonResponse:
+                # the raw bytes are decoded as they are, the exchanges that override parse_json get the text
+                response_body = text() if self.parse_json_takes_text else response.content
+                json_response = self.parse_json(response, response_body, url, method)
             response.raise_for_status()
 
         except Timeout as e:
@@ -400,15 +685,50 @@ class Exchange(object):
             self.raise_error(ExchangeError, url, method, e)
 
         except HTTPError as e:
-            self.handle_errors(response.status_code, response.reason, url, method, self.last_response_headers, self.last_http_response)
-            self.handle_rest_errors(e, response.status_code, self.last_http_response, url, method)
-            self.raise_error(ExchangeError, url, method, e, self.last_http_response)
+            self.call_handle_errors(response.status_code, response.reason, url, method, response.headers, text(), json_response)
+            self.handle_rest_errors(e, response.status_code, text(), url, method)
+            self.raise_error(ExchangeError, url, method, e, text())
 
         except RequestException as e:  # base exception class
             self.raise_error(ExchangeError, url, method, e)
 
-        self.handle_errors(response.status_code, response.reason, url, method, None, self.last_http_response)
-        return self.handle_rest_response(self.last_http_response, url, method, headers, body)
+        if self.handles_errors:
+            self.call_handle_errors(response.status_code, response.reason, url, method, None, text(), json_response)
+        # the text is needed when the response is not decoded as json only
+        return self.handle_rest_response(text() if json_response is None else None, url, method, headers, body, json_response)
+
+    @staticmethod
+    def response_text(decode):
+        """Returns a function that returns the text of a response, decoded the first time it is called"""
+        texts = []
+
+        def text():
+            if not texts:
+                texts.append(decode())
+            return texts[0]
+
+        return text
+
+    def record_response_content(self, content, decode):
+        self.last_http_content = content
+        self.last_http_text = None
+        self.last_http_decoder = decode
+
+    @property
+    def last_http_response(self):
+        """The text of the last response, decoded from its raw bytes the first time it is read"""
+        if self.last_http_decoder is not None:
+            self.last_http_text = self.last_http_decoder()
+            self.last_http_decoder = None
+        return self.last_http_text
+
+    @last_http_response.setter
+    def last_http_response(self, text):
+        self.last_http_text = text
+        self.last_http_decoder = None
+
+    def record_response_headers(self, headers):
+        self.last_response_headers = headers
 
     def handle_rest_errors(self, exception, http_status_code, response, url, method='GET'):
         error = None
@@ -432,10 +752,24 @@ class Exchange(object):
         if error:
             self.raise_error(error, url, method, exception if exception else http_status_code, response)
 
-    def handle_rest_response(self, response, url, method='GET', headers=None, body=None):
+    def parse_json(self, http_response, response_body, url, method):
+        """Decodes a JSON object or array once per response, returns None for anything else.
+        The response body is the raw bytes of the response, or its text for the exchanges that override parse_json"""
+        try:
+            if self.is_json_encoded_object(response_body):
+                loads, dumps = get_json_backend(self.jsonBackend)
+                return loads(response_body)
+        except ValueError:  # superclass of JsonDecodeError (python2)
+            pass
+        return None
+
+    def handle_rest_response(self, response, url, method='GET', headers=None, body=None, json_response=None):
         try:
             if self.parseJsonResponse:
-                last_json_response = json.loads(response) if len(response) > 1 else None
+                if json_response is not None:
+                    last_json_response = json_response
+                else:
+                    last_json_response = json.loads(response) if len(response) > 1 else None
                 self.last_json_response = last_json_response
                 return last_json_response
             else:
@@ -554,7 +888,7 @@ class Exchange(object):
     def deep_extend(*args):
         result = None
         for arg in args:
-            if isinstance(arg, dict):
+            if isinstance(arg, (dict, Record)):
                 if not isinstance(result, dict):
                     result = {}
                 for key in arg:
@@ -721,18 +1055,7 @@ class Exchange(object):
 
     @staticmethod
     def iso8601(timestamp=None):
-        if timestamp is None:
-            return timestamp
-        if not isinstance(timestamp, int):
-            return None
-        if int(timestamp) < 0:
-            return None
-
-        try:
-            utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
-            return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
-        except (TypeError, OverflowError, OSError):
-            return None
+        return iso8601(timestamp)
 
     @staticmethod
     def dmy(timestamp, infix='-'):
@@ -767,35 +1090,7 @@ class Exchange(object):
 
     @staticmethod
     def parse8601(timestamp=None):
-        if timestamp is None:
-            return timestamp
-        yyyy = '([0-9]{4})-?'
-        mm = '([0-9]{2})-?'
-        dd = '([0-9]{2})(?:T|[\\s])?'
-        h = '([0-9]{2}):?'
-        m = '([0-9]{2}):?'
-        s = '([0-9]{2})'
-        ms = '(\\.[0-9]{1,3})?'
-        tz = '(?:(\\+|\\-)([0-9]{2})\\:?([0-9]{2})|Z)?'
-        regex = r'' + yyyy + mm + dd + h + m + s + ms + tz
-        try:
-            match = re.search(regex, timestamp, re.IGNORECASE)
-            if match is None:
-                return None
-            yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
-            ms = ms or '.000'
-            msint = int(ms[1:])
-            sign = sign or ''
-            sign = int(sign + '1')
-            hours = int(hours or 0) * sign
-            minutes = int(minutes or 0) * sign
-            offset = datetime.timedelta(hours=hours, minutes=minutes)
-            string = yyyy + mm + dd + h + m + s + ms + 'Z'
-            dt = datetime.datetime.strptime(string, "%Y%m%d%H%M%S.%fZ")
-            dt = dt + offset
-            return calendar.timegm(dt.utctimetuple()) * 1000 + msint
-        except (TypeError, OverflowError, OSError, ValueError):
-            return None
+        return parse8601(timestamp)
 
     @staticmethod
     def hash(request, algorithm='md5', digest='hex'):
@@ -843,19 +1138,22 @@ class Exchange(object):
         signature = Exchange.base64urlencode(hmac)
         return token + '.' + signature
 
-    @staticmethod
-    def unjson(input):
-        return json.loads(input)
+    @instance_or_class_method
+    def unjson(self, input):
+        # the jsonBackend of the instance, or of the class when called as Exchange.unjson()
+        loads, dumps = get_json_backend(self.jsonBackend)
+        return loads(input)
 
-    @staticmethod
-    def json(data, params=None):
-        return json.dumps(data, separators=(',', ':'))
+    @instance_or_class_method
+    def json(self, data, params=None):
+        loads, dumps = get_json_backend(self.jsonBackend)
+        return dumps(data)
 
     @staticmethod
     def is_json_encoded_object(input):
-        return (isinstance(input, basestring) and
+        return (isinstance(input, (basestring, bytes)) and
                 (len(input) >= 2) and
-                ((input[0] == '{') or (input[0] == '[')))
+                (input[0:1] in ('{', '[', b'{', b'[')))
 
     @staticmethod
     def encode(string):
@@ -908,12 +1206,12 @@ class Exchange(object):
         return self.safe_string(currencyIds, commonCode, commonCode)
 
     def fromWei(self, amount, unit='ether'):
-        if Web3 is None:
+        if load_web3() is None:
             self.raise_error(NotSupported, details="ethereum web3 methods require Python 3: https://pythonclock.org")
         return float(Web3.fromWei(int(amount), unit))
 
     def toWei(self, amount, unit='ether'):
-        if Web3 is None:
+        if load_web3() is None:
             self.raise_error(NotSupported, details="ethereum web3 methods require Python 3: https://pythonclock.org")
         return str(Web3.toWei(int(amount), unit))
 
@@ -921,22 +1219,54 @@ class Exchange(object):
         parts = re.sub(r'0+$', '', string).split('.')
         return len(parts[1]) if len(parts) > 1 else 0
 
+    @staticmethod
+    def truncator(precision=0):
+        """Returns a function of num equal to truncate(num, precision)"""
+        if precision > 0:
+            decimal_precision = math.pow(10, precision)
+            return lambda num: math.trunc(num * decimal_precision) / decimal_precision
+        return lambda num: int(Exchange.truncate_to_string(num, precision))
+
+    def precision_formatter(self, key, precision):
+        """Returns the formatter of a 'price' or 'amount' precision, compiled once per precision value and precisionMode"""
+        if self.precisionFormatters is None:
+            self.precisionFormatters = {}
+        formatter = self.precisionFormatters.get((key, precision, self.precisionMode))
+        if formatter is None:
+            if self.precisionMode == SIGNIFICANT_DIGITS:
+                if key == 'amount':
+                    amount_formatter = decimal_precision_formatter(TRUNCATE, precision, SIGNIFICANT_DIGITS)
+                    formatter = lambda num: float(amount_formatter(num))  # noqa: E731
+                else:
+                    formatter = decimal_precision_formatter(ROUND, precision, SIGNIFICANT_DIGITS)
+            elif key == 'amount':
+                formatter = self.truncator(precision)
+            else:
+                formatter = ('{:.' + str(precision) + 'f}').format
+            self.precisionFormatters[(key, precision, self.precisionMode)] = formatter
+        return formatter
+
+    # the formatters are looked up by the precision of the market on every call, a market changed in place
+    # is formatted with its new precision
+
     def cost_to_precision(self, symbol, cost):
-        return ('{:.' + str(self.markets[symbol]['precision']['price']) + 'f}').format(float(cost))
+        return self.precision_formatter('price', self.markets[symbol]['precision']['price'])(float(cost))
 
     def price_to_precision(self, symbol, price):
-        return ('{:.' + str(self.markets[symbol]['precision']['price']) + 'f}').format(float(price))
+        return self.precision_formatter('price', self.markets[symbol]['precision']['price'])(float(price))
 
     def amount_to_precision(self, symbol, amount):
-        return self.truncate(amount, self.markets[symbol]['precision']['amount'])
+        return self.precision_formatter('amount', self.markets[symbol]['precision']['amount'])(amount)
 
     def amount_to_string(self, symbol, amount):
         return self.truncate_to_string(amount, self.markets[symbol]['precision']['amount'])
 
     def fee_to_precision(self, symbol, fee):
-        return ('{:.' + str(self.markets[symbol]['precision']['price']) + 'f}').format(float(fee))
+        return self.precision_formatter('price', self.markets[symbol]['precision']['price'])(float(fee))
 
     def set_markets(self, markets, currencies=None):
+        # the tables are built apart and swapped in at once, as a background refresh of the markets
+        # runs while other threads read them
         values = list(markets.values()) if type(markets) is dict else markets
         for i in range(0, len(values)):
             values[i] = self.extend(
@@ -944,13 +1274,13 @@ class Exchange(object):
                 {'precision': self.precision, 'limits': self.limits},
                 values[i]
             )
-        self.markets = self.index_by(values, 'symbol')
-        self.markets_by_id = self.index_by(values, 'id')
-        self.marketsById = self.markets_by_id
-        self.symbols = sorted(list(self.markets.keys()))
-        self.ids = sorted(list(self.markets_by_id.keys()))
+        if self.compactMarkets:
+            shared = {}  # equal precision and limits dicts are stored once
+            values = [Market(value, self.marketsInfo, shared) for value in values]
+        markets = self.index_by(values, 'symbol')
+        markets_by_id = self.index_by(values, 'id')
         if currencies:
-            self.currencies = self.deep_extend(currencies, self.currencies)
+            currencies = self.deep_extend(currencies, self.currencies)
         else:
             base_currencies = [{
                 'id': market['baseId'] if 'baseId' in market else market['base'],
@@ -973,20 +1303,96 @@ class Exchange(object):
                 ) if 'precision' in market else 8,
             } for market in values if 'quote' in market]
             currencies = self.sort_by(base_currencies + quote_currencies, 'code')
-            self.currencies = self.deep_extend(self.index_by(currencies, 'code'), self.currencies)
-        self.currencies_by_id = self.index_by(list(self.currencies.values()), 'id')
+            currencies = self.deep_extend(self.index_by(currencies, 'code'), self.currencies)
+        if self.compactMarkets:
+            for code, currency in currencies.items():
+                currencies[code] = Currency(currency, self.marketsInfo, shared)
+        market_set = MarketSet(markets, markets_by_id, sorted(list(markets.keys())), sorted(list(markets_by_id.keys())),
+                               currencies, self.index_by(list(currencies.values()), 'id'))
+        self.attach_markets(market_set)
+        if self.shareMarkets:
+            register_market_set(self.markets_cache_key(), market_set)
         return self.markets
 
+    def index_markets(self, markets):
+        """Builds the tables of the markets by other keys that an exchange keeps, like markets by uppercase id. Called with
+        the markets by symbol whenever they are set or attached, also when fetch_markets did not run for them"""
+        pass
+
+    def market_set(self):
+        return MarketSet(self.markets, self.markets_by_id, self.symbols, self.ids, self.currencies, self.currencies_by_id)
+
+    def attach_markets(self, market_set):
+        """Uses the markets of a MarketSet or of another instance as they are, without copying them"""
+        if isinstance(market_set, Exchange):
+            market_set = market_set.market_set()
+        # one update of the instance dict, the threads reading the markets never see half of the tables swapped
+        self.__dict__.update({
+            'markets': market_set.markets,
+            'markets_by_id': market_set.markets_by_id,
+            'marketsById': market_set.markets_by_id,
+            'symbols': market_set.symbols,
+            'ids': market_set.ids,
+            'currencies': market_set.currencies,
+            'currencies_by_id': market_set.currencies_by_id,
+        })
+        self.index_markets(self.markets)
+        return self.markets
+
+    def load_shared_markets(self):
+        market_set = get_market_set(self.markets_cache_key())
+        if market_set is None:
+            return None
+        return self.attach_markets(market_set)
+
+    def markets_cache_key(self):
+        # instances of the same exchange with other api urls (a sandbox) have different markets
+        urls = json.dumps(self.urls.get('api') if self.urls else None, sort_keys=True)
+        return self.id + '-' + hashlib.md5(urls.encode('utf-8')).hexdigest()[0:8]
+
+    def load_markets_from_cache(self):
+        """Sets the markets from the cache, returns whether they have expired, or None if nothing is cached"""
+        entry = MarketCache(self.marketsCacheDirectory, self.jsonBackend).load(self.markets_cache_key())
+        if entry is None:
+            return None
+        self.set_markets(entry['markets'], entry['currencies'])
+        return self.milliseconds() - entry['timestamp'] > self.marketsCacheTTL
+
+    def save_markets_to_cache(self, markets, currencies=None):
+        try:
+            MarketCache(self.marketsCacheDirectory, self.jsonBackend).save(self.markets_cache_key(), markets, currencies)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            self.logger.warning('%s could not save the markets to the cache: %s', self.id, e)
+
+    def refresh_markets(self):
+        try:
+            self.load_markets(True)
+        except Exception as e:
+            self.logger.warning('%s could not refresh the markets: %s', self.id, e)
+
     def load_markets(self, reload=False):
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if self.shareMarkets and self.load_shared_markets():
+                return self.markets
+            if self.marketsCacheDirectory:
+                expired = self.load_markets_from_cache()
+                if expired is False:
+                    return self.markets
+                if expired and self.marketsCacheBackgroundRefresh:
+                    thread = threading.Thread(target=self.refresh_markets)
+                    thread.daemon = True
+                    thread.start()
+                    return self.markets
         markets = self.fetch_markets()
         currencies = None
         if self.has['fetchCurrencies']:
             currencies = self.fetch_currencies()
+        if self.marketsCacheDirectory:
+            self.save_markets_to_cache(markets, currencies)
         return self.set_markets(markets, currencies)
 
     def populate_fees(self):
@@ -1096,6 +1502,10 @@ class Exchange(object):
 
     def parse_ohlcvs(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
         ohlcvs = self.to_array(ohlcvs)
+        if self.ohlcvFormat == 'numpy':
+            if self.overrides('parse_ohlcv'):
+                ohlcvs = [self.parse_ohlcv(ohlcv, market, timeframe, since, limit) for ohlcv in ohlcvs]
+            return ohlcv_array(ohlcvs, since, limit)
         num_ohlcvs = len(ohlcvs)
         result = []
         i = 0
@@ -1129,12 +1539,34 @@ class Exchange(object):
 
     def fetch_l2_order_book(self, symbol, limit=None, params={}):
         orderbook = self.fetch_order_book(symbol, limit, params)
+        if isinstance(orderbook, OrderBook):  # aggregated and sorted already
+            return orderbook
+        if self.orderBookFormat == 'numpy':
+            return self.extend(orderbook, {
+                'bids': aggregate_bids_asks_array(orderbook['bids'], True),
+                'asks': aggregate_bids_asks_array(orderbook['asks']),
+            })
         return self.extend(orderbook, {
             'bids': self.sort_by(self.aggregate(orderbook['bids']), 0, True),
             'asks': self.sort_by(self.aggregate(orderbook['asks']), 0),
         })
 
     def parse_order_book(self, orderbook, timestamp=None, bids_key='bids', asks_key='asks', price_key=0, amount_key=1):
+        if self.orderBookFormat == 'object':
+            return OrderBook({
+                'bids': self.parse_bids_asks(orderbook[bids_key], price_key, amount_key) if (bids_key in orderbook) and isinstance(orderbook[bids_key], list) else [],
+                'asks': self.parse_bids_asks(orderbook[asks_key], price_key, amount_key) if (asks_key in orderbook) and isinstance(orderbook[asks_key], list) else [],
+                'timestamp': timestamp,
+                'datetime': self.iso8601(timestamp) if timestamp is not None else None,
+            })
+        if self.orderBookFormat == 'numpy':
+            return {
+                'bids': self.parse_bids_asks_array(orderbook, bids_key, price_key, amount_key, True),
+                'asks': self.parse_bids_asks_array(orderbook, asks_key, price_key, amount_key),
+                'timestamp': timestamp,
+                'datetime': self.iso8601(timestamp) if timestamp is not None else None,
+                'nonce': None,
+            }
         return {
             'bids': self.sort_by(self.parse_bids_asks(orderbook[bids_key], price_key, amount_key) if (bids_key in orderbook) and isinstance(orderbook[bids_key], list) else [], 0, True),
             'asks': self.sort_by(self.parse_bids_asks(orderbook[asks_key], price_key, amount_key) if (asks_key in orderbook) and isinstance(orderbook[asks_key], list) else [], 0),
@@ -1143,6 +1575,20 @@ class Exchange(object):
             'nonce': None,
         }
 
+    def parse_bids_asks_array(self, orderbook, key, price_key=0, amount_key=1, descending=False):
+        bidasks = orderbook[key] if (key in orderbook) and isinstance(orderbook[key], list) else []
+        if self.overrides('parse_bids_asks') or self.overrides('parse_bid_ask'):
+            # exchange-specific parsing goes first, the parsed levels are converted as they are
+            return bids_asks_array(self.parse_bids_asks(bidasks, price_key, amount_key), 0, 1, descending)
+        return bids_asks_array(bidasks, price_key, amount_key, descending)
+
+    @classmethod
+    def overrides(cls, name):
+        """Returns whether the exchange class overrides a method of the base Exchange"""
+        method = getattr(cls, name)
+        base = getattr(Exchange, name)
+        return getattr(method, '__func__', method) is not getattr(base, '__func__', base)
+
     def parse_balance(self, balance):
         currencies = self.omit(balance, 'info').keys()
         for account in ['free', 'used', 'total']:
@@ -1188,6 +1634,127 @@ class Exchange(object):
     def fetchOHLCV(self, symbol, timeframe='1m', since=None, limit=None, params={}):
         return self.fetch_ohlcv(symbol, timeframe, since, limit, params)
 
+    def ohlcv_range_arguments(self, since=None, until=None, checkpoint=None):
+        if checkpoint and (checkpoint.get('since') is not None):
+            since = checkpoint['since']
+        if since is None:
+            self.raise_error(ExchangeError, details='fetch_ohlcv_range() requires a since argument')
+        until = self.milliseconds() if until is None else until
+        limit = self.safe_integer((self.pagination or {}).get('fetchOHLCV', {}), 'limit')
+        return since, until, limit
+
+    def next_ohlcv_cursor(self, ohlcvs, cursor, timeframe='1m', limit=None):
+        """Returns the since of the page following the candles fetched from cursor, None if there are no more candles"""
+        ms = self.parse_timeframe(timeframe) * 1000
+        if len(ohlcvs):
+            return max(int(ohlcvs[len(ohlcvs) - 1][0]) + ms, cursor + ms)
+        # an empty page is a gap in the history if the size of the pages is known, or its end otherwise
+        return cursor + limit * ms if limit else None
+
+    def merge_ohlcvs(self, ohlcvs, since=None, until=None):
+        """Sorts candles by time, dropping overlapping ones and those outside of [since, until)"""
+        result = {}
+        for ohlcv in ohlcvs:
+            timestamp = ohlcv[0]
+            if (timestamp not in result) and ((since is None) or (timestamp >= since)) and ((until is None) or (timestamp < until)):
+                result[timestamp] = ohlcv
+        result = [result[timestamp] for timestamp in sorted(result.keys())]
+        return ohlcv_array(result) if self.ohlcvFormat == 'numpy' else result
+
+    def fetch_ohlcv_pages(self, symbol, timeframe, cursor, until, limit=None, params={}, checkpoint=None):
+        # the candles go to the checkpoint along with the since past them, so that none are lost when a later page fails
+        ohlcvs = [] if checkpoint is None else checkpoint['ohlcvs']
+        while (cursor is not None) and (cursor < until):
+            page = self.fetch_ohlcv(symbol, timeframe, cursor, limit, params)
+            ohlcvs.extend(page)
+            cursor = self.next_ohlcv_cursor(page, cursor, timeframe, limit)
+            if checkpoint is not None:
+                checkpoint['since'] = until if cursor is None else min(cursor, until)
+        return ohlcvs
+
+    def fetch_ohlcv_range(self, symbol, timeframe='1m', since=None, until=None, params={}, checkpoint=None):
+        """Fetches the candles from since until until (now by default) with as many requests as needed,
+        a checkpoint dict is updated with the since of the next request and the candles fetched before it,
+        passing it again after an error resumes from there and returns the candles of both calls"""
+        start, until, limit = self.ohlcv_range_arguments(since, until, checkpoint)
+        if checkpoint is not None:
+            checkpoint.setdefault('ohlcvs', [])
+        ohlcvs = self.fetch_ohlcv_pages(symbol, timeframe, start, until, limit, params, checkpoint)
+        return self.returned_ohlcvs(ohlcvs, start if since is None else min(since, start), until, checkpoint)
+
+    def returned_ohlcvs(self, ohlcvs, since, until, checkpoint=None):
+        if checkpoint is not None:
+            checkpoint['ohlcvs'] = []  # returned to the caller now
+        return self.merge_ohlcvs(ohlcvs, since, until)
+
+    def fetchOHLCVRange(self, symbol, timeframe='1m', since=None, until=None, params={}, checkpoint=None):
+        return self.fetch_ohlcv_range(symbol, timeframe, since, until, params, checkpoint)
+
+    def paginate(self, method, symbol=None, since=None, params={}):
+        """Yields the pages of a method like fetch_my_trades one at a time, the symbol is the currency code for fetch_transactions"""
+        paginator = Paginator(self, method, symbol, since, params)
+        fetch = getattr(self, method)
+        while not paginator.done:
+            page = fetch(*paginator.arguments())
+            page = paginator.update(page, self.last_response_headers)
+            if len(page):
+                yield page
+
+    def batch_chunks(self, method, symbols):
+        """Splits the symbols into lists that fit the limits of a batch method, the most symbols per request
+        and the largest length of their market ids joined by the separator (',' by default) in the url"""
+        description = self.batch.get(method) or {}
+        max_symbols = description.get('symbols')
+        max_length = description.get('length')
+        separator = len(description.get('separator', ','))
+        chunks = []
+        chunk = []
+        length = 0
+        for symbol in symbols:
+            size = len(self.markets[symbol]['id'] if symbol in self.markets else symbol)
+            full = max_symbols and len(chunk) >= max_symbols
+            if len(chunk) and (full or (max_length and length + separator + size > max_length)):
+                chunks.append(chunk)
+                chunk = []
+            length = (length + separator + size) if len(chunk) else size
+            chunk.append(symbol)
+        if len(chunk):
+            chunks.append(chunk)
+        return chunks
+
+    def batch_arguments(self, method, symbols):
+        """Returns the camelcased method, the single symbol method it falls back to and the chunks of symbols"""
+        method = method if '_' not in method else self.underscore_to_camelcase(method)
+        if method not in self.batchFallbacks:
+            raise NotSupported(self.id + ' has no batch method ' + method + ', use one of: ' + ', '.join(self.batchFallbacks.keys()))
+        if not self.has.get(method):
+            return method, self.batchFallbacks[method], None
+        if symbols is None and method not in self.batch:
+            return method, None, [None]  # the exchange returns all symbols at once
+        return method, None, self.batch_chunks(method, self.symbols if symbols is None else symbols)
+
+    def filter_by_symbols(self, result, symbols=None):
+        if symbols is None:
+            return result
+        return dict((symbol, result[symbol]) for symbol in symbols if symbol in result)
+
+    def fetch_batch(self, method, symbols=None, params={}):
+        """Calls a batch method like fetch_order_books or fetch_tickers for chunks of symbols that fit the limits
+        in self.batch, or the single symbol method for every symbol if the exchange has no batch method,
+        returns a dict of the results of the requested symbols by symbol"""
+        self.load_markets()
+        method, fallback, chunks = self.batch_arguments(method, symbols)
+        result = {}
+        if fallback:
+            fetch = getattr(self, fallback)
+            for symbol in (self.symbols if symbols is None else symbols):
+                result[symbol] = fetch(symbol, params=params)
+        else:
+            fetch = getattr(self, method)
+            for chunk in chunks:
+                result.update(fetch(chunk, params))
+        return self.filter_by_symbols(result, symbols)
+
     def convert_trading_view_to_ohlcv(self, ohlcvs):
         result = []
         for i in range(0, len(ohlcvs['t'])):
@@ -1225,6 +1792,8 @@ class Exchange(object):
         (high, low, close, volume) = (2, 3, 4, 5)
         num_trades = len(trades)
         oldest = (num_trades - 1) if limit is None else min(num_trades - 1, limit)
+        if (self.ohlcvFormat == 'numpy') or ((oldest >= self.numpyThreshold) and numpy_available()):
+            return self.build_ohlcv_vectorized(trades[0:max(oldest, 0)], ms, since)
         for i in range(0, oldest):
             trade = trades[i]
             if (since is not None) and (trade['timestamp'] < since):
@@ -1249,6 +1818,37 @@ class Exchange(object):
                 ohlcvs[j - 1][volume] += trade['amount']
         return ohlcvs
 
+    def build_ohlcv_vectorized(self, trades, ms, since=None):
+        timestamps = [trade['timestamp'] for trade in trades]
+        prices = [trade['price'] for trade in trades]
+        amounts = [trade['amount'] for trade in trades]
+        ohlcvs = build_ohlcv_array(timestamps, prices, amounts, ms, since)
+        if self.ohlcvFormat == 'numpy':
+            return ohlcvs
+        ohlcvs = ohlcvs.tolist()
+        for ohlcv in ohlcvs:
+            ohlcv[0] = int(ohlcv[0])
+        return ohlcvs
+
+    def resample_ohlcv(self, ohlcvs, timeframe='1m'):
+        """Merges candles sorted by time into candles of a coarser timeframe, like 5m candles into 15m candles"""
+        ms = self.parse_timeframe(timeframe) * 1000
+        if not isinstance(ohlcvs, list):
+            return resample_ohlcv_array(ohlcvs, ms)
+        result = []
+        for ohlcv in ohlcvs:
+            opening_time = int(math.floor(ohlcv[0] / ms) * ms)
+            j = len(result)
+            if (j == 0) or opening_time >= result[j - 1][0] + ms:
+                result.append([opening_time] + list(ohlcv[1:6]))
+            else:
+                candle = result[j - 1]
+                candle[2] = max([value for value in (candle[2], ohlcv[2]) if value is not None] or [None])
+                candle[3] = min([value for value in (candle[3], ohlcv[3]) if value is not None] or [None])
+                candle[4] = ohlcv[4]
+                candle[5] = (candle[5] or 0) + (ohlcv[5] or 0)
+        return result
+
     def parse_timeframe(self, timeframe):
         amount = int(timeframe[0:-1])
         unit = timeframe[-1]
@@ -1268,7 +1868,8 @@ class Exchange(object):
 
     def parse_trades(self, trades, market=None, since=None, limit=None):
         array = self.to_array(trades)
-        array = [self.parse_trade(trade, market) for trade in array]
+        parse_many = getattr(self.parse_trade, 'many', None)  # lean records parse the whole list at once
+        array = parse_many(array, market) if parse_many else [self.parse_trade(trade, market) for trade in array]
         array = self.sort_by(array, 'timestamp')
         symbol = market['symbol'] if market else None
         return self.filter_by_symbol_since_limit(array, symbol, since, limit)
@@ -1282,7 +1883,8 @@ class Exchange(object):
 
     def parse_orders(self, orders, market=None, since=None, limit=None):
         array = self.to_array(orders)
-        array = [self.parse_order(order, market) for order in array]
+        parse_many = getattr(self.parse_order, 'many', None)  # lean records parse the whole list at once
+        array = parse_many(array, market) if parse_many else [self.parse_order(order, market) for order in array]
         array = self.sort_by(array, 'timestamp')
         symbol = market['symbol'] if market else None
         return self.filter_by_symbol_since_limit(array, symbol, since, limit)
@@ -1353,7 +1955,7 @@ class Exchange(object):
     def find_symbol(self, string, market=None):
         if market is None:
             market = self.find_market(string)
-        if isinstance(market, dict):
+        if isinstance(market, (dict, Record)):
             return market['symbol']
         return string
 
@@ -1369,7 +1971,7 @@ class Exchange(object):
 
     def market_id(self, symbol):
         market = self.market(symbol)
-        return market['id'] if type(market) is dict else symbol
+        return market['id'] if isinstance(market, (dict, Record)) else symbol
 
     def calculate_fee(self, symbol, type, side, amount, price, takerOrMaker='taker', params={}):
         market = self.markets[symbol]
@@ -1421,6 +2023,19 @@ class Exchange(object):
     # -------------------------------------------------------------------------
     # web3 / 0x methods
 
+    @property
+    def web3(self):
+        if self._web3 is None and load_web3():
+            if Exchange._shared_web3 is None:
+                # self.web3 = w3 if w3 else Web3(HTTPProvider())
+                Exchange._shared_web3 = Web3(HTTPProvider())
+            self._web3 = Exchange._shared_web3
+        return self._web3
+
+    @web3.setter
+    def web3(self, value):
+        self._web3 = value
+
     def decryptAccountFromJSON(self, value, password):
         return self.decryptAccount(json.loads(value) if isinstance(value, basestring) else value, password)
 
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""Pluggable JSON encoders and decoders"""
+
+# -----------------------------------------------------------------------------
+
+import importlib
+import json
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping  # python 2
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'JSON_BACKENDS',
+    'AUTO_JSON_BACKENDS',
+    'get_json_backend',
+]
+
+# -----------------------------------------------------------------------------
+
+JSON_BACKENDS = [
+    'orjson',
+    'rapidjson',
+    'ujson',
+    'json',
+]
+
+# the order of preference for 'auto', orjson is used only when asked for as it decodes integers wider than 64 bits
+# to floats, losing the digits of ids and nonces, where the other backends decode them exactly or refuse them
+AUTO_JSON_BACKENDS = [
+    'rapidjson',
+    'ujson',
+    'json',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def stdlib_loads(data):
+    if isinstance(data, (bytes, bytearray)) and not isinstance(data, str):
+        data = data.decode('utf-8')  # json.loads() accepts bytes since Python 3.6 only
+    return json.loads(data)
+
+
+def stdlib_default(value):
+    # the compact market records are encoded as dicts and
+    # the lazy values of lean parsing, like a LazyDatetime, are encoded as what they resolve to
+    if isinstance(value, Mapping):
+        return dict(value)
+    resolve = getattr(value, 'resolve', None)
+    if resolve is None:
+        raise TypeError(repr(value) + ' is not JSON serializable')
+    return resolve()
+
+
+def stdlib_dumps(data):
+    return json.dumps(data, separators=(',', ':'), default=stdlib_default)
+
+
+def with_stdlib_fallback(loads, dumps):
+    # the fast codecs refuse some inputs the stdlib handles, like integers wider than 64 bits,
+    # note that orjson decodes such integers to floats instead of refusing them, see AUTO_JSON_BACKENDS
+    def fallback_loads(data):
+        try:
+            return loads(data)
+        except ValueError:
+            return stdlib_loads(data)
+
+    def fallback_dumps(data):
+        try:
+            return dumps(data)
+        except (TypeError, ValueError, OverflowError):
+            return stdlib_dumps(data)
+
+    return fallback_loads, fallback_dumps
+
+
+def orjson_codec(orjson):
+    options = orjson.OPT_NON_STR_KEYS
+    return orjson.loads, lambda data: orjson.dumps(data, option=options).decode('utf-8')
+
+
+def rapidjson_codec(rapidjson):
+    return rapidjson.loads, rapidjson.dumps
+
+
+def ujson_codec(ujson):
+    # unlike the stdlib, ujson escapes forward slashes by default
+    return ujson.loads, lambda data: ujson.dumps(data, escape_forward_slashes=False)
+
+
+codecs = {
+    'orjson': orjson_codec,
+    'rapidjson': rapidjson_codec,
+    'ujson': ujson_codec,
+}
+
+cache = {
+    'json': (stdlib_loads, stdlib_dumps),
+}
+
+# -----------------------------------------------------------------------------
+
+
+def get_json_backend(name='json'):
+    """Returns a (loads, dumps) pair for 'json', 'orjson', 'rapidjson', 'ujson' or 'auto' (the fastest one installed
+    that decodes wide integers exactly, not orjson), a backend that is not installed falls back to the stdlib json module"""
+    if name in cache:
+        return cache[name]
+    if name == 'auto':
+        for candidate in AUTO_JSON_BACKENDS:
+            codec = get_json_backend(candidate)
+            if (candidate == 'json') or (codec is not cache['json']):
+                break
+    elif name in codecs:
+        try:
+            codec = with_stdlib_fallback(*codecs[name](importlib.import_module(name)))
+        except ImportError:
+            codec = cache['json']
+    else:
+        raise ValueError('unknown json backend: ' + str(name) + ', use one of: ' + ', '.join(JSON_BACKENDS + ['auto']))
+    cache[name] = codec
+    return codec
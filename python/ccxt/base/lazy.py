@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""Lazy loading of exchange classes"""
+
+# -----------------------------------------------------------------------------
+
+import importlib
+import sys
+import types
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'LazyExchangesModule',
+    'lazy_load_exchanges',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class LazyExchangesModule(types.ModuleType):
+    """A package that imports ccxt/<id>.py upon first access to package.<id>"""
+
+    def __getattr__(self, name):
+        # called only if the regular attribute lookup has failed
+        if name in self.__dict__.get('_lazy_exchange_ids', ()):
+            module = importlib.import_module(self.__name__ + '.' + name)
+            exchange = getattr(module, name)
+            types.ModuleType.__setattr__(self, name, exchange)
+            return exchange
+        raise AttributeError("module '" + self.__name__ + "' has no attribute '" + name + "'")
+
+    def __setattr__(self, name, value):
+        # the import machinery binds package.<id> to the submodule of the same name,
+        # this happens when exchanges import their parents, like okex → okcoinusd
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get('_lazy_exchange_ids', ()):
+            value = getattr(value, name, value)
+        types.ModuleType.__setattr__(self, name, value)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__.keys()) | set(self.__dict__.get('_lazy_exchange_ids', ())))
+
+
+def lazy_load_exchanges(name, exchanges):
+    """Makes the exchange classes of package `name` load on demand, eagerly with Python < 3.5"""
+    package = sys.modules[name]
+    if sys.version_info >= (3, 5):
+        package._lazy_exchange_ids = frozenset(exchanges)
+        package.__class__ = LazyExchangesModule
+    else:
+        for id in exchanges:
+            setattr(package, id, getattr(importlib.import_module(name + '.' + id), id))
+    return package
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""Compact, read-mostly market and currency records with dict-compatible access"""
+
+# -----------------------------------------------------------------------------
+
+import json
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping  # python 2
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Record',
+    'Market',
+    'Currency',
+    'KEEP_INFO',
+    'LAZY_INFO',
+    'DROP_INFO',
+]
+
+# -----------------------------------------------------------------------------
+
+KEEP_INFO = 'keep'  # keep the raw info as it is
+LAZY_INFO = 'lazy'  # keep the raw info as a json string, decoded on every access
+DROP_INFO = 'drop'  # drop the raw info, record['info'] is None
+
+# -----------------------------------------------------------------------------
+
+missing = object()
+
+
+class Record(Mapping):
+    """A mapping that stores the usual keys in slots and the other ones in a dict of extras,
+    it supports the reading operations of a dict and item assignment"""
+
+    __slots__ = ['_extra']
+
+    fields = ()
+    field_set = frozenset()
+
+    def __init__(self, values, info=KEEP_INFO, shared=None):
+        # shared deduplicates equal nested dicts like precision and limits between records
+        extra = None
+        field_set = self.field_set
+        set_slot = object.__setattr__
+        for key, value in values.items():
+            if key == 'info':
+                if info == DROP_INFO:
+                    value = None
+                elif info == LAZY_INFO and value is not None:
+                    value = LazyInfo.encode(value)
+            elif (shared is not None) and isinstance(value, dict):
+                value = deduplicate(shared, value)
+            if key in field_set:
+                set_slot(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        set_slot(self, '_extra', extra)
+
+    def __getitem__(self, key):
+        if key in self.field_set:
+            value = getattr(self, key, missing)
+            if value is not missing:
+                return value.decode() if key == 'info' and type(value) is LazyInfo else value
+        if self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self.field_set:
+            object.__setattr__(self, key, value)
+        else:
+            if self._extra is None:
+                object.__setattr__(self, '_extra', {})
+            self._extra[key] = value
+
+    def __contains__(self, key):
+        if key in self.field_set:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for key in self.fields:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            for key in self._extra:
+                yield key
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def to_dict(self):
+        return dict(self)
+
+    def copy(self):
+        # a dict, like the copy of the dict the record replaces, so that Exchange.omit() and alike can delete keys
+        return dict(self)
+
+
+def deduplicate(shared, value):
+    try:
+        key = json.dumps(value, sort_keys=True)
+    except (TypeError, ValueError):
+        return value
+    return shared.setdefault(key, value)
+
+
+class LazyInfo(object):
+    """The raw info kept as a json string, decoded on every access, records decode it when it is read and
+    a LazyInfo left in a dict reads like the decoded info"""
+
+    __slots__ = ['encoded']
+
+    def __init__(self, encoded):
+        self.encoded = encoded
+
+    @staticmethod
+    def encode(value):
+        try:
+            return LazyInfo(json.dumps(value, separators=(',', ':')))
+        except (TypeError, ValueError):
+            return value
+
+    def decode(self):
+        return json.loads(self.encoded)
+
+    resolve = decode
+
+    def __getitem__(self, key):
+        return self.decode()[key]
+
+    def __iter__(self):
+        return iter(self.decode())
+
+    def __len__(self):
+        return len(self.decode())
+
+    def __contains__(self, key):
+        return key in self.decode()
+
+    def __eq__(self, other):
+        return self.decode() == (other.decode() if isinstance(other, LazyInfo) else other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.decode())
+
+    def __getattr__(self, name):
+        # the dict methods like get and items
+        if name in LazyInfo.__slots__:
+            raise AttributeError(name)
+        return getattr(self.decode(), name)
+
+
+class Market(Record):
+
+    fields = ('id', 'symbol', 'base', 'quote', 'baseId', 'quoteId', 'active', 'type', 'spot', 'future',
+              'precision', 'limits', 'taker', 'maker', 'percentage', 'tierBased', 'info')
+
+    __slots__ = fields
+    field_set = frozenset(fields)
+
+
+class Currency(Record):
+
+    fields = ('id', 'numericId', 'code', 'name', 'active', 'status', 'type', 'precision', 'limits', 'fee', 'info')
+
+    __slots__ = fields
+    field_set = frozenset(fields)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""On-disk cache for loaded markets and currencies"""
+
+# -----------------------------------------------------------------------------
+
+import os
+import tempfile
+import time
+
+from ccxt.base.json_backend import get_json_backend
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'MarketCache',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class MarketCache(object):
+    """Stores markets and currencies as one compact json file per key in a directory.
+    Files are written to a temporary file and renamed over the previous one,
+    so that concurrent processes never read a partial file."""
+
+    def __init__(self, directory, json_backend='json'):
+        self.directory = directory
+        self.json_backend = json_backend
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def load(self, key):
+        """Returns a dict with the timestamp (in milliseconds), markets and currencies for the key, None if nothing is cached"""
+        loads, dumps = get_json_backend(self.json_backend)
+        try:
+            with open(self.path(key), 'rb') as f:
+                entry = loads(f.read())
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or ('markets' not in entry) or ('timestamp' not in entry):
+            return None
+        return entry
+
+    def save(self, key, markets, currencies=None, timestamp=None):
+        loads, dumps = get_json_backend(self.json_backend)
+        data = dumps({
+            'timestamp': timestamp if timestamp is not None else int(time.time() * 1000),
+            'markets': markets,
+            'currencies': currencies,
+        })
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                if not os.path.isdir(self.directory):  # created by another process meanwhile
+                    raise
+        fd, temporary = tempfile.mkstemp(prefix=key + '.', suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data.encode('utf-8'))
+            replace(temporary, self.path(key))
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+
+def replace(source, destination):
+    if hasattr(os, 'replace'):
+        os.replace(source, destination)
+    else:
+        os.rename(source, destination)  # python 2, atomic on posix
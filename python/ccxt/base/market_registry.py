@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""In-process registry of loaded markets shared by exchange instances"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'MarketSet',
+    'get_market_set',
+    'register_market_set',
+    'clear_market_registry',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class MarketSet(object):
+    """The market tables of an exchange, instances attached to the same set share them and must not modify them"""
+
+    __slots__ = ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id']
+
+    def __init__(self, markets, markets_by_id, symbols, ids, currencies, currencies_by_id):
+        self.markets = markets
+        self.markets_by_id = markets_by_id
+        self.symbols = symbols
+        self.ids = ids
+        self.currencies = currencies
+        self.currencies_by_id = currencies_by_id
+
+
+# -----------------------------------------------------------------------------
+
+registry = {}
+registry_lock = threading.Lock()
+
+
+def get_market_set(key):
+    with registry_lock:
+        return registry.get(key)
+
+
+def register_market_set(key, market_set):
+    with registry_lock:
+        registry[key] = market_set
+
+
+def clear_market_registry():
+    with registry_lock:
+        registry.clear()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""Incrementally updated L2 order book with sorted price levels"""
+
+# -----------------------------------------------------------------------------
+
+import bisect
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping  # python 2
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'OrderBook',
+    'OrderBookSide',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class OrderBookSide(object):
+    """The price levels of one side of the book: a dict of amounts by price and the sorted list of prices.
+    With sortedcontainers installed the prices are kept in a SortedList with O(log n) updates. It is not
+    a dependency of ccxt, without it the prices are kept in a plain list updated with bisect, where finding
+    the position is O(log n) but inserting or removing a price level is O(n), which is fast enough
+    for books of a few thousand levels. Changing the amount of an existing price level is O(1) either way."""
+
+    def __init__(self, descending=False):
+        self.descending = descending
+        self.amounts = {}
+        self.prices = SortedList() if SortedList else []
+        self.levels = None  # the [price, amount] levels built by to_list(), until the next update
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def clear(self):
+        self.amounts = {}
+        self.prices = SortedList() if SortedList else []
+        self.levels = None
+
+    def replace(self, levels):
+        """Replaces all price levels with a list of [price, amount], amounts of repeated prices are summed up"""
+        self.clear()
+        amounts = self.amounts
+        for price, amount in levels:
+            self.store(price, amounts.get(price, 0) + amount)
+
+    def store(self, price, amount):
+        """Sets the amount at the price, an amount of 0 removes the price level"""
+        self.levels = None
+        if amount:
+            if price not in self.amounts:
+                if SortedList:
+                    self.prices.add(price)
+                else:
+                    bisect.insort(self.prices, price)
+            self.amounts[price] = amount
+        elif price in self.amounts:
+            del self.amounts[price]
+            if SortedList:
+                self.prices.remove(price)
+            else:
+                del self.prices[bisect.bisect_left(self.prices, price)]
+
+    def best(self):
+        if not self.amounts:
+            return None
+        price = self.prices[-1] if self.descending else self.prices[0]
+        return [price, self.amounts[price]]
+
+    def to_list(self, limit=None):
+        """Returns up to limit [price, amount] levels starting from the best price, all the levels are built once
+        per update and the same list is returned until the next update, so it must not be changed by the caller"""
+        if not limit and self.levels is not None:
+            return self.levels
+        if self.descending:
+            prices = self.prices[-limit:] if limit else self.prices[:]
+            prices.reverse()
+        else:
+            prices = self.prices[:limit] if limit else self.prices[:]
+        amounts = self.amounts
+        levels = [[price, amounts[price]] for price in prices]
+        if not limit:
+            self.levels = levels
+        return levels
+
+
+class OrderBook(Mapping):
+    """An L2 order book that is updated in place by snapshots and deltas, with O(1) access to the top of the book.
+    It can be read like the dict returned by parse_order_book, book['bids'] is a list of [price, amount] levels,
+    built on the first read after an update and shared by the reads until the next update."""
+
+    keys_ = ('bids', 'asks', 'timestamp', 'datetime', 'nonce')
+
+    def __init__(self, snapshot=None):
+        self.bids = OrderBookSide(True)
+        self.asks = OrderBookSide(False)
+        self.timestamp = None
+        self.datetime = None
+        self.nonce = None
+        if snapshot is not None:
+            self.apply_snapshot(snapshot)
+
+    def apply_snapshot(self, snapshot):
+        """Replaces the book with a dict of bids and asks like the one returned by parse_order_book"""
+        self.bids.replace(snapshot.get('bids') or [])
+        self.asks.replace(snapshot.get('asks') or [])
+        self.timestamp = snapshot.get('timestamp')
+        self.datetime = snapshot.get('datetime')
+        self.nonce = snapshot.get('nonce')
+        return self
+
+    def apply_delta(self, side, price, amount):
+        """Sets the amount at a price level of the 'bids' or the 'asks', an amount of 0 removes the level"""
+        if side == 'bids':
+            self.bids.store(price, amount)
+        elif side == 'asks':
+            self.asks.store(price, amount)
+        else:
+            raise ValueError('unknown order book side: ' + str(side) + ', use one of: bids, asks')
+
+    @property
+    def best_bid(self):
+        return self.bids.best()
+
+    @property
+    def best_ask(self):
+        return self.asks.best()
+
+    def to_dict(self, limit=None):
+        return {
+            'bids': self.bids.to_list(limit),
+            'asks': self.asks.to_list(limit),
+            'timestamp': self.timestamp,
+            'datetime': self.datetime,
+            'nonce': self.nonce,
+        }
+
+    def __getitem__(self, key):
+        if key == 'bids' or key == 'asks':
+            return getattr(self, key).to_list()
+        if key in self.keys_:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == 'bids' or key == 'asks':
+            getattr(self, key).replace(value)
+        elif key in self.keys_:
+            setattr(self, key, value)
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.keys_)
+
+    def __len__(self):
+        return len(self.keys_)
+
+    def __repr__(self):
+        return 'OrderBook(' + repr(self.to_dict()) + ')'
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""State of paginated requests to fetch_trades, fetch_my_trades, fetch_orders, fetch_transactions and alike"""
+
+# -----------------------------------------------------------------------------
+
+from ccxt.base.errors import ExchangeError
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Paginator',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class Paginator(object):
+    """Computes the arguments of the next request from the pages fetched so far, as described by exchange.pagination:
+
+    {
+        'fetchMyTrades': {
+            'cursor': 'since',  # 'since' (default), 'id' or 'header'
+            'limit': 1000,      # the largest page size, the default page size of the exchange if omitted
+            'param': 'fromId',  # the request parameter carrying the cursor ('id' and 'header' cursors)
+            'key': 'id',        # the key of the items the 'id' cursor is taken from, incremented by one
+            'header': 'CB-AFTER',  # the response header carrying the cursor of the next page ('header' cursors)
+        },
+    }
+
+    A 'since' cursor requests the items from the timestamp of the last item on, dropping the ones already seen,
+    an 'id' cursor sends the since only with the first request, a 'header' cursor sends it with every request.
+    The items older than a 'since' cursor are dropped too and the paging stops when the cursor does not move forward,
+    so that an exchange that ignores the cursor returns its page once instead of forever. When full pages of new items
+    all share the timestamp of the cursor, and the next request returns nothing new, an ExchangeError is raised,
+    as a 'since' cursor cannot page past them and the rest of the items would be missing.
+    Only the ids of the last page are kept, so the memory used does not grow with the number of pages."""
+
+    def __init__(self, exchange, method, symbol=None, since=None, params={}):
+        key = method if '_' not in method else exchange.underscore_to_camelcase(method)
+        description = exchange.extend({'cursor': 'since', 'key': 'id'}, (exchange.pagination or {}).get(key, {}))
+        self.exchange = exchange
+        self.method = method
+        self.cursor_type = description['cursor']
+        if self.cursor_type not in ('since', 'id', 'header'):
+            raise ValueError('unknown pagination cursor: ' + str(self.cursor_type) + ', use one of: since, id, header')
+        self.limit = description.get('limit')
+        self.param = description.get('param')
+        self.key = description['key']
+        self.header = description.get('header')
+        self.symbol = symbol
+        self.since = since
+        self.params = params
+        self.cursor = None
+        self.seen = set()
+        self.page_size = 0  # the largest page returned, the page size of the exchange when no limit is set
+        self.stalled = False  # a full page did not move the 'since' cursor forward
+        self.done = False
+
+    def arguments(self):
+        """Returns the symbol (or code), since, limit and params of the next request"""
+        since = self.since
+        params = self.params
+        if self.cursor is not None:
+            params = self.exchange.extend(params, {self.param: self.cursor})
+            if self.cursor_type == 'id':
+                since = None
+        return [self.symbol, since, self.limit, params]
+
+    def raise_stalled(self):
+        raise ExchangeError(self.exchange.id + ' ' + self.method + '() returned full pages of items at the timestamp ' +
+                            str(self.since) + ', a since cursor cannot page past them, use an id or a header cursor')
+
+    def update(self, page, headers=None):
+        """Returns the items of the page that were not seen before and moves the cursor past them,
+        the headers are those of the response of the page, they carry the next cursor of 'header' cursors"""
+        self.page_size = max(self.page_size, len(page))
+        items = [item for item in page if item.get(self.key) is None or item[self.key] not in self.seen]
+        if self.cursor_type == 'since' and self.since is not None:
+            # exchanges that ignore since return items older than the cursor
+            items = [item for item in items if item.get('timestamp') is None or item['timestamp'] >= self.since]
+        if not len(items):
+            self.done = True
+            if self.stalled:
+                self.raise_stalled()
+            return items
+        if self.cursor_type == 'since':
+            timestamp = max([item['timestamp'] for item in items if item.get('timestamp') is not None] or [None])
+            if timestamp is not None and timestamp == self.since and len(page) > 1 and len(page) >= (self.limit or self.page_size):
+                # a full page at the timestamp of the cursor, more items may share it, the next request tells,
+                # as it returns nothing new unless the exchange pages them in some other way
+                ids = [item[self.key] for item in items if item.get(self.key) is not None]
+                if self.stalled and not len(ids):
+                    # the items without an id cannot be told from those of the previous page
+                    self.done = True
+                    self.raise_stalled()
+                self.stalled = True
+                self.seen.update(ids)
+                return items
+            if timestamp is None or timestamp == self.since:
+                # the next request would be the same as this one
+                self.done = True
+                return items
+            self.since = timestamp
+            self.stalled = False
+            # the next page starts at the same timestamp, the items seen there are dropped
+            self.seen = set([item[self.key] for item in items if item.get('timestamp') == timestamp and item.get(self.key) is not None])
+        elif self.cursor_type == 'id':
+            # the items without an id, like some fee or funding entries, do not move the cursor
+            ids = [item[self.key] for item in items if item.get(self.key) not in (None, '')]
+            cursor = max([int(id) for id in ids]) + 1 if len(ids) else None
+            if cursor is None or (self.cursor is not None and cursor <= self.cursor):
+                self.done = True
+                return items
+            self.cursor = cursor
+            self.seen = set(ids)
+        else:
+            cursor = headers.get(self.header) if headers else None
+            if cursor is None or cursor == self.cursor:
+                self.done = True
+            self.cursor = cursor
+            self.seen = set([item[self.key] for item in items if item.get(self.key) is not None])
+        return items
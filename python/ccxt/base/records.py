@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""Lean trade, order and ticker parsing, with the datetime formatted on first use and an optional raw info"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+import weakref
+
+from ccxt.base.market import KEEP_INFO
+from ccxt.base.market import DROP_INFO
+from ccxt.base.market import LazyInfo
+from ccxt.base.timestamps import iso8601
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'LazyDatetime',
+    'lean_parser',
+    'lean_iso8601',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class Parsing(threading.local):
+
+    lean = False  # whether a lean parser runs in this thread
+
+
+parsing = Parsing()
+
+
+class LazyDatetime(object):
+    """The iso8601 of a timestamp, formatted the first time it is used as a string. It compares, hashes, prints and
+    json-encodes through Exchange.json like the formatted string, and the str methods are looked up on the string"""
+
+    __slots__ = ['timestamp', 'formatted']
+
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+
+    def resolve(self):
+        try:
+            return self.formatted
+        except AttributeError:
+            self.formatted = iso8601(self.timestamp)
+            return self.formatted
+
+    def __str__(self):
+        return str(self.resolve())
+
+    def __repr__(self):
+        return repr(self.resolve())
+
+    def __format__(self, spec):
+        return format(self.resolve(), spec)
+
+    def __eq__(self, other):
+        return self.resolve() == (other.resolve() if isinstance(other, LazyDatetime) else other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self.resolve() < (other.resolve() if isinstance(other, LazyDatetime) else other)
+
+    def __gt__(self, other):
+        return self.resolve() > (other.resolve() if isinstance(other, LazyDatetime) else other)
+
+    def __le__(self, other):
+        return not self > other
+
+    def __ge__(self, other):
+        return not self < other
+
+    def __hash__(self):
+        return hash(self.resolve())
+
+    def __bool__(self):
+        return bool(self.resolve())
+
+    __nonzero__ = __bool__  # python 2
+
+    def __len__(self):
+        return len(self.resolve())
+
+    def __getitem__(self, key):
+        return self.resolve()[key]
+
+    def __contains__(self, value):
+        return value in self.resolve()
+
+    def __add__(self, other):
+        return self.resolve() + other
+
+    def __radd__(self, other):
+        return other + self.resolve()
+
+    def __getattr__(self, name):
+        # the str methods like split, the slots are never looked up on the string
+        if name in LazyDatetime.__slots__:
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+
+def lean_iso8601(timestamp=None):
+    """The iso8601 of the exchanges with lean records, it returns a LazyDatetime while a lean parser runs in the thread
+    and the formatted datetime otherwise, like for the requests"""
+    if timestamp is None or not parsing.lean:
+        return iso8601(timestamp)
+    return LazyDatetime(timestamp)
+
+
+def lean_parser(method, exchange, info=KEEP_INFO):
+    """Wraps a method like Exchange.parse_trade to build its dicts with a LazyDatetime and the raw info kept, dropped
+    or encoded, the exchange is referenced weakly, as the wrapper is stored on the exchange itself. The dicts are
+    returned as they are, which keeps lean parsing as fast as parsing dicts. The many() of the wrapper parses a list
+    of items at once, for parse_trades and alike"""
+    exchange = weakref.ref(exchange)
+
+    def lean_info(result):
+        if type(result) is dict and result.get('info') is not None:
+            result['info'] = None if info == DROP_INFO else LazyInfo.encode(result['info'])
+        return result
+
+    def parse_lean(*args, **kwargs):
+        if parsing.lean:
+            result = method(exchange(), *args, **kwargs)
+        else:
+            parsing.lean = True
+            try:
+                result = method(exchange(), *args, **kwargs)
+            finally:
+                parsing.lean = False
+        return result if info == KEEP_INFO else lean_info(result)
+
+    def parse_many(items, *args):
+        self = exchange()
+        outermost = not parsing.lean
+        parsing.lean = True
+        try:
+            results = [method(self, item, *args) for item in items]
+        finally:
+            if outermost:
+                parsing.lean = False
+        return results if info == KEEP_INFO else [lean_info(result) for result in results]
+
+    parse_lean.many = parse_many
+    return parse_lean
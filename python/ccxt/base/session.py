@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""Pooled requests sessions for the synchronous Exchange"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+try:
+    from http.cookiejar import DefaultCookiePolicy
+except ImportError:
+    from cookielib import DefaultCookiePolicy  # python 2
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'create_session',
+    'shared_session',
+    'close_shared_sessions',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class NoCookiesPolicy(DefaultCookiePolicy):
+    """Keeps the cookie jar of a Session empty, the cookies set during the redirects of one request
+    are still sent with that request, as requests keeps them in a jar of the request"""
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+def create_session(pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True, max_retries=0, keep_cookies=True):
+    """Returns a Session with a connection pool of pool_maxsize connections per host for up to pool_connections hosts,
+    with pool_block the threads wait for a free connection instead of opening one that is discarded afterwards,
+    without keep_cookies the session does not store the cookies of the responses"""
+    session = Session()
+    if not keep_cookies:
+        session.cookies.set_policy(NoCookiesPolicy())
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block, max_retries=max_retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+# -----------------------------------------------------------------------------
+
+shared_sessions = {}
+shared_sessions_lock = threading.Lock()
+
+
+def shared_session(key, **options):
+    """Returns the process-wide Session for the key, creating it with the options of create_session on first use"""
+    with shared_sessions_lock:
+        if key not in shared_sessions:
+            shared_sessions[key] = create_session(**options)
+        return shared_sessions[key]
+
+
+def close_shared_sessions():
+    with shared_sessions_lock:
+        for session in shared_sessions.values():
+            session.close()
+        shared_sessions.clear()
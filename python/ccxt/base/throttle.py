@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""Token bucket rate limiter for the synchronous Exchange"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'TokenBucket',
+    'shared_token_bucket',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class TokenBucket(object):
+    """A thread-safe token bucket with the same configuration keys as the asyncio throttle:
+    refillRate (tokens per millisecond), capacity, defaultCost and the initial numTokens.
+    A request may proceed as soon as the bucket has a positive amount of tokens, then it consumes its cost."""
+
+    def __init__(self, config=None):
+        self.config = {
+            'lastTimestamp': time.time(),
+            'numTokens': 0,
+            'refillRate': 0.001,
+            'defaultCost': 1.000,
+            'capacity': 1.000,
+        }
+        self.config.update(config or {})
+        self.lock = threading.Lock()
+
+    def release_time(self, cost=None):
+        """Consumes the cost right away and returns the time at which the request may proceed"""
+        # concurrent callers take their turn under the lock and sleep outside of it,
+        # each one waiting until the tokens consumed by the callers before it are refilled
+        with self.lock:
+            cfg = self.config
+            now = time.time()
+            elapsed = now - cfg['lastTimestamp']
+            cfg['lastTimestamp'] = now
+            cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
+            delay = 0 if cfg['numTokens'] > 0 else -cfg['numTokens'] / (cfg['refillRate'] * 1000)
+            cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
+            return now + delay
+
+    def reserve(self, cost=None):
+        """Consumes the cost right away and returns the number of seconds to wait before the request may proceed"""
+        return max(0.0, self.release_time(cost) - time.time())
+
+    def configure(self, config):
+        """Changes the configuration, like the refillRate, keeping the tokens in the bucket"""
+        with self.lock:
+            self.config.update(config)
+
+    def throttle(self, cost=None):
+        delay = self.reserve(cost)
+        if delay > 0:
+            time.sleep(delay)
+
+
+# -----------------------------------------------------------------------------
+
+shared_token_buckets = {}
+shared_token_buckets_lock = threading.Lock()
+
+
+def shared_token_bucket(key, config=None):
+    """Returns the process-wide token bucket for the key, creating it from the config on first use"""
+    with shared_token_buckets_lock:
+        if key not in shared_token_buckets:
+            shared_token_buckets[key] = TokenBucket(config)
+        return shared_token_buckets[key]
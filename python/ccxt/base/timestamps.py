@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""Conversion of timestamps in milliseconds to ISO 8601 strings and back without datetime objects"""
+
+# -----------------------------------------------------------------------------
+
+import datetime
+import re
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'iso8601',
+    'parse8601',
+]
+
+# -----------------------------------------------------------------------------
+
+ISO8601 = re.compile(
+    r'([0-9]{4})-?([0-9]{2})-?([0-9]{2})(?:T|[\s])?([0-9]{2}):?([0-9]{2}):?([0-9]{2})(\.[0-9]{1,3})?'
+    r'(?:(\+|\-)([0-9]{2})\:?([0-9]{2})|Z)?',
+    re.IGNORECASE)
+
+MIN_SECONDS = -62135596800  # 0001-01-01T00:00:00Z, the range of datetime
+MAX_SECONDS = 253402300799  # 9999-12-31T23:59:59Z
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+CACHE_SIZE = 4096
+
+# recent strings by the second, trades and orders come in bursts of the same second
+formatted_seconds = {}  # seconds → 'YYYY-MM-DDTHH:MM:SS.'
+parsed_seconds = {}  # 'YYYY-MM-DDTHH:MM:SS' → seconds
+
+# -----------------------------------------------------------------------------
+
+
+def days_from_civil(year, month, day):
+    """The number of days from 1970-01-01 to a date of the proleptic gregorian calendar"""
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def civil_from_days(days):
+    """The year, month and day of a number of days since 1970-01-01"""
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 if shifted_month < 10 else shifted_month - 9
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+def days_in_month(year, month):
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return DAYS_IN_MONTH[month]
+
+
+def iso8601(timestamp=None):
+    if timestamp is None:
+        return timestamp
+    if not isinstance(timestamp, int):
+        return None
+    if timestamp < 0:
+        return None
+    seconds = timestamp // 1000
+    prefix = formatted_seconds.get(seconds)
+    if prefix is None:
+        if seconds > MAX_SECONDS:
+            # beyond the year 9999, raises like it always did
+            utc = datetime.datetime.utcfromtimestamp(seconds)
+            return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + '{:03d}'.format(timestamp % 1000) + 'Z'
+        days, second_of_day = divmod(seconds, 86400)
+        year, month, day = civil_from_days(days)
+        hour, second_of_hour = divmod(second_of_day, 3600)
+        minute, second = divmod(second_of_hour, 60)
+        prefix = '%04d-%02d-%02dT%02d:%02d:%02d.' % (year, month, day, hour, minute, second)
+        if len(formatted_seconds) >= CACHE_SIZE:
+            formatted_seconds.clear()
+        formatted_seconds[seconds] = prefix
+    return prefix + '%03d' % (timestamp % 1000) + 'Z'
+
+
+def parse8601(timestamp=None):
+    if timestamp is None:
+        return timestamp
+    try:
+        # the usual YYYY-MM-DDTHH:MM:SS.mmmZ of a second seen before
+        if len(timestamp) == 24 and timestamp[19] == '.' and timestamp[23] in 'Zz':
+            seconds = parsed_seconds.get(timestamp[0:19])
+            milliseconds = timestamp[20:23]
+            if seconds is not None and '0' <= milliseconds[0] <= '9' and '0' <= milliseconds[1] <= '9' and '0' <= milliseconds[2] <= '9':
+                return seconds * 1000 + int(milliseconds)
+        match = ISO8601.search(timestamp)
+    except TypeError:
+        return None
+    if match is None:
+        return None
+    yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
+    year, month, day = int(yyyy), int(mm), int(dd)
+    hour, minute, second = int(h), int(m), int(s)
+    if year < 1 or month < 1 or month > 12 or day < 1 or day > days_in_month(year, month) or hour > 23 or minute > 59 or second > 59:
+        return None
+    # the offset is added, as it always was
+    offset = int(hours or 0) * 3600 + int(minutes or 0) * 60
+    seconds = days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second + (-offset if sign == '-' else offset)
+    if seconds < MIN_SECONDS or seconds > MAX_SECONDS:
+        return None
+    if len(timestamp) == 24 and match.start() == 0 and match.end() == 24 and sign is None and ms is not None and len(ms) == 4:
+        if len(parsed_seconds) >= CACHE_SIZE:
+            parsed_seconds.clear()
+        parsed_seconds[timestamp[0:19]] = seconds
+    return seconds * 1000 + (int(ms[1:]) if ms else 0)
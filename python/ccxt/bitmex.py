@@ -32,6 +32,11 @@ class bitmex (Exchange):
                 'fetchOpenOrders': True,
                 'fetchClosedOrders': True,
             },
+            'pagination': {
+                'fetchOHLCV': {
+                    'limit': 500,  # candles per request
+                },
+            },
             'timeframes': {
                 '1m': '1m',
                 '5m': '5m',
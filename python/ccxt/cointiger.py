@@ -213,6 +213,9 @@ class cointiger (huobipro):
         self.options['marketsByUppercaseId'] = self.index_by(result, 'uppercaseId')
         return result
 
+    def index_markets(self, markets):
+        self.options['marketsByUppercaseId'] = self.index_by(markets, 'uppercaseId')
+
     def parse_ticker(self, ticker, market=None):
         symbol = None
         if market:
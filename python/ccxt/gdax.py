@@ -37,6 +37,32 @@ class gdax (Exchange):
                 'fetchDepositAddress': True,
                 'fetchMyTrades': True,
             },
+            'pagination': {
+                'fetchMyTrades': {
+                    'cursor': 'header',
+                    'header': 'CB-AFTER',
+                    'param': 'after',
+                    'limit': 100,
+                },
+                'fetchOrders': {
+                    'cursor': 'header',
+                    'header': 'CB-AFTER',
+                    'param': 'after',
+                    'limit': 100,
+                },
+                'fetchClosedOrders': {
+                    'cursor': 'header',
+                    'header': 'CB-AFTER',
+                    'param': 'after',
+                    'limit': 100,
+                },
+                'fetchTransactions': {
+                    'cursor': 'header',
+                    'header': 'CB-AFTER',
+                    'param': 'after',
+                    'limit': 100,
+                },
+            },
             'timeframes': {
                 '1m': 60,
                 '5m': 300,
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+# candles from trades: the pure python build_ohlcv loop vs the numpy implementation
+
+import argparse
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from test_build_ohlcv import random_trades  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+modes = [
+    ('python', {'numpyThreshold': float('inf')}),
+    ('numpy, lists', {'numpyThreshold': 0}),
+    ('numpy, array', {'ohlcvFormat': 'numpy'}),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--trades', type=int, default=1000000)
+    parser.add_argument('--timeframe', default='1m')
+    args = parser.parse_args()
+    trades = random_trades(args.trades)
+    Exchange({'ohlcvFormat': 'numpy'}).build_ohlcv(trades[0:10])  # imports numpy
+    for title, config in modes:
+        exchange = Exchange(config)
+        start = time.time()
+        ohlcvs = exchange.build_ohlcv(trades, args.timeframe)
+        elapsed = time.time() - start
+        print('{:<16} {:8d} trades -> {:6d} candles {:8.1f} ms'.format(title, args.trades, len(ohlcvs), elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main()
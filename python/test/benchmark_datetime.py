@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# benchmark of iso8601 and parse8601 on the formats of test_exchange_datetime_functions.py and on a trade history
+
+import argparse
+import ast
+import calendar
+import datetime
+import os
+import re
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.timestamps import iso8601  # noqa: E402
+from ccxt.base.timestamps import parse8601  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def datetime_iso8601(timestamp=None):
+    # the previous implementation through datetime and strftime, for comparison
+    if timestamp is None:
+        return timestamp
+    if not isinstance(timestamp, int):
+        return None
+    if int(timestamp) < 0:
+        return None
+    try:
+        utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
+        return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
+    except (TypeError, OverflowError, OSError):
+        return None
+
+
+def datetime_parse8601(timestamp=None):
+    # the previous implementation building the regex on every call and parsing through strptime and timegm
+    if timestamp is None:
+        return timestamp
+    yyyy = '([0-9]{4})-?'
+    mm = '([0-9]{2})-?'
+    dd = '([0-9]{2})(?:T|[\\s])?'
+    h = '([0-9]{2}):?'
+    m = '([0-9]{2}):?'
+    s = '([0-9]{2})'
+    ms = '(\\.[0-9]{1,3})?'
+    tz = '(?:(\\+|\\-)([0-9]{2})\\:?([0-9]{2})|Z)?'
+    regex = r'' + yyyy + mm + dd + h + m + s + ms + tz
+    try:
+        match = re.search(regex, timestamp, re.IGNORECASE)
+        if match is None:
+            return None
+        yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
+        ms = ms or '.000'
+        msint = int(ms[1:])
+        sign = sign or ''
+        sign = int(sign + '1')
+        hours = int(hours or 0) * sign
+        minutes = int(minutes or 0) * sign
+        offset = datetime.timedelta(hours=hours, minutes=minutes)
+        string = yyyy + mm + dd + h + m + s + ms + 'Z'
+        dt = datetime.datetime.strptime(string, "%Y%m%d%H%M%S.%fZ")
+        dt = dt + offset
+        return calendar.timegm(dt.utctimetuple()) * 1000 + msint
+    except (TypeError, OverflowError, OSError, ValueError):
+        return None
+
+
+def test_arguments():
+    # the arguments of exchange.iso8601 and exchange.parse8601 in the asserts of test_exchange_datetime_functions.py
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_exchange_datetime_functions.py')) as f:
+        tree = ast.parse(f.read())
+    arguments = {'iso8601': [], 'parse8601': []}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in arguments:
+            arguments[node.func.attr].append(tuple(ast.literal_eval(arg) for arg in node.args))
+    return arguments
+
+
+def measure(title, function, calls, repeat):
+    started = time.time()
+    for i in range(0, repeat):
+        for arguments in calls:
+            function(*arguments)
+    elapsed = time.time() - started
+    print('{:<40} {:8.3f} s   {:7.2f} us per call'.format(title, elapsed, elapsed / (len(calls) * repeat) * 1000000))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10000, help='number of runs over the test cases')
+    parser.add_argument('--trades', type=int, default=100000, help='number of trades in the history')
+    args = parser.parse_args()
+    arguments = test_arguments()
+    for name, previous, current in [('iso8601', datetime_iso8601, iso8601), ('parse8601', datetime_parse8601, parse8601)]:
+        for call in arguments[name]:
+            assert(previous(*call) == current(*call))
+        print(len(arguments[name]), name, 'cases of test_exchange_datetime_functions.py,', args.repeat, 'times')
+        measure(name + ' (previous)', previous, arguments[name], args.repeat)
+        measure(name, current, arguments[name], args.repeat)
+    # a trade history with a few trades per second
+    timestamps = [(1530000000000 + i * 250 + i % 7,) for i in range(0, args.trades)]
+    strings = [(datetime_iso8601(*timestamp),) for timestamp in timestamps]
+    print(args.trades, 'trades')
+    measure('iso8601 (previous)', datetime_iso8601, timestamps, 1)
+    measure('iso8601', iso8601, timestamps, 1)
+    measure('parse8601 (previous)', datetime_parse8601, strings, 1)
+    measure('parse8601', parse8601, strings, 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# cold-start import benchmark: lazy exchange loading vs importing all exchanges
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ------------------------------------------------------------------------------
+
+scenarios = [
+    ('import ccxt', 'import ccxt'),
+    ('import ccxt + ccxt.binance()', 'import ccxt; ccxt.binance()'),
+    ('import ccxt + all exchanges (eager)', 'import ccxt; [getattr(ccxt, id) for id in ccxt.exchanges]'),
+    ('import ccxt.async_support', 'import ccxt.async_support'),
+    ('import ccxt.async_support + all exchanges (eager)', 'import ccxt.async_support as ccxt; [getattr(ccxt, id) for id in ccxt.exchanges]'),
+]
+
+
+def measure(statement, runs):
+    env = dict(os.environ, PYTHONPATH=root, PYTHONDONTWRITEBYTECODE='1')
+    timings = []
+    for i in range(0, runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', statement], env=env)
+        timings.append(time.time() - start)
+    return min(timings), sum(timings) / len(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5, help='number of fresh interpreters per scenario')
+    args = parser.parse_args()
+    for title, statement in scenarios:
+        best, mean = measure(statement, args.runs)
+        print('{:<52} best {:8.1f} ms   mean {:8.1f} ms'.format(title, best * 1000, mean * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# micro-benchmark: constructing instances of every exchange class
+
+import argparse
+import os
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def instantiate_all(config):
+    start = time.time()
+    for id in ccxt.exchanges:
+        getattr(ccxt, id)(dict(config))
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rounds', type=int, default=10, help='number of times to instantiate all exchanges')
+    args = parser.parse_args()
+    config = {'apiKey': 'key', 'secret': 'secret'}
+    # the first round includes the import and the per-class setup
+    first = instantiate_all(config)
+    timings = [instantiate_all(config) for i in range(0, args.rounds)]
+    count = len(ccxt.exchanges)
+    print('first round, {} exchanges:   {:8.1f} ms'.format(count, first * 1000))
+    print('next rounds, best:           {:8.1f} ms ({:.3f} ms per instance)'.format(min(timings) * 1000, min(timings) * 1000 / count))
+    print('next rounds, mean:           {:8.1f} ms ({:.3f} ms per instance)'.format(sum(timings) * 1000 / len(timings), sum(timings) * 1000 / len(timings) / count))
+
+
+if __name__ == '__main__':
+    main()
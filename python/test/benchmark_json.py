@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# decoding and encoding benchmark for the json backends on large exchange payloads
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.json_backend import JSON_BACKENDS, get_json_backend, stdlib_dumps  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def synthetic_tickers(count=1000):
+    # shaped like a binance /api/v1/ticker/24hr response
+    result = []
+    for i in range(0, count):
+        price = random.uniform(0.00001, 10000)
+        result.append({
+            'symbol': 'COIN' + str(i) + 'BTC',
+            'priceChange': '%.8f' % random.uniform(-1, 1),
+            'priceChangePercent': '%.3f' % random.uniform(-10, 10),
+            'weightedAvgPrice': '%.8f' % price,
+            'prevClosePrice': '%.8f' % price,
+            'lastPrice': '%.8f' % price,
+            'lastQty': '%.8f' % random.uniform(0, 100),
+            'bidPrice': '%.8f' % price,
+            'askPrice': '%.8f' % price,
+            'openPrice': '%.8f' % price,
+            'highPrice': '%.8f' % price,
+            'lowPrice': '%.8f' % price,
+            'volume': '%.8f' % random.uniform(0, 1000000),
+            'quoteVolume': '%.8f' % random.uniform(0, 1000),
+            'openTime': 1538000000000 + i,
+            'closeTime': 1538086400000 + i,
+            'firstId': 1000000 + i,
+            'lastId': 2000000 + i,
+            'count': 1000000,
+        })
+    return result
+
+
+def synthetic_order_book(depth=5000):
+    # shaped like a bitmex/gdax level 2 snapshot
+    return {
+        'lastUpdateId': 123456789,
+        'bids': [[random.uniform(6000, 6500), random.uniform(0, 10)] for i in range(0, depth)],
+        'asks': [[random.uniform(6500, 7000), random.uniform(0, 10)] for i in range(0, depth)],
+    }
+
+
+def measure(function, argument, rounds):
+    best = None
+    for i in range(0, rounds):
+        start = time.time()
+        function(argument)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rounds', type=int, default=20, help='number of rounds per payload and backend')
+    parser.add_argument('payloads', nargs='*', help='files with recorded responses, synthetic payloads are used if omitted')
+    args = parser.parse_args()
+    payloads = []
+    for path in args.payloads:
+        with open(path, 'rb') as f:
+            payloads.append((os.path.basename(path), f.read()))
+    if not payloads:
+        payloads.append(('tickers (synthetic)', stdlib_dumps(synthetic_tickers()).encode('utf-8')))
+        payloads.append(('order book (synthetic)', stdlib_dumps(synthetic_order_book()).encode('utf-8')))
+    for title, raw in payloads:
+        text = raw.decode('utf-8')
+        print('{} – {:.1f} KB'.format(title, len(raw) / 1024.0))
+        for name in JSON_BACKENDS:
+            loads, dumps = get_json_backend(name)
+            if name != 'json' and loads is get_json_backend('json')[0]:
+                print('    {:<10} not installed'.format(name))
+                continue
+            decoded = loads(raw)
+            print('    {:<10} loads(str) {:8.2f} ms   loads(bytes) {:8.2f} ms   dumps {:8.2f} ms'.format(
+                name,
+                measure(loads, text, args.rounds) * 1000,
+                measure(loads, raw, args.rounds) * 1000,
+                measure(dumps, decoded, args.rounds) * 1000))
+
+
+if __name__ == '__main__':
+    main()
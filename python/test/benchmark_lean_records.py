@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# benchmark of parse_trades with plain dicts and with lean records on binance aggregate trades
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def synthetic_trades(count):
+    # shaped like a binance /api/v1/aggTrades response
+    return [{
+        'a': 26129 + i,
+        'p': '%.8f' % (6500 + (i % 100) * 0.01),
+        'q': '%.8f' % (0.001 * (i % 1000 + 1)),
+        'f': 27781 + i,
+        'l': 27781 + i,
+        'T': 1538000000000 + i * 37,
+        'm': i % 2 == 0,
+        'M': True,
+    } for i in range(0, count)]
+
+
+def measure(exchange, trades, market, rounds):
+    best = None
+    for i in range(0, rounds):
+        start = time.time()
+        exchange.parse_trades(trades, market)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100000, help='number of trades')
+    parser.add_argument('--rounds', type=int, default=5, help='number of rounds per mode')
+    parser.add_argument('--no-gc', action='store_true', help='disable the garbage collector while parsing')
+    args = parser.parse_args()
+    trades = synthetic_trades(args.count)
+    market = {'id': 'BTCUSDT', 'symbol': 'BTC/USDT'}
+    if args.no_gc:
+        gc.disable()
+    for name, config in [('dicts', {}), ('lean records', {'leanRecords': True}), ('lean, no info', {'leanRecords': True, 'recordsInfo': 'drop'})]:
+        elapsed = measure(ccxt.binance(config), trades, market, args.rounds)
+        print('{:16} {:8.1f} ms ({:.3f} us per trade)'.format(name, elapsed * 1000, elapsed * 1000000 / args.count))
+
+
+if __name__ == '__main__':
+    main()
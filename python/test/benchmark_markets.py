@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# memory held by the markets of one instance and the speed of market() lookups, dict markets vs compactMarkets
+
+import argparse
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from benchmark_markets_memory import synthetic_markets  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+modes = [
+    ('dict', {}),
+    ('compact, info kept', {'compactMarkets': True, 'marketsInfo': 'keep'}),
+    ('compact, lazy info', {'compactMarkets': True, 'marketsInfo': 'lazy'}),
+    ('compact, info dropped', {'compactMarkets': True, 'marketsInfo': 'drop'}),
+]
+
+
+def load(config, count):
+    exchange = ccxt.binance(config)
+    exchange.has = exchange.extend(exchange.has, {'fetchCurrencies': False})
+    gc.collect()
+    tracemalloc.start()
+    markets = synthetic_markets(count)
+    exchange.set_markets(markets)
+    del markets
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return exchange, current
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--markets', type=int, default=1000)
+    parser.add_argument('--lookups', type=int, default=200000)
+    args = parser.parse_args()
+    for title, config in modes:
+        exchange, memory = load(config, args.markets)
+        symbols = exchange.symbols
+
+        def lookup():
+            for symbol in symbols:
+                exchange.market(symbol)['precision']['price']
+
+        seconds = min(timeit.repeat(lookup, number=max(1, args.lookups // len(symbols)), repeat=3))
+        print('{:<24} {:8.2f} MB   {:6.0f} ns per market() lookup'.format(
+            title, memory / 1024.0 / 1024.0, seconds * 1e9 / (max(1, args.lookups // len(symbols)) * len(symbols))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# memory held by the markets of many instances of the same exchange, with and without shareMarkets
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.market_registry import clear_market_registry  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def synthetic_markets(count):
+    # shaped like the markets of binance, without hitting the network
+    quotes = ['BTC', 'ETH', 'BNB', 'USDT']
+    markets = []
+    for i in range(0, count):
+        base = 'C' + str(i)
+        quote = quotes[i % len(quotes)]
+        markets.append({
+            'id': base + quote,
+            'symbol': base + '/' + quote,
+            'base': base,
+            'quote': quote,
+            'baseId': base,
+            'quoteId': quote,
+            'active': True,
+            'precision': {'base': 8, 'quote': 8, 'amount': 2, 'price': 6},
+            'limits': {
+                'amount': {'min': 0.01, 'max': 90000000.0},
+                'price': {'min': 1e-06, 'max': None},
+                'cost': {'min': 0.001, 'max': None},
+            },
+            'info': {
+                'symbol': base + quote,
+                'status': 'TRADING',
+                'baseAsset': base,
+                'baseAssetPrecision': 8,
+                'quoteAsset': quote,
+                'quotePrecision': 8,
+                'orderTypes': ['LIMIT', 'LIMIT_MAKER', 'MARKET', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT'],
+                'icebergAllowed': True,
+                'filters': [
+                    {'filterType': 'PRICE_FILTER', 'minPrice': '0.00000100', 'maxPrice': '100000.00000000', 'tickSize': '0.00000100'},
+                    {'filterType': 'LOT_SIZE', 'minQty': '0.01000000', 'maxQty': '90000000.00000000', 'stepSize': '0.01000000'},
+                    {'filterType': 'MIN_NOTIONAL', 'minNotional': '0.00100000'},
+                ],
+            },
+        })
+    return markets
+
+
+def measure(instances, count, share):
+    clear_market_registry()
+    gc.collect()
+    tracemalloc.start()
+    exchanges = []
+    for i in range(0, instances):
+        exchange = ccxt.binance({'shareMarkets': share, 'apiKey': 'key' + str(i)})
+        exchange.fetch_markets = lambda: synthetic_markets(count)
+        exchange.has = exchange.extend(exchange.has, {'fetchCurrencies': False})
+        exchange.load_markets()
+        exchanges.append(exchange)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--instances', type=int, default=50)
+    parser.add_argument('--markets', type=int, default=400, help='number of markets per instance')
+    args = parser.parse_args()
+    for share in (False, True):
+        current = measure(args.instances, args.markets, share)
+        print('{:<20} {:4d} instances {:8.1f} MB'.format('shareMarkets=' + str(share), args.instances, current / 1024.0 / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
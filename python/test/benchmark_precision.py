@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# benchmark of decimal_to_precision and of the precompiled precision formatters on the cases of test_decimal_to_precision.py
+
+import argparse
+import ast
+import decimal
+import itertools
+import numbers
+import os
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base import decimal_to_precision as module  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import precision_formatter  # noqa: E402
+from ccxt.base.decimal_to_precision import cached_decimal_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import decimals_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND, DECIMAL_PLACES, SIGNIFICANT_DIGITS, NO_PADDING, PAD_WITH_ZERO  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def global_context_decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    # the previous implementation, changing the global decimal context on every call, for comparison
+    assert precision is not None and isinstance(precision, numbers.Integral)
+    assert rounding_mode in [TRUNCATE, ROUND]
+    assert counting_mode in [DECIMAL_PLACES, SIGNIFICANT_DIGITS]
+    assert padding_mode in [NO_PADDING, PAD_WITH_ZERO]
+
+    context = decimal.getcontext()
+
+    precision = min(context.prec - 2, precision)
+
+    # all default except decimal.Underflow (raised when a number is rounded to zero)
+    context.traps[decimal.Underflow] = True
+    context.rounding = decimal.ROUND_HALF_UP  # rounds 0.5 away from zero
+
+    dec = decimal.Decimal(n)
+    string = str(dec)
+    precise = None
+
+    def power_of_10(x):
+        return decimal.Decimal('10') ** (-x)
+
+    if rounding_mode == ROUND:
+        if counting_mode == DECIMAL_PLACES:
+            precise = str(dec.quantize(power_of_10(precision)))  # ROUND_HALF_EVEN is default context
+        elif counting_mode == SIGNIFICANT_DIGITS:
+            q = precision - dec.adjusted() - 1
+            sigfig = power_of_10(q)
+            if q < 0:
+                string_to_precision = string[:precision]
+                # string_to_precision is '' when we have zero precision
+                below = sigfig * decimal.Decimal(string_to_precision if string_to_precision else '0')
+                above = below + sigfig
+                precise = str(min((below, above), key=lambda x: abs(x - dec)))
+            else:
+                precise = str(dec.quantize(sigfig))
+
+    elif rounding_mode == TRUNCATE:
+        # Slice a string
+        if counting_mode == DECIMAL_PLACES:
+            before, after = string.split('.') if '.' in string else (string, '')
+            precise = before + '.' + after[:precision]
+        elif counting_mode == SIGNIFICANT_DIGITS:
+            if precision == 0:
+                return '0'
+            dot = string.index('.') if '.' in string else 0
+            start = dot - dec.adjusted()
+            end = start + precision
+            # need to clarify these conditionals
+            if dot >= end:
+                end -= 1
+            if precision >= len(string.replace('.', '')):
+                precise = string
+            else:
+                precise = string[:end].ljust(dot, '0')
+        precise = precise.rstrip('.')
+
+    if padding_mode == NO_PADDING:
+        return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+    elif padding_mode == PAD_WITH_ZERO:
+        if '.' in precise:
+            if counting_mode == DECIMAL_PLACES:
+                before, after = precise.split('.')
+                return before + '.' + after.ljust(precision, '0')
+
+            elif counting_mode == SIGNIFICANT_DIGITS:
+                fsfg = len(list(itertools.takewhile(lambda x: x == '.' or x == '0', precise)))
+                if '.' in precise[fsfg:]:
+                    precision += 1
+                return precise[:fsfg] + precise[fsfg:].rstrip('0').ljust(precision, '0')
+        else:
+            if counting_mode == SIGNIFICANT_DIGITS:
+                if precision > len(precise):
+                    return precise + '.' + (precision - len(precise)) * '0'
+            elif counting_mode == DECIMAL_PLACES:
+                if precision > 0:
+                    return precise + '.' + precision * '0'
+            return precise
+
+
+def test_cases():
+    names = dict((name, getattr(module, name)) for name in module.__all__)
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_decimal_to_precision.py')) as f:
+        tree = ast.parse(f.read())
+    cases = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Compare) and isinstance(node.left, ast.Call) and getattr(node.left.func, 'id', None) == 'decimal_to_precision':
+            cases.append([ast.literal_eval(arg) if not isinstance(arg, ast.Name) else names[arg.id] for arg in node.left.args])
+    return cases
+
+
+def measure(title, function, calls, repeat):
+    started = time.time()
+    for i in range(0, repeat):
+        for arguments in calls:
+            function(*arguments)
+    elapsed = time.time() - started
+    count = len(calls) * repeat
+    print('{:<45} {:8.3f} s   {:7.2f} us per call'.format(title, elapsed, elapsed / count * 1000000))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=2000, help='number of runs over the test cases')
+    args = parser.parse_args()
+    cases = test_cases()
+    for arguments in cases:
+        assert(global_context_decimal_to_precision(*arguments) == decimal_to_precision(*arguments))
+    compiled = [(precision_formatter(*arguments[1:]), arguments[0]) for arguments in cases]
+    print(len(cases), 'cases of test_decimal_to_precision.py,', args.repeat, 'times')
+    previous = measure('decimal_to_precision (previous)', global_context_decimal_to_precision, cases, args.repeat)
+    measure('decimal_to_precision', decimal_to_precision, cases, args.repeat)
+    measure('cached_decimal_to_precision', cached_decimal_to_precision, cases, args.repeat)
+    current = measure('precision_formatter', lambda formatter, n: formatter(n), compiled, args.repeat)
+    print('precompiled formatters are {:.1f} times faster'.format(previous / current))
+    # the precision methods of the exchange
+    exchange = Exchange({'id': 'benchmark'})
+    exchange.set_markets([{'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'precision': {'price': 2, 'amount': 8}}])
+    prices = [('BTC/USD', 6000 + i * 0.001) for i in range(0, 1000)]
+    repeat = max(1, args.repeat // 10)
+
+    def previous_price_to_precision(symbol, price):
+        return ('{:.' + str(exchange.markets[symbol]['precision']['price']) + 'f}').format(float(price))
+
+    def previous_amount_to_precision(symbol, amount):
+        return exchange.truncate(amount, exchange.markets[symbol]['precision']['amount'])
+
+    measure('price_to_precision (previous)', previous_price_to_precision, prices, repeat)
+    measure('price_to_precision', exchange.price_to_precision, prices, repeat)
+    measure('amount_to_precision (previous)', previous_amount_to_precision, prices, repeat)
+    measure('amount_to_precision', exchange.amount_to_precision, prices, repeat)
+    # a ladder of orders at once
+    ladder = [price for symbol, price in prices]
+    for rounding_mode, counting_mode, title in [(ROUND, DECIMAL_PLACES, 'round'), (TRUNCATE, SIGNIFICANT_DIGITS, 'truncate significant')]:
+        measure('decimal_to_precision ' + title, lambda: [decimal_to_precision(price, rounding_mode, 2, counting_mode) for price in ladder], [()], repeat)
+        measure('decimals_to_precision ' + title, lambda: decimals_to_precision(ladder, rounding_mode, 2, counting_mode), [()], repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# benchmark of the asyncio throttle with many concurrent exchanges sharing one event loop
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.async_support.base.throttle import throttle  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def polling_throttle(config=None):
+    # the previous implementation, polling the bucket every millisecond, for comparison
+
+    cfg = {
+        'lastTimestamp': time.time(),
+        'numTokens': 0,
+        'running': False,
+        'queue': asyncio.Queue(),
+        'delay': 0.001,
+        'refillRate': 0.001,
+        'defaultCost': 1.000,
+        'capacity': 1.000,
+    }
+
+    cfg.update(config)
+
+    async def run():
+        if not cfg['running']:
+            cfg['running'] = True
+            while not cfg['queue'].empty():
+                now = time.time()
+                elapsed = (now - cfg['lastTimestamp'])
+                cfg['lastTimestamp'] = now
+                cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
+                if cfg['numTokens'] > 0:
+                    if not cfg['queue'].empty():
+                        cost, future = cfg['queue'].get_nowait()
+                        cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
+                        if not future.done():
+                            future.set_result(None)
+                await asyncio.sleep(cfg['delay'])
+            cfg['running'] = False
+
+    def throttle(cost=None):
+        future = asyncio.Future()
+        cfg['queue'].put_nowait((cost, future))
+        asyncio.ensure_future(run())
+        return future
+
+    return throttle
+
+
+async def exchange(factory, rate_limit, requests, cost, lateness):
+    limiter = factory({'refillRate': 1.0 / rate_limit, 'capacity': 1.0, 'defaultCost': 1.0})
+    start = time.time()
+    for i in range(0, requests):
+        await limiter(cost)
+        # how late the request is released compared to the ideal schedule
+        expected = start + i * rate_limit * cost / 1000.0
+        lateness.append(max(0.0, time.time() - expected))
+
+
+async def run(factory, exchanges, requests, rate_limit, cost):
+    lateness = []
+    await asyncio.gather(*[exchange(factory, rate_limit, requests, cost, lateness) for i in range(0, exchanges)])
+    return lateness
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--exchanges', type=int, default=200, help='number of concurrent exchange throttles')
+    parser.add_argument('--requests', type=int, default=20, help='number of requests per exchange')
+    parser.add_argument('--rateLimit', type=float, default=50, help='milliseconds between requests')
+    parser.add_argument('--cost', type=float, default=1, help='cost of each request')
+    args = parser.parse_args()
+    for title, factory in [('polling (previous)', polling_throttle), ('event-driven', throttle)]:
+        wall, cpu = time.time(), time.process_time()
+        lateness = asyncio.get_event_loop().run_until_complete(run(factory, args.exchanges, args.requests, args.rateLimit, args.cost))
+        wall, cpu = time.time() - wall, time.process_time() - cpu
+        lateness.sort()
+        print('{:<20} wall {:7.2f} s   cpu {:7.2f} s   lateness p50 {:7.2f} ms   p99 {:7.2f} ms'.format(
+            title, wall, cpu, lateness[len(lateness) // 2] * 1000, lateness[int(len(lateness) * 0.99)] * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# startup time and peak RSS with and without loading web3 for the ethereum methods
+
+import argparse
+import os
+import subprocess
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ------------------------------------------------------------------------------
+
+# each statement prints its own wall time and peak RSS
+measure = '''
+import resource, time
+start = time.time()
+{}
+elapsed = time.time() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+'''
+
+scenarios = [
+    ('10 x ccxt.binance(), web3 untouched', 'import ccxt; exchanges = [ccxt.binance() for i in range(0, 10)]'),
+    ('10 x ccxt.binance(), web3 loaded (previous behaviour)', 'import ccxt; exchanges = [ccxt.binance() for i in range(0, 10)]; [e.web3 for e in exchanges]'),
+]
+
+
+def run(statement, runs):
+    env = dict(os.environ, PYTHONPATH=root)
+    results = []
+    for i in range(0, runs):
+        output = subprocess.check_output([sys.executable, '-c', measure.format(statement)], env=env)
+        elapsed, rss = output.decode().split()
+        results.append((float(elapsed), int(rss)))
+    return min(results)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5, help='number of fresh interpreters per scenario')
+    args = parser.parse_args()
+    print('web3 is available' if subprocess.call([sys.executable, '-c', 'from web3 import Web3'], stderr=subprocess.DEVNULL) == 0 else 'web3 is not installed or fails to import')
+    for title, statement in scenarios:
+        elapsed, rss = run(statement, args.runs)
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        rss_mb = rss / (1024.0 * 1024.0) if sys.platform == 'darwin' else rss / 1024.0
+        print('{:<56} {:8.1f} ms {:8.1f} MB peak RSS'.format(title, elapsed * 1000, rss_mb))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class scaled(Exchange):
+
+    def parse_bid_ask(self, bidask, price_key=0, amount_key=1):
+        return [bidask[price_key] / 100.0, bidask[amount_key] / 100.0]
+
+    def parse_ohlcv(self, ohlcv, market=None, timeframe='1m', since=None, limit=None):
+        return [ohlcv['time'], ohlcv['open'], ohlcv['high'], ohlcv['low'], ohlcv['close'], ohlcv['volume']]
+
+
+class flat(Exchange):
+
+    def parse_bids_asks(self, orders, price_key=0, amount_key=1):
+        return [[orders[i + price_key], orders[i + amount_key]] for i in range(0, len(orders), 2)]
+
+
+raw_order_book = {
+    'bids': [['100.5', '1.0', 3], ['101.0', '2.0', 1], ['99.0', '0.0', 1], ['101.0', '0.5', 2]],
+    'asks': [['103.0', '1.0', 1], ['102.0', '2.0', 1]],
+}
+
+raw_ohlcvs = [
+    [1530000120000, '3', '4', '2', '3.5', '10', 'extra'],
+    [1530000000000, '1', '2', '0.5', '1.5', '20', 'extra'],
+    [1530000060000, '2', '3', '1', '2.5', '30', 'extra'],
+]
+
+if numpy:
+
+    exchange = Exchange({'id': 'arrays', 'orderBookFormat': 'numpy', 'ohlcvFormat': 'numpy'})
+    lists = Exchange({'id': 'lists'})
+
+    # order books are (n, 2) float64 arrays with the same levels as the lists
+
+    book = exchange.parse_order_book(raw_order_book, 1530000000000)
+    for side in ('bids', 'asks'):
+        assert(book[side].dtype == numpy.float64)
+        assert(book[side].flags['C_CONTIGUOUS'])
+        assert(book[side].shape[1] == 2)
+        # unlike the lists, the arrays never contain levels with a zero amount like '0.0'
+        expected = [level for level in lists.parse_order_book(raw_order_book, 1530000000000)[side] if level[1]]
+        assert(book[side].tolist() == expected)
+    assert(book['datetime'] == '2018-06-26T08:00:00.000Z')
+    assert(exchange.parse_order_book({'bids': [], 'asks': []})['bids'].shape == (0, 2))
+    swapped = exchange.parse_order_book({'bids': [['1', '10'], ['2', '20']], 'asks': []}, None, 'bids', 'asks', 1, 0)
+    assert(swapped['bids'].tolist() == [[20.0, 2.0], [10.0, 1.0]])
+    dicts = exchange.parse_order_book({'bids': [{'price': '1', 'amount': '2'}], 'asks': [{'price': '3', 'amount': 4}]}, None, 'bids', 'asks', 'price', 'amount')
+    assert(dicts['bids'].tolist() == [[1.0, 2.0]] and dicts['asks'].tolist() == [[3.0, 4.0]])
+
+    # levels at the same price are summed up for the L2 book
+
+    exchange.fetch_order_book = lambda symbol, limit=None, params={}: exchange.parse_order_book(raw_order_book)
+    l2 = exchange.fetch_l2_order_book('BTC/USD')
+    assert(l2['bids'].tolist() == [[101.0, 2.5], [100.5, 1.0]])
+    assert(l2['asks'].tolist() == [[102.0, 2.0], [103.0, 1.0]])
+
+    # exchange-specific parse_bid_ask and parse_bids_asks are used
+
+    scaled_book = scaled({'orderBookFormat': 'numpy'}).parse_order_book({'bids': [[10000, 150]], 'asks': [[10100, 50]]})
+    assert(scaled_book['bids'].tolist() == [[100.0, 1.5]])
+    flat_book = flat({'orderBookFormat': 'numpy'}).parse_order_book({'bids': ['1', '2', '3', '4'], 'asks': []})
+    assert(flat_book['bids'].tolist() == [[3.0, 4.0], [1.0, 2.0]])
+
+    # candles are (n, 6) float64 arrays, filtered and limited like the lists
+
+    for since, limit in ((None, None), (1530000060000, None), (None, 2), (1530000060000, 1)):
+        array = exchange.parse_ohlcvs(raw_ohlcvs, None, '1m', since, limit)
+        assert(array.dtype == numpy.float64 and array.shape[1] == 6)
+        expected = [[float(value) for value in ohlcv] for ohlcv in lists.parse_ohlcvs(raw_ohlcvs, None, '1m', since, limit)]
+        assert(array.tolist() == expected)
+
+    # exchanges overriding parse_ohlcv still work
+
+    candles = scaled({'ohlcvFormat': 'numpy'}).parse_ohlcvs([
+        {'time': 1530000060000, 'open': 2, 'high': 3, 'low': 1, 'close': 2.5, 'volume': 30},
+        {'time': 1530000000000, 'open': 1, 'high': 2, 'low': 0.5, 'close': 1.5, 'volume': 20},
+    ])
+    assert(candles[:, 0].tolist() == [1530000000000, 1530000060000])
+    assert(candles[1].tolist() == [1530000060000, 2, 3, 1, 2.5, 30])
+
+# the base methods are not overridden by the base class
+
+assert(not Exchange.overrides('parse_ohlcv'))
+assert(scaled.overrides('parse_ohlcv') and scaled.overrides('parse_bid_ask'))
+assert(not flat.overrides('parse_bid_ask'))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.session import close_shared_sessions  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+async def test_sessions():
+
+    # every instance has a session of its own by default, with the connector settings applied
+
+    first = Exchange({'id': 'pooled', 'tcpConnectorLimit': 20, 'tcpConnectorLimitPerHost': 5, 'dnsCacheTTL': 60})
+    second = Exchange({'id': 'pooled'})
+    assert(first.session is not second.session)
+    connector = first.session.connector
+    assert(connector.limit == 20)
+    assert(connector.limit_per_host == 5)
+    assert(connector.use_dns_cache)
+    # the SSL context is created once for all connectors
+    assert(connector._ssl is second.session.connector._ssl)
+    await first.close()
+    await second.close()
+    assert(first.session is None)
+
+    # shared sessions are not closed by the instances using them
+
+    shared = [Exchange({'id': 'shared' + str(i), 'shareSession': True}) for i in range(0, 3)]
+    session = shared[0].session
+    assert(all([exchange.session is session for exchange in shared]))
+    await shared[0].close()
+    assert(not session.closed)
+    assert(shared[1].session is session)
+    await close_shared_sessions()
+    assert(session.closed)
+
+    # a closed shared session is replaced on open
+
+    shared[1].open()
+    assert(shared[1].session is not session)
+    assert(not shared[1].session.closed)
+    await close_shared_sessions()
+
+    # a session passed in the config is neither replaced nor closed
+
+    exchange = Exchange({'id': 'custom', 'session': session})
+    exchange.open()
+    assert(exchange.session is session)
+    await exchange.close()
+    assert(exchange.session is None)
+
+
+asyncio.get_event_loop().run_until_complete(test_sessions())
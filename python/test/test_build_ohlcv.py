@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def random_trades(count, start=1530000000000, unordered=0):
+    random.seed(count)
+    trades = []
+    timestamp = start
+    for i in range(0, count):
+        timestamp += random.randint(0, 20000)
+        trades.append({
+            'timestamp': timestamp - (random.randint(0, 120000) if random.random() < unordered else 0),
+            'price': round(random.uniform(6000, 7000), 2),
+            'amount': round(random.uniform(0.001, 2), 3),
+        })
+    return trades
+
+
+def assert_candles_equal(actual, expected):
+    assert(len(actual) == len(expected))
+    for a, b in zip(actual, expected):
+        assert(a[0:5] == b[0:5])
+        assert(abs(a[5] - b[5]) < 1e-9)
+
+
+python = Exchange({'id': 'python', 'numpyThreshold': float('inf')})
+
+# resampling lists of candles
+
+ohlcvs5 = [
+    [1530000000000, 1.0, 3.0, 0.5, 2.0, 10.0],
+    [1530000300000, 2.0, 4.0, 1.5, 3.0, 20.0],
+    [1530000600000, 3.0, 3.5, None, 2.5, None],
+    [1530000900000, 2.5, 5.0, 2.0, 4.0, 5.0],
+]
+assert(python.resample_ohlcv(ohlcvs5, '15m') == [
+    [1530000000000, 1.0, 4.0, 0.5, 2.5, 30.0],
+    [1530000900000, 2.5, 5.0, 2.0, 4.0, 5.0],
+])
+assert(python.resample_ohlcv([], '1h') == [])
+
+if numpy:
+
+    vectorized = Exchange({'id': 'vectorized', 'numpyThreshold': 0})
+    arrays = Exchange({'id': 'arrays', 'ohlcvFormat': 'numpy'})
+
+    # the numpy implementation agrees with the pure python one, with trades out of order, since and limit
+
+    for count, unordered in ((0, 0), (1, 0), (2, 0), (1000, 0), (1000, 0.1)):
+        trades = random_trades(count, unordered=unordered)
+        for timeframe in ('1m', '5m', '1h'):
+            for since, limit in ((None, None), (1530000600000, None), (None, 500), (1530000600000, 300)):
+                expected = python.build_ohlcv(trades, timeframe, since, limit)
+                actual = vectorized.build_ohlcv(trades, timeframe, since, limit)
+                assert_candles_equal(actual, expected)
+                assert(all([isinstance(ohlcv[0], int) for ohlcv in actual]))
+                array = arrays.build_ohlcv(trades, timeframe, since, limit)
+                assert(array.shape == (len(expected), 6))
+                assert_candles_equal(array.tolist(), expected)
+
+    # resampling arrays, missing values are skipped
+
+    resampled = arrays.resample_ohlcv(numpy.array(ohlcvs5, dtype=numpy.float64), '15m')
+    assert(resampled.tolist() == python.resample_ohlcv(ohlcvs5, '15m'))
+    candles = python.build_ohlcv(random_trades(2000), '1m')
+    assert_candles_equal(arrays.resample_ohlcv(numpy.array(candles), '1h').tolist(), python.resample_ohlcv(candles, '1h'))
+    assert_candles_equal(python.resample_ohlcv(candles, '1h'), python.build_ohlcv(random_trades(2000), '1h'))
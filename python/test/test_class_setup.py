@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# instances constructed concurrently by several threads all see the complete per-class setup
+
+if hasattr(sys, 'setswitchinterval'):
+    sys.setswitchinterval(1e-6)  # switch threads often to run into a partial setup if there is one
+
+for trial in range(0, 30):
+    klass = type('binance' + str(trial), (ccxt.binance,), {})
+    start = threading.Event()
+    instances = []
+    errors = []
+
+    def construct():
+        start.wait()
+        try:
+            exchange = klass()
+            exchange.fetchTicker
+            exchange.publicGetTicker24hr
+            instances.append(exchange)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=construct) for i in range(0, 8)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+    assert(errors == [])
+    assert(len(instances) == 8)
+
+# the lists and dicts of the cached describe() result are not shared between instances
+
+first = ccxt.binance()
+second = ccxt.binance()
+first.countries.append('XX')
+first.urls['api']['public'] = 'https://example.com'
+assert('XX' not in second.countries)
+assert('XX' not in ccxt.binance().countries)
+assert(second.urls['api']['public'] != 'https://example.com')
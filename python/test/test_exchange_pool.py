@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt.async_support as ccxt  # noqa: E402
+from ccxt.base.errors import ExchangeNotAvailable  # noqa: E402
+from ccxt.base.errors import RequestTimeout  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+active = {'now': 0, 'max': 0}
+
+
+class bootstrap(ccxt.Exchange):
+
+    def __init__(self, config={}):
+        super(bootstrap, self).__init__(config)
+        self.delay = 0.02
+        self.failure = None
+        self.events = []
+
+    async def request_markets(self, name, result):
+        active['now'] += 1
+        active['max'] = max(active['max'], active['now'])
+        try:
+            self.events.append('start ' + name)
+            await asyncio.sleep(self.delay)
+            if self.failure:
+                raise self.failure
+            self.events.append('end ' + name)
+            return result
+        finally:
+            active['now'] -= 1
+
+    async def fetch_markets(self):
+        return await self.request_markets('markets', [{'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD'}])
+
+    async def fetch_currencies(self, params={}):
+        self.events.append('currencies')
+        await asyncio.sleep(self.delay)
+        return {'BTC': {'id': 'btc', 'code': 'BTC'}, 'USD': {'id': 'usd', 'code': 'USD'}}
+
+
+loop = asyncio.get_event_loop()
+
+# the currencies are fetched once, after the markets
+
+exchange = bootstrap({'id': 'bootstrap', 'has': {'fetchCurrencies': True}})
+loop.run_until_complete(exchange.load_markets())
+assert(exchange.events == ['start markets', 'end markets', 'currencies'])
+assert(sorted(exchange.currencies.keys()) == ['BTC', 'USD'])
+assert(exchange.symbols == ['BTC/USD'])
+loop.run_until_complete(exchange.close())
+
+# partial results, at most concurrency exchanges at a time
+
+exchanges = [bootstrap({'id': 'exchange' + str(i)}) for i in range(0, 8)]
+exchanges[1].failure = ExchangeNotAvailable('exchange1 is down')
+exchanges[2].delay = 1.0
+pool = ccxt.ExchangePool(exchanges, concurrency=3, timeout=200)
+assert(len(pool) == 8)
+assert(pool['exchange0'] is exchanges[0])
+started = pool['exchange0'].milliseconds()
+loaded = loop.run_until_complete(pool.load_markets())
+assert(pool['exchange0'].milliseconds() - started < 900)
+assert(sorted(loaded.keys()) == sorted(['exchange' + str(i) for i in range(0, 8) if i not in (1, 2)]))
+assert(isinstance(pool.errors['exchange1'], ExchangeNotAvailable))
+assert(isinstance(pool.errors['exchange2'], RequestTimeout))
+assert(active['max'] == 3)
+assert(active['now'] == 0)  # the slow one was cancelled
+
+# retrying the failed ones
+
+exchanges[1].failure = None
+exchanges[2].delay = 0.01
+assert(len(loop.run_until_complete(pool.load_markets())) == 8)
+assert(pool.errors == {})
+loop.run_until_complete(pool.close())
+
+# exchanges by id with a common config and configs by id
+
+
+async def bootstrap_by_id():
+    async with ccxt.ExchangePool({'binance': {'timeout': 1234}, 'kraken': None}, {'enableRateLimit': True}) as pool:
+        assert(sorted([exchange.id for exchange in pool]) == ['binance', 'kraken'])
+        assert(pool['binance'].timeout == 1234)
+        assert(pool['kraken'].enableRateLimit)
+    pool = ccxt.ExchangePool(['bitfinex'])
+    assert(pool['bitfinex'].id == 'bitfinex')
+    await pool.close()
+
+
+loop.run_until_complete(bootstrap_by_id())
+
+# one exchange more than once, by names of its own, the errors are kept apart
+
+
+async def bootstrap_by_name():
+    main = bootstrap({'id': 'bootstrap', 'apiKey': 'main'})
+    hedge = bootstrap({'id': 'bootstrap', 'apiKey': 'hedge'})
+    hedge.failure = ExchangeNotAvailable('hedge is down')
+    pool = ccxt.ExchangePool({'main': main, 'hedge': hedge})
+    loaded = await pool.load_markets()
+    assert(list(loaded.keys()) == ['main'])
+    assert(list(pool.errors.keys()) == ['hedge'])
+    await pool.close()
+    async with ccxt.ExchangePool([('first', {'exchange': 'binance', 'apiKey': 'first'}), ('second', {'exchange': 'binance', 'apiKey': 'second'})]) as pool:
+        assert(pool['first'].id == 'binance' and pool['first'].apiKey == 'first')
+        assert(pool['second'].id == 'binance' and pool['second'].apiKey == 'second')
+        assert(not hasattr(pool['first'], 'exchange'))
+    try:
+        ccxt.ExchangePool([main, hedge])
+        assert(False)
+    except ValueError:
+        pass
+
+
+loop.run_until_complete(bootstrap_by_name())
+
+# the exchanges created before one that cannot be created are closed, the ones passed in are not
+
+
+class recorded(ccxt.ExchangePool):
+
+    created = []
+
+    @staticmethod
+    def create_exchange(id, config={}):
+        exchange = ccxt.ExchangePool.create_exchange(id, config)
+        recorded.created.append(exchange)
+        return exchange
+
+
+async def bootstrap_failure():
+    passed = bootstrap({'id': 'bootstrap'})
+    try:
+        recorded([passed, 'binance', 'kraken', 'nonexistent'])
+        assert(False)
+    except AttributeError:
+        pass
+    await asyncio.sleep(0.01)
+    assert([exchange.id for exchange in recorded.created] == ['binance', 'kraken'])
+    assert(all([exchange.session is None for exchange in recorded.created]))
+    assert(passed.session is not None)
+    await passed.close()
+
+
+loop.run_until_complete(bootstrap_failure())
+recorded.created = []
+try:
+    recorded(['binance', 'binance'])
+    assert(False)
+except ValueError:
+    pass
+assert(len(recorded.created) == 1 and recorded.created[0].session is None)
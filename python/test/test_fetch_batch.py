@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.errors import NotSupported  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+symbols = ['COIN' + str(i) + '/BTC' for i in range(0, 12)]
+markets = [{'id': 'coin' + str(i) + '_btc', 'symbol': symbol, 'base': 'COIN' + str(i), 'quote': 'BTC'} for i, symbol in enumerate(symbols)]
+
+
+def book(symbol):
+    return {'symbol': symbol, 'bids': [], 'asks': []}
+
+
+class books(Exchange):
+
+    def __init__(self, config={}):
+        super(books, self).__init__(config)
+        self.requests = []
+
+    def fetch_markets(self):
+        return markets
+
+    def fetch_order_books(self, symbols=None, params={}):
+        self.requests.append(symbols)
+        return dict((symbol, book(symbol)) for symbol in (symbols or self.symbols))
+
+    def fetch_order_book(self, symbol, limit=None, params={}):
+        self.requests.append(symbol)
+        return book(symbol)
+
+    def fetch_tickers(self, symbols=None, params={}):
+        self.requests.append(symbols)
+        # ignores the symbols and returns all tickers
+        return dict((symbol, {'symbol': symbol}) for symbol in self.symbols)
+
+
+class async_books(AsyncExchange):
+
+    def __init__(self, config={}):
+        super(async_books, self).__init__(config)
+        self.requests = []
+
+    async def fetch_markets(self):
+        return markets
+
+    async def fetch_order_books(self, symbols=None, params={}):
+        await asyncio.sleep(0)
+        self.requests.append(symbols)
+        return dict((symbol, book(symbol)) for symbol in symbols)
+
+    async def fetch_order_book(self, symbol, limit=None, params={}):
+        await asyncio.sleep(0)
+        self.requests.append(symbol)
+        return book(symbol)
+
+
+# chunks by the number of symbols and by the length of the joined ids
+
+exchange = books({'id': 'books', 'batch': {'fetchOrderBooks': {'symbols': 5}}})
+exchange.load_markets()
+assert(exchange.batch_chunks('fetchOrderBooks', symbols) == [symbols[0:5], symbols[5:10], symbols[10:12]])
+
+exchange = books({'id': 'books', 'batch': {'fetchOrderBooks': {'length': 40}}})
+exchange.load_markets()
+# 'coin0_btc,coin1_btc,coin2_btc,coin3_btc' is 39 characters long, 'coin10_btc' is 10
+chunks = exchange.batch_chunks('fetchOrderBooks', symbols)
+assert(chunks == [symbols[0:4], symbols[4:8], symbols[8:11], symbols[11:12]])
+for chunk in chunks:
+    assert(len(','.join([exchange.markets[symbol]['id'] for symbol in chunk])) <= 40)
+
+# batch requests
+
+exchange = books({'id': 'books', 'has': {'fetchOrderBooks': True}, 'batch': {'fetchOrderBooks': {'symbols': 5}}})
+result = exchange.fetch_batch('fetch_order_books', symbols[0:7])
+assert(sorted(result.keys()) == sorted(symbols[0:7]))
+assert(exchange.requests == [symbols[0:5], symbols[5:7]])
+
+exchange.requests = []
+assert(len(exchange.fetchBatch('fetchOrderBooks')) == len(symbols))  # all symbols
+assert(len(exchange.requests) == 3)
+
+# the results are filtered to the requested symbols
+
+exchange = books({'id': 'books', 'has': {'fetchTickers': True}})
+result = exchange.fetch_batch('fetch_tickers', symbols[0:2])
+assert(sorted(result.keys()) == symbols[0:2])
+assert(exchange.requests == [symbols[0:2]])
+
+# the single symbol method is called when there is no batch method
+
+exchange = books({'id': 'books'})
+result = exchange.fetch_batch('fetch_order_books', symbols[0:3])
+assert(sorted(result.keys()) == symbols[0:3])
+assert(exchange.requests == symbols[0:3])
+
+try:
+    exchange.fetch_batch('fetch_trades', symbols[0:3])
+    assert(False)
+except NotSupported:
+    pass
+
+# the chunks and the single symbol requests run concurrently in async mode
+
+
+async def fetch(exchange, *args):
+    result = await exchange.fetch_batch(*args)
+    await exchange.close()
+    return result
+
+
+loop = asyncio.get_event_loop()
+
+exchange = async_books({'id': 'books', 'has': {'fetchOrderBooks': True}, 'batch': {'fetchOrderBooks': {'symbols': 5}}})
+result = loop.run_until_complete(fetch(exchange, 'fetch_order_books', symbols))
+assert(sorted(result.keys()) == sorted(symbols))
+assert(exchange.requests == [symbols[0:5], symbols[5:10], symbols[10:12]])
+
+exchange = async_books({'id': 'books'})
+result = loop.run_until_complete(fetch(exchange, 'fetchOrderBooks', symbols[0:4]))
+assert(list(result.keys()) == symbols[0:4])
+assert(sorted(exchange.requests) == sorted(symbols[0:4]))
+
+# the limits of the exchanges
+
+assert(ccxt.cryptopia().batch['fetchOrderBooks']['symbols'] == 5)
+assert(ccxt.liqui().batch['fetchTickers']['separator'] == '-')
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.errors import ExchangeNotAvailable  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+minute = 60000
+start = 1530000000000
+gap = range(start + 300 * minute, start + 400 * minute)  # no trading there
+history = [[timestamp, 1.0, 2.0, 0.5, 1.5, 10.0] for timestamp in range(start, start + 1000 * minute, minute) if timestamp not in gap]
+until = start + 950 * minute
+
+
+def serve(exchange, since, limit):
+    exchange.requests.append(since)
+    if since in exchange.failures:
+        exchange.failures.remove(since)
+        raise ExchangeNotAvailable('try again later')
+    limit = min(limit or 100, exchange.max_limit)
+    return [ohlcv[:] for ohlcv in history if ohlcv[0] >= since][0:limit]
+
+
+class candles(Exchange):
+
+    max_limit = 120
+
+    def __init__(self, config={}):
+        super(candles, self).__init__(config)
+        self.requests = []
+        self.failures = []
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        return serve(self, since, limit)
+
+
+class async_candles(AsyncExchange):
+
+    max_limit = 120
+
+    def __init__(self, config={}):
+        super(async_candles, self).__init__(config)
+        self.requests = []
+        self.failures = []
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        await asyncio.sleep(0)
+        return serve(self, since, limit)
+
+
+expected = [ohlcv for ohlcv in history if ohlcv[0] < until]
+
+# sequential pages of the size the exchange returns, when the size of the pages is unknown
+
+exchange = candles({'id': 'candles'})
+assert(exchange.fetch_ohlcv_range('BTC/USD', '1m', start, until) == expected)
+assert(exchange.requests[0:2] == [start, start + 100 * minute])
+
+# pages of the known size, gaps are skipped
+
+exchange = candles({'id': 'candles', 'pagination': {'fetchOHLCV': {'limit': 120}}})
+assert(exchange.fetchOHLCVRange('BTC/USD', '1m', start, until) == expected)
+assert(exchange.requests[0:2] == [start, start + 120 * minute])
+assert(len(exchange.requests) == 8)
+
+# resuming from a checkpoint after an error
+
+exchange = candles({'id': 'candles', 'pagination': {'fetchOHLCV': {'limit': 120}}})
+exchange.failures = [start + 240 * minute]
+checkpoint = {}
+try:
+    exchange.fetch_ohlcv_range('BTC/USD', '1m', start, until, {}, checkpoint)
+    assert(False)
+except ExchangeNotAvailable:
+    pass
+assert(checkpoint['since'] == start + 240 * minute)
+assert(len(checkpoint['ohlcvs']) == 240)  # the candles fetched before the error are kept for the call that resumes
+resumed = exchange.fetch_ohlcv_range('BTC/USD', '1m', start, until, {}, checkpoint)
+assert(resumed == expected)
+assert(exchange.requests.count(start) == 1)
+assert(checkpoint['since'] == until)
+assert(checkpoint['ohlcvs'] == [])
+
+# a since is required
+
+try:
+    exchange.fetch_ohlcv_range('BTC/USD', '1m')
+    assert(False)
+except Exception as e:
+    assert('since' in str(e))
+
+
+async def test_async():
+
+    # windows of the known size are fetched concurrently, pages shorter than the window are followed up
+
+    exchange = async_candles({'id': 'candles', 'pagination': {'fetchOHLCV': {'limit': 150}}})
+    exchange.max_limit = 100
+    assert((await exchange.fetch_ohlcv_range('BTC/USD', '1m', start, until, {}, None, 3)) == expected)
+    assert(exchange.requests[0:3] == [start, start + 150 * minute, start + 300 * minute])
+    await exchange.close()
+
+    # the checkpoint is the first window that has not been fetched
+
+    exchange = async_candles({'id': 'candles', 'pagination': {'fetchOHLCV': {'limit': 120}}})
+    exchange.failures = [start + 480 * minute]
+    checkpoint = {}
+    try:
+        await exchange.fetch_ohlcv_range('BTC/USD', '1m', start, until, {}, checkpoint, 1)
+        assert(False)
+    except ExchangeNotAvailable:
+        pass
+    assert(checkpoint['since'] == start + 480 * minute)
+    resumed = await exchange.fetchOHLCVRange('BTC/USD', '1m', start, until, {}, checkpoint)
+    assert(resumed == expected)
+    assert(exchange.requests.count(start) == 1)
+    assert(checkpoint['since'] == until)
+    assert(checkpoint['ohlcvs'] == [])
+    await exchange.close()
+
+    # sequential without the size of the pages
+
+    exchange = async_candles({'id': 'candles'})
+    assert((await exchange.fetch_ohlcv_range('BTC/USD', '1m', start, until)) == expected)
+    await exchange.close()
+
+
+asyncio.get_event_loop().run_until_complete(test_async())
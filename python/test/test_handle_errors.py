@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Response(object):
+    status_code = 200
+    reason = 'OK'
+    headers = {}
+
+    def __init__(self, text):
+        self.text = text
+        self.content = text.encode('utf-8')
+
+    def raise_for_status(self):
+        pass
+
+
+class Session(object):
+
+    def __init__(self, text):
+        self.text = text
+        self.cookies = {}
+
+    def request(self, method, url, **kwargs):
+        return Response(self.text)
+
+    def close(self):
+        pass
+
+
+class WithResponse(ccxt.Exchange):
+
+    def handle_errors(self, code, reason, url, method, headers, body, response=None):
+        self.handled = response
+
+
+class WithoutResponse(ccxt.Exchange):
+
+    def handle_errors(self, code, reason, url, method, headers, body):
+        self.handled = body
+
+
+body = '{"result":[1,2,3]}'
+
+exchange = WithResponse({'id': 'with', 'session': Session(body)})
+result = exchange.fetch('https://example.com')
+assert(result == {'result': [1, 2, 3]})
+assert(exchange.handled is result)  # decoded once, the same object is passed along
+
+exchange = WithoutResponse({'id': 'without', 'session': Session(body)})
+result = exchange.fetch('https://example.com')
+assert(result == {'result': [1, 2, 3]})
+assert(exchange.handled == body)
+
+# non-json bodies are still decoded by handle_rest_response
+exchange = WithResponse({'id': 'with', 'session': Session('123')})
+assert(exchange.fetch('https://example.com') == 123)
+assert(exchange.handled is None)
+
+# an exchange overriding parse_json can call the camelcase alias of the base method, like cryptopia does
+exchange = ccxt.cryptopia({'session': Session(u'\ufeff{"Success":true,"Data":[]}')})
+assert(exchange.fetch('https://example.com') == {'Success': True, 'Data': []})
+
+# the text of a json response is decoded from its bytes only when something reads it
+
+
+class Counted(Response):
+
+    reads = 0
+
+    def __init__(self, text):
+        self.content = text.encode('utf-8')
+
+    @property
+    def text(self):
+        Counted.reads += 1
+        return self.content.decode('utf-8')
+
+
+class CountedSession(Session):
+
+    def request(self, method, url, **kwargs):
+        return Counted(self.text)
+
+
+exchange = ccxt.Exchange({'id': 'plain', 'session': CountedSession(body)})
+assert(exchange.fetch('https://example.com') == {'result': [1, 2, 3]})
+assert(Counted.reads == 0)
+assert(exchange.last_http_response == body)
+assert(exchange.last_http_response == body)
+assert(Counted.reads == 1)
+
+exchange = WithoutResponse({'id': 'without', 'session': CountedSession(body)})
+exchange.fetch('https://example.com')
+assert(exchange.handled == body)
+assert(Counted.reads == 2)
+
+# the responses of requests of the same async instance that run at the same time are kept apart
+
+import asyncio  # noqa: E402
+import ccxt.async_support as ccxt_async  # noqa: E402
+
+
+class AsyncResponse(object):
+
+    def __init__(self, text, delay):
+        self.status = 200
+        self.headers = {}
+        self.content = text.encode('utf-8')
+        self.delay = delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await asyncio.sleep(self.delay)  # the other request gets its response meanwhile
+
+    async def read(self):
+        return self.content
+
+    def get_encoding(self):
+        return 'utf-8'
+
+
+class AsyncSession(object):
+
+    def get(self, url, **kwargs):
+        number = str(url).split('/')[-1]
+        return AsyncResponse(number, 0.02 if number == '12' else 0)
+
+
+async def fetch_both(exchange):
+    both = await asyncio.gather(exchange.fetch('https://example.com/12'), exchange.fetch('https://example.com/34'))
+    await exchange.close()
+    return both
+
+
+exchange = ccxt_async.Exchange({'id': 'async', 'session': AsyncSession()})
+assert(asyncio.get_event_loop().run_until_complete(fetch_both(exchange)) == [12, 34])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.json_backend import JSON_BACKENDS, get_json_backend  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+data = {
+    'symbol': 'ETH/BTC',
+    'url': 'https://example.com/api/v1',
+    'price': 0.03155,
+    'amount': 12.5,
+    'ids': [1, 2, 3],
+    'nothing': None,
+    'flag': True,
+}
+
+encoded = ccxt.Exchange.json(data)
+assert(encoded == '{"symbol":"ETH/BTC","url":"https://example.com/api/v1","price":0.03155,"amount":12.5,"ids":[1,2,3],"nothing":null,"flag":true}')
+
+# integers wider than 64 bits are encoded by the stdlib fallback
+assert(ccxt.Exchange.json({'huge': 123456789012345678901234567890}) == '{"huge":123456789012345678901234567890}')
+
+for name in JSON_BACKENDS + ['auto']:
+    loads, dumps = get_json_backend(name)
+    assert(loads(encoded) == data)
+    assert(loads(encoded.encode('utf-8')) == data)
+    assert(loads(dumps(data)) == data)
+
+# and decoded exactly by 'auto', that never picks orjson as it decodes them to floats
+
+huge = '{"id":123456789012345678901234567890,"nonce":18446744073709551616}'
+for name in ['auto', 'json']:
+    loads, dumps = get_json_backend(name)
+    for payload in [huge, huge.encode('utf-8')]:
+        decoded = loads(payload)
+        assert(decoded['id'] == 123456789012345678901234567890 and type(decoded['id']) is int)
+        assert(decoded['nonce'] == 18446744073709551616 and type(decoded['nonce']) is int)
+        assert(dumps(decoded) == huge)
+
+try:
+    get_json_backend('foobar')
+    assert(False)
+except ValueError:
+    pass
+
+exchange = ccxt.Exchange({'id': 'mock', 'jsonBackend': 'auto'})
+assert(exchange.parse_json(None, encoded, 'https://example.com', 'GET') == data)
+assert(exchange.parse_json(None, encoded.encode('utf-8'), 'https://example.com', 'GET') == data)
+assert(exchange.parse_json(None, '{broken', 'https://example.com', 'GET') is None)
+
+# json() and unjson() use the backend of the instance, or that of the class when called on the class
+
+exchange.jsonBackend = 'foobar'
+for method in [exchange.json, exchange.unjson]:
+    try:
+        method('{}')
+        assert(False)
+    except ValueError:
+        pass
+assert(ccxt.Exchange.unjson(encoded) == data)
+assert(ccxt.Exchange.json(data) == encoded)
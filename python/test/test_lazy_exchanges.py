@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+assert('ccxt.binance' not in sys.modules)
+assert(ccxt.binance.__name__ == 'binance')
+assert('ccxt.binance' in sys.modules)
+assert('binance' in dir(ccxt))
+
+# okex imports ccxt/okcoinusd.py, ccxt.okcoinusd must still be the class
+assert(issubclass(ccxt.okex, ccxt.okcoinusd))
+assert(isinstance(ccxt.okcoinusd, type))
+
+try:
+    ccxt.foobar
+    assert(False)
+except AttributeError:
+    pass
+
+for id in ccxt.exchanges:
+    assert(issubclass(getattr(ccxt, id), ccxt.Exchange))
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins  # python 2
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.errors import NotSupported  # noqa: E402
+
+base = sys.modules[Exchange.__module__]
+
+# ------------------------------------------------------------------------------
+
+# a failed import of web3 is attempted once, the ethereum methods raise NotSupported without importing it again
+
+imports = []
+builtin_import = builtins.__import__
+
+
+def failing_import(name, *args, **kwargs):
+    if name == 'web3' or name.startswith('web3.'):
+        imports.append(name)
+        raise ImportError(name)
+    return builtin_import(name, *args, **kwargs)
+
+
+builtins.__import__ = failing_import
+try:
+    base.web3_import_attempted = False
+    assert(base.load_web3() is None)
+    assert(base.load_web3() is None)
+    exchange = Exchange({'id': 'noweb3'})
+    assert(exchange.web3 is None)
+    try:
+        exchange.fromWei(1)
+        assert(False)
+    except NotSupported:
+        pass
+finally:
+    builtins.__import__ = builtin_import
+
+assert(imports == ['web3'])
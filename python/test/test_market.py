@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.market import Market, Currency, LAZY_INFO, DROP_INFO  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# records behave like read-mostly dicts
+
+values = {
+    'id': 'BTCUSD',
+    'symbol': 'BTC/USD',
+    'base': 'BTC',
+    'quote': 'USD',
+    'precision': {'amount': 8, 'price': 2},
+    'lot': 0.1,
+    'info': {'pair': 'BTCUSD', 'filters': [1, 2]},
+}
+market = Market(values)
+assert(market['symbol'] == 'BTC/USD')
+assert(market['lot'] == 0.1)
+assert(market['precision']['price'] == 2)
+assert('base' in market and 'lot' in market)
+assert('active' not in market and 'missing' not in market)
+assert(market.get('active') is None)
+assert(market.get('active', True) is True)
+assert(dict(market) == values)
+assert(market == values)
+assert(len(market) == len(values))
+assert(sorted(market.keys()) == sorted(values.keys()))
+try:
+    market['active']
+    assert(False)
+except KeyError:
+    pass
+market['active'] = True
+market['custom'] = 'value'
+assert(market['active'] is True and market['custom'] == 'value')
+assert(not hasattr(market, '__dict__'))
+
+# the raw info can be dropped or kept as a json string
+
+assert(Market(values, DROP_INFO)['info'] is None)
+lazy = Market(values, LAZY_INFO)
+assert(lazy['info'] == values['info'])
+assert(lazy['info'] is not values['info'])
+
+# equal nested dicts are stored once
+
+shared = {}
+first = Market({'symbol': 'A/B', 'precision': {'amount': 8, 'price': 2}}, shared=shared)
+second = Market({'symbol': 'C/D', 'precision': {'price': 2, 'amount': 8}}, shared=shared)
+assert(first['precision'] is second['precision'])
+
+# Exchange helpers work with records
+
+assert(Exchange.extend(market, {'symbol': 'X/Y'})['base'] == 'BTC')
+assert(Exchange.deep_extend(market, {'precision': {'price': 3}})['precision'] == {'amount': 8, 'price': 3})
+assert(Exchange.safe_string(market, 'quote') == 'USD')
+assert(Exchange.safe_float(market, 'lot') == 0.1)
+assert(Exchange.index_by([market], 'id')['BTCUSD'] is market)
+
+# compact markets and currencies in set_markets
+
+exchange = Exchange({'id': 'compact', 'compactMarkets': True, 'marketsInfo': 'lazy'})
+exchange.set_markets([
+    {'id': 'BTCUSD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'precision': {'amount': 8, 'price': 2}, 'info': {'a': 1}},
+    {'id': 'ETHUSD', 'symbol': 'ETH/USD', 'base': 'ETH', 'quote': 'USD', 'precision': {'amount': 8, 'price': 2}, 'info': {'a': 2}},
+])
+assert(isinstance(exchange.market('BTC/USD'), Market))
+assert(exchange.markets_by_id['ETHUSD'] is exchange.markets['ETH/USD'])
+assert(exchange.market('ETH/USD')['info'] == {'a': 2})
+assert(exchange.markets['BTC/USD']['precision'] is exchange.markets['ETH/USD']['precision'])
+assert(exchange.market('BTC/USD')['percentage'] is True)
+assert(isinstance(exchange.currencies['USD'], Currency))
+assert(exchange.currencies_by_id['BTC']['code'] == 'BTC')
+assert(exchange.amount_to_precision('BTC/USD', 0.123456789) == 0.12345678)
+assert(exchange.market_id('BTC/USD') == 'BTCUSD')
+assert(exchange.market_ids(['BTC/USD', 'ETH/USD']) == ['BTCUSD', 'ETHUSD'])
+assert(exchange.find_symbol('ETHUSD') == 'ETH/USD')
+assert(exchange.find_symbol('XRPUSD') == 'XRPUSD')
+
+# compact markets copy to dicts and encode to json like the dicts they replace
+
+omitted = Exchange.omit(exchange.market('BTC/USD'), 'info', ['precision'])
+assert(type(omitted) is dict)
+assert(omitted['symbol'] == 'BTC/USD' and 'info' not in omitted and 'precision' not in omitted)
+assert('info' in exchange.market('BTC/USD'))
+assert(exchange.market('BTC/USD').copy() == dict(exchange.market('BTC/USD')))
+for backend in ['json', 'auto']:
+    exchange.jsonBackend = backend
+    assert(exchange.unjson(exchange.json(exchange.market('BTC/USD')))['info'] == {'a': 1})
+    assert(exchange.unjson(exchange.json(exchange.markets))['ETH/USD']['base'] == 'ETH')
+exchange.jsonBackend = 'json'
+
+# setting the markets again reuses the currencies
+
+exchange.set_markets(list(exchange.markets.values()))
+assert(exchange.currencies['ETH']['precision'] == 8)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.market_cache import MarketCache  # noqa: E402
+from ccxt.cointiger import cointiger  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class cached(Exchange):
+
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(cached, self).describe(), {
+            'id': 'cached',
+            'urls': {
+                'api': 'https://api.example.com',
+            },
+        })
+
+    def fetch_markets(self):
+        cached.fetches += 1
+        return [
+            {'id': 'BTCUSD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'info': {'fetch': cached.fetches}},
+            {'id': 'ETHBTC', 'symbol': 'ETH/BTC', 'base': 'ETH', 'quote': 'BTC', 'info': {'fetch': cached.fetches}},
+        ]
+
+
+directory = tempfile.mkdtemp()
+
+try:
+
+    # the first instance fetches the markets and saves them, the next one loads them from the cache
+
+    first = cached({'marketsCacheDirectory': directory})
+    first.load_markets()
+    assert(cached.fetches == 1)
+    assert(os.listdir(directory) == [first.markets_cache_key() + '.json'])
+
+    second = cached({'marketsCacheDirectory': directory})
+    second.load_markets()
+    assert(cached.fetches == 1)
+    assert(second.symbols == first.symbols)
+    assert(second.markets['BTC/USD']['id'] == 'BTCUSD')
+    assert(second.markets_by_id['ETHBTC']['symbol'] == 'ETH/BTC')
+    assert(sorted(second.currencies.keys()) == ['BTC', 'ETH', 'USD'])
+
+    # reload always fetches
+
+    second.load_markets(True)
+    assert(cached.fetches == 2)
+
+    # other api urls, like a sandbox, are cached separately
+
+    sandbox = cached({'marketsCacheDirectory': directory, 'urls': {'api': 'https://sandbox.example.com'}})
+    assert(sandbox.markets_cache_key() != first.markets_cache_key())
+    sandbox.load_markets()
+    assert(cached.fetches == 3)
+
+    # expired markets are used while they are refreshed in the background
+
+    stale = cached({'marketsCacheDirectory': directory, 'marketsCacheTTL': 0})
+    time.sleep(0.01)
+    stale.load_markets()
+    assert(stale.markets['BTC/USD']['info']['fetch'] == 2)
+    for i in range(0, 100):
+        if cached.fetches == 4:
+            break
+        time.sleep(0.01)
+    assert(cached.fetches == 4)
+
+    # or refreshed right away
+
+    blocking = cached({'marketsCacheDirectory': directory, 'marketsCacheTTL': 0, 'marketsCacheBackgroundRefresh': False})
+    time.sleep(0.01)
+    blocking.load_markets()
+    assert(cached.fetches == 5)
+    assert(blocking.markets['BTC/USD']['info']['fetch'] == 5)
+
+    # no temporary files are left behind, corrupt files are ignored
+
+    assert(len(os.listdir(directory)) == 2)
+    cache = MarketCache(directory)
+    with open(cache.path('corrupt'), 'w') as f:
+        f.write('{"timestamp": 1, "mark')
+    assert(cache.load('corrupt') is None)
+    assert(cache.load('missing') is None)
+
+    # nothing is cached unless a directory is set
+
+    uncached = cached()
+    uncached.load_markets()
+    assert(cached.fetches == 6)
+
+    # the tables that an exchange builds in fetch_markets are built from cached markets too
+
+    warm = cointiger({'marketsCacheDirectory': directory})
+    MarketCache(directory).save(warm.markets_cache_key(), [
+        {'id': 'ethbtc', 'uppercaseId': 'ETHBTC', 'symbol': 'ETH/BTC', 'base': 'ETH', 'quote': 'BTC', 'precision': {'amount': 3, 'price': 6}},
+    ])
+    warm.load_markets()
+    warm.exchangeGetApiPublicMarketDetail = lambda params={}: {'ETHBTC': {'id': 1531605169000, 'last': '0.0692'}}
+    tickers = warm.fetch_tickers()
+    assert(list(tickers.keys()) == ['ETH/BTC'])
+    assert(tickers['ETH/BTC']['last'] == 0.0692)
+
+finally:
+    shutil.rmtree(directory)
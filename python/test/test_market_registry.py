@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.market_registry import clear_market_registry  # noqa: E402
+from ccxt.kraken import kraken  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class shared(Exchange):
+
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(shared, self).describe(), {
+            'id': 'shared',
+            'urls': {
+                'api': 'https://api.example.com',
+            },
+        })
+
+    def fetch_markets(self):
+        shared.fetches += 1
+        return [
+            {'id': 'BTCUSD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD'},
+            {'id': 'ETHBTC', 'symbol': 'ETH/BTC', 'base': 'ETH', 'quote': 'BTC'},
+        ]
+
+
+# instances of the same exchange load the markets once and share the tables
+
+first = shared({'shareMarkets': True, 'apiKey': 'first'})
+second = shared({'shareMarkets': True, 'apiKey': 'second'})
+first.load_markets()
+second.load_markets()
+assert(shared.fetches == 1)
+assert(second.markets is first.markets)
+assert(second.markets_by_id is first.markets_by_id)
+assert(second.marketsById is first.markets_by_id)
+assert(second.currencies_by_id is first.currencies_by_id)
+assert(second.symbols == ['BTC/USD', 'ETH/BTC'])
+
+# reloading publishes the new tables for the instances loading after it
+
+second.load_markets(True)
+assert(shared.fetches == 2)
+third = shared({'shareMarkets': True})
+third.load_markets()
+assert(shared.fetches == 2)
+assert(third.markets is second.markets)
+assert(third.markets is not first.markets)
+
+# other api urls and instances not sharing their markets load their own
+
+sandbox = shared({'shareMarkets': True, 'urls': {'api': 'https://sandbox.example.com'}})
+sandbox.load_markets()
+assert(shared.fetches == 3)
+private = shared()
+private.load_markets()
+assert(shared.fetches == 4)
+assert(private.markets is not third.markets)
+
+# markets can be attached from another instance explicitly
+
+attached = shared()
+attached.attach_markets(private)
+assert(attached.markets is private.markets)
+assert(attached.market('ETH/BTC')['id'] == 'ETHBTC')
+attached.load_markets()
+assert(shared.fetches == 4)
+
+clear_market_registry()
+shared({'shareMarkets': True}).load_markets()
+assert(shared.fetches == 5)
+
+# the tables that an exchange builds in fetch_markets are built for the instances attached to shared markets too
+
+loaded = kraken({'shareMarkets': True})
+loaded.set_markets([{'id': 'XETHXXBT', 'altname': 'ETHXBT', 'symbol': 'ETH/BTC', 'base': 'ETH', 'quote': 'BTC'}])
+for instance in [kraken({'shareMarkets': True}), kraken()]:
+    if instance.shareMarkets:
+        instance.load_markets()
+    else:
+        instance.attach_markets(loaded)
+    assert(instance.markets is loaded.markets)
+    assert(instance.find_market_by_altname_or_id('ETHXBT') is loaded.markets['ETH/BTC'])
+    assert(instance.find_market_by_altname_or_id('XETHXXBT') is loaded.markets['ETH/BTC'])
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base import order_book  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.order_book import OrderBook  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def test_order_book():
+
+    book = OrderBook({
+        'bids': [[100.0, 1.0], [101.0, 2.0], [99.0, 3.0], [101.0, 0.5]],
+        'asks': [[103.0, 1.0], [102.0, 2.0]],
+        'timestamp': 1530000000000,
+        'nonce': 7,
+    })
+
+    # repeated prices are aggregated, the levels are sorted from the best price
+
+    assert(book['bids'] == [[101.0, 2.5], [100.0, 1.0], [99.0, 3.0]])
+    assert(book['asks'] == [[102.0, 2.0], [103.0, 1.0]])
+    assert(book.best_bid == [101.0, 2.5])
+    assert(book.best_ask == [102.0, 2.0])
+    assert(book['nonce'] == 7)
+    assert(book.to_dict(2)['bids'] == [[101.0, 2.5], [100.0, 1.0]])
+    assert(book.to_dict(1)['asks'] == [[102.0, 2.0]])
+
+    # deltas update, insert and remove price levels
+
+    book.apply_delta('bids', 101.0, 0)
+    book.apply_delta('bids', 100.5, 4.0)
+    book.apply_delta('asks', 102.0, 1.5)
+    book.apply_delta('asks', 101.5, 1.0)
+    book.apply_delta('asks', 200.0, 0)  # removing a missing level is a no-op
+    assert(book['bids'] == [[100.5, 4.0], [100.0, 1.0], [99.0, 3.0]])
+    assert(book['asks'] == [[101.5, 1.0], [102.0, 1.5], [103.0, 1.0]])
+
+    # the levels are built once per update
+
+    bids = book['bids']
+    assert(book['bids'] is bids)
+    assert(book.to_dict()['bids'] is bids)
+    book.apply_delta('bids', 100.0, 2.0)
+    assert(book['bids'] is not bids)
+    assert(book['bids'] == [[100.5, 4.0], [100.0, 2.0], [99.0, 3.0]])
+    book['bids'] = [[98.0, 1.0]]
+    assert(book['bids'] == [[98.0, 1.0]])
+    book['bids'] = [[100.5, 4.0], [100.0, 1.0], [99.0, 3.0]]
+    try:
+        book.apply_delta('buy', 1.0, 1.0)
+        assert(False)
+    except ValueError:
+        pass
+
+    # the book can be used like the dict returned by parse_order_book
+
+    book['nonce'] = 8
+    assert(dict(book)['nonce'] == 8)
+    assert(Exchange.extend(book, {'nonce': 9})['asks'] == book['asks'])
+    assert(sorted(book.keys()) == ['asks', 'bids', 'datetime', 'nonce', 'timestamp'])
+
+    # a snapshot replaces the book
+
+    book.apply_snapshot({'bids': [], 'asks': [[1.0, 1.0]]})
+    assert(book.best_bid is None)
+    assert(book['asks'] == [[1.0, 1.0]])
+    assert(book['timestamp'] is None)
+
+    # random deltas agree with a sorted dict of levels
+
+    random.seed(1)
+    expected = {}
+    book = OrderBook()
+    for i in range(0, 2000):
+        price = float(random.randint(1, 200))
+        amount = random.choice([0, 0, 1.0, 2.0, 3.0])
+        book.apply_delta('asks', price, amount)
+        if amount:
+            expected[price] = amount
+        else:
+            expected.pop(price, None)
+    assert(book['asks'] == [[price, expected[price]] for price in sorted(expected)])
+    assert(book.to_dict(10)['asks'] == [[price, expected[price]] for price in sorted(expected)][0:10])
+
+
+# with sortedcontainers, if installed, and with the bisect fallback
+
+test_order_book()
+order_book.SortedList = None
+test_order_book()
+
+# parse_order_book can return an OrderBook
+
+exchange = Exchange({'id': 'books', 'orderBookFormat': 'object'})
+book = exchange.parse_order_book({
+    'bids': [['100.0', '1.0'], ['101.0', '2.0']],
+    'asks': [['102.0', '1.0'], ['103.0', '0']],
+}, 1530000000000)
+assert(isinstance(book, OrderBook))
+assert(book['bids'] == [[101.0, 2.0], [100.0, 1.0]])
+assert(book['asks'] == [[102.0, 1.0]])
+assert(book['datetime'] == '2018-06-26T08:00:00.000Z')
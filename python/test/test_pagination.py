@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.errors import ExchangeError  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+start = 1530000000000
+# three trades share every timestamp, so pages end in the middle of a timestamp
+history = [{'id': str(i), 'timestamp': start + (i // 3) * 1000, 'amount': 1.0} for i in range(0, 250)]
+
+
+def serve(exchange, since, limit, params):
+    exchange.requests.append([since, limit, params])
+    limit = min(limit or 50, 50)
+    if 'fromId' in params:
+        return [dict(trade) for trade in history if int(trade['id']) >= params['fromId']][0:limit]
+    if 'after' in params or exchange.headers:
+        # pages go back in time from the newest trade like on gdax
+        after = int(params.get('after', len(history)))
+        page = [dict(trade) for trade in reversed(history) if int(trade['id']) < after][0:limit]
+        exchange.record_response_headers({'CB-AFTER': page[-1]['id']} if len(page) == limit else {})
+        return page
+    return [dict(trade) for trade in history if trade['timestamp'] >= (since or start)][0:limit]
+
+
+class trades(Exchange):
+
+    def __init__(self, config={}):
+        super(trades, self).__init__(config)
+        self.requests = []
+        self.headers = False
+
+    def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        return serve(self, since, limit, params)
+
+
+class async_trades(AsyncExchange):
+
+    def __init__(self, config={}):
+        super(async_trades, self).__init__(config)
+        self.requests = []
+        self.headers = False
+
+    async def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        await asyncio.sleep(0)
+        page = serve(self, since, limit, params)
+        await asyncio.sleep(0)  # other requests get their responses in between
+        return page
+
+
+class ignores_since(trades):
+
+    def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        self.requests.append([since, limit, params])
+        return [dict(trade) for trade in history[0:50]]
+
+
+def ids(pages):
+    return sorted([int(trade['id']) for page in pages for trade in page])
+
+
+everything = list(range(0, 250))
+
+# a since cursor, the trades at the timestamp where a page ends are not repeated
+
+exchange = trades({'id': 'trades'})
+pages = exchange.paginate('fetch_my_trades', 'BTC/USD', start)
+assert(not isinstance(pages, list))  # pages are fetched lazily
+assert(exchange.requests == [])
+assert(len(next(pages)) == 50)
+assert(len(exchange.requests) == 1)
+assert(ids([[trade for trade in history[0:50]]] + list(pages)) == everything)
+assert(exchange.requests[1][0] == history[49]['timestamp'])
+
+# an exchange that ignores since returns the same page again, the paging stops there
+
+exchange = ignores_since({'id': 'trades'})
+assert(ids(exchange.paginate('fetch_my_trades', 'BTC/USD', start)) == list(range(0, 50)))
+assert(len(exchange.requests) == 2)
+assert(exchange.requests[1][0] == history[49]['timestamp'])
+
+# a since cursor cannot page past more items than fit on a page at one timestamp, that raises instead of ending
+
+
+class crowded(trades):
+
+    def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        self.requests.append([since, limit, params])
+        crowd = [{'id': str(i), 'timestamp': start + (1000 if i >= 120 else 0)} for i in range(0, 130)]
+        return [dict(trade) for trade in crowd if trade['timestamp'] >= since][0:50]
+
+
+exchange = crowded({'id': 'trades'})
+pages = exchange.paginate('fetch_my_trades', 'BTC/USD', start)
+assert(len(next(pages)) == 50)
+try:
+    next(pages)
+    assert(False)
+except ExchangeError:
+    pass
+assert(len(exchange.requests) == 2)
+
+
+class crowded_without_ids(trades):
+
+    def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        self.requests.append([since, limit, params])
+        return [{'timestamp': start} for i in range(0, 50)]
+
+
+exchange = crowded_without_ids({'id': 'trades'})
+pages = exchange.paginate('fetch_my_trades', 'BTC/USD', start)
+assert(len(next(pages)) == 50)
+try:
+    next(pages)
+    assert(False)
+except ExchangeError:
+    pass
+assert(len(exchange.requests) == 2)
+
+# an id cursor, the since is only sent with the first request
+
+exchange = trades({'id': 'trades', 'pagination': {'fetchMyTrades': {'cursor': 'id', 'param': 'fromId', 'limit': 40}}})
+assert(ids(exchange.paginate('fetchMyTrades', 'BTC/USD', start)) == everything)
+assert(exchange.requests[0] == [start, 40, {}])
+assert(exchange.requests[1] == [None, 40, {'fromId': 40}])
+
+# items without an id do not move an id cursor, a page of them only ends the paging
+
+
+class without_ids(trades):
+
+    def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        page = serve(self, since, limit, params)
+        if len(page):
+            page.insert(1, {'id': None, 'timestamp': page[0]['timestamp'], 'amount': 1.0})
+        return page
+
+
+exchange = without_ids({'id': 'trades', 'pagination': {'fetchMyTrades': {'cursor': 'id', 'param': 'fromId', 'limit': 40}}})
+pages = list(exchange.paginate('fetchMyTrades', 'BTC/USD', start))
+assert(ids([[trade for trade in page if trade['id'] is not None] for page in pages]) == everything)
+assert(exchange.requests[1] == [None, 40, {'fromId': 40}])
+exchange.fetch_my_trades = lambda symbol=None, since=None, limit=None, params={}: [{'timestamp': start, 'amount': 1.0}]
+assert(len(list(exchange.paginate('fetch_my_trades', 'BTC/USD', start))) == 1)
+
+# a header cursor
+
+exchange = trades({'id': 'trades', 'pagination': {'fetchMyTrades': {'cursor': 'header', 'header': 'CB-AFTER', 'param': 'after'}}})
+exchange.headers = True
+assert(ids(exchange.paginate('fetch_my_trades', 'BTC/USD')) == everything)
+assert(exchange.requests[1] == [None, None, {'after': '200'}])
+assert(len(exchange.requests) == 6)  # the last page is full, the next one is empty
+
+# an unknown cursor
+
+exchange = trades({'id': 'trades', 'pagination': {'fetchMyTrades': {'cursor': 'page'}}})
+try:
+    next(exchange.paginate('fetch_my_trades', 'BTC/USD'))
+    assert(False)
+except ValueError:
+    pass
+
+# async iteration
+
+
+async def collect(exchange, *args):
+    pages = []
+    async for page in exchange.paginate('fetch_my_trades', *args):
+        pages.append(page)
+    await exchange.close()
+    return pages
+
+
+loop = asyncio.get_event_loop()
+
+exchange = async_trades({'id': 'trades'})
+pages = loop.run_until_complete(collect(exchange, 'BTC/USD', start))
+assert(ids(pages) == everything)
+assert(len(pages) == 6)
+
+exchange = async_trades({'id': 'trades', 'pagination': {'fetchMyTrades': {'cursor': 'id', 'param': 'fromId', 'limit': 40}}})
+assert(ids(loop.run_until_complete(collect(exchange, 'BTC/USD', start))) == everything)
+
+# the header cursors of paginations running at the same time are taken from their own responses
+
+
+async def collect_both(exchange):
+    async def collect_one(params):
+        pages = []
+        async for page in exchange.paginate('fetch_my_trades', 'BTC/USD', None, params):
+            pages.append(page)
+        return pages
+    both = await asyncio.gather(collect_one({}), collect_one({'after': 120}))
+    await exchange.close()
+    return both
+
+
+exchange = async_trades({'id': 'trades', 'pagination': {'fetchMyTrades': {'cursor': 'header', 'header': 'CB-AFTER', 'param': 'after'}}})
+exchange.headers = True
+first, second = loop.run_until_complete(collect_both(exchange))
+assert(ids(first) == everything)
+assert(ids(second) == list(range(0, 120)))
+assert(len(exchange.requests) == 9)
+assert(exchange.response_headers_by_task == {})
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import decimal
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base import decimal_to_precision as module  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import precision_formatter  # noqa: E402
+from ccxt.base.decimal_to_precision import cached_decimal_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import decimals_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE  # noqa: E402
+from ccxt.base.decimal_to_precision import ROUND  # noqa: E402
+from ccxt.base.decimal_to_precision import DECIMAL_PLACES  # noqa: E402
+from ccxt.base.decimal_to_precision import SIGNIFICANT_DIGITS  # noqa: E402
+from ccxt.base.decimal_to_precision import NO_PADDING  # noqa: E402
+from ccxt.base.decimal_to_precision import PAD_WITH_ZERO  # noqa: E402
+from ccxt.base.arrays import numpy_available  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def test_cases():
+    # the arguments and the results of the asserts of test_decimal_to_precision.py
+    names = dict((name, getattr(module, name)) for name in module.__all__)
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_decimal_to_precision.py')) as f:
+        tree = ast.parse(f.read())
+    cases = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Compare) and isinstance(node.left, ast.Call) and getattr(node.left.func, 'id', None) == 'decimal_to_precision':
+            arguments = [ast.literal_eval(arg) if not isinstance(arg, ast.Name) else names[arg.id] for arg in node.left.args]
+            cases.append((arguments, ast.literal_eval(node.comparators[0])))
+    return cases
+
+
+cases = test_cases()
+assert(len(cases) > 50)
+
+# the formatters return what decimal_to_precision returns
+
+global_context = decimal.getcontext()
+rounding = global_context.rounding
+for arguments, expected in cases:
+    n = arguments[0]
+    assert(precision_formatter(*arguments[1:])(n) == expected)
+    assert(cached_decimal_to_precision(*arguments) == expected)
+    assert(decimal_to_precision(*arguments) == expected)
+
+# the batch api returns what decimal_to_precision returns, for the test vectors, as strings and as floats
+
+for arguments, expected in cases:
+    values = [arguments[0], arguments[0]]
+    assert(decimals_to_precision(values, *arguments[1:]) == [expected, expected])
+    assert(decimals_to_precision(values, *arguments[1:], as_float=True) == [float(expected), float(expected)])
+
+# and for floats, that are rounded to decimal places by a fast path except for exact ties
+
+random.seed(0)
+floats = [0.0, -0.0, 0.5, 2.5, -2.5, 0.125, 0.045, 1.005, 1e-7, 1e-6, -1e-6, 12345678.9]
+floats += [random.uniform(-1000, 1000) for i in range(0, 300)]
+floats += [random.random() * 10 ** random.randint(-10, 1) for i in range(0, 300)]
+floats += [random.randint(-10000, 10000) / 2.0 ** random.randint(0, 12) for i in range(0, 300)]  # many ties
+for precision in [0, 1, 2, 3, 6, 7, 8, 12, 20]:
+    for padding_mode in [NO_PADDING, PAD_WITH_ZERO]:
+        expected = [decimal_to_precision(value, ROUND, precision, DECIMAL_PLACES, padding_mode) for value in floats]
+        assert(decimals_to_precision(floats, ROUND, precision, DECIMAL_PLACES, padding_mode) == expected)
+
+# numbers with more digits than the decimal context has raise like they do with decimal_to_precision
+
+raised = False
+try:
+    decimals_to_precision([1e30], ROUND, 2)
+except decimal.InvalidOperation:
+    raised = True
+assert(raised)
+
+if numpy_available():
+    import numpy
+    array = numpy.array([[1.23456, 0.5], [2.5, 100.0]])
+    result = decimals_to_precision(array, ROUND, 1, DECIMAL_PLACES, as_float=True)
+    assert(result.shape == (2, 2) and result.dtype == numpy.float64)
+    assert(result.tolist() == [[1.2, 0.5], [2.5, 100.0]])
+    assert(decimals_to_precision(array, TRUNCATE, 0)[1].tolist() == ['2', '100'])
+
+# the global context is left as it is
+
+assert(decimal.getcontext().rounding == rounding)
+assert(not decimal.getcontext().traps[decimal.Underflow])
+
+# the arguments are checked once, when the formatter is compiled
+
+checked = False
+try:
+    precision_formatter(ROUND, None)
+except AssertionError:
+    checked = True
+assert(checked)
+
+assert(precision_formatter(ROUND, 2)(1.005) == '1')  # 1.005 is 1.00499999999999989... as a float
+assert(precision_formatter(ROUND, 2)('1.005') == '1.01')
+assert(precision_formatter(TRUNCATE, 3, SIGNIFICANT_DIGITS)('0.000123456') == '0.000123')
+assert(precision_formatter(TRUNCATE, 1, DECIMAL_PLACES)(-1.99) == '-1.9')
+
+# per market formatters of the exchange
+
+exchange = Exchange({'id': 'precision'})
+exchange.set_markets([
+    {'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'precision': {'price': 2, 'amount': 4}},
+    {'id': 'ethbtc', 'symbol': 'ETH/BTC', 'base': 'ETH', 'quote': 'BTC', 'precision': {'price': 6, 'amount': 0}},
+])
+for value in [0.0, 1.0, 1.23456789, 1234.56789, 0.000123, 99999.99999]:
+    for symbol in exchange.symbols:
+        precision = exchange.markets[symbol]['precision']
+        assert(exchange.price_to_precision(symbol, value) == ('{:.' + str(precision['price']) + 'f}').format(value))
+        assert(exchange.cost_to_precision(symbol, value) == exchange.priceToPrecision(symbol, value))
+        assert(exchange.fee_to_precision(symbol, value) == exchange.price_to_precision(symbol, value))
+        assert(exchange.amount_to_precision(symbol, value) == Exchange.truncate(value, precision['amount']))
+assert(exchange.price_to_precision('BTC/USD', '1.239') == '1.24')
+assert(exchange.amount_to_precision('BTC/USD', 1.23456789) == 1.2345)
+
+# the formatters are compiled again when the markets are set again
+
+exchange.set_markets([{'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'precision': {'price': 1, 'amount': 1}}])
+assert(exchange.price_to_precision('BTC/USD', 1.26) == '1.3')
+assert(exchange.amount_to_precision('BTC/USD', 1.26) == 1.2)
+
+# the formatters are compiled once per precision value and looked up by the precision of the market on every call,
+# a precision changed in place is used right away, by the instances attached to the markets too
+
+attached = Exchange({'id': 'precision'})
+attached.attach_markets(exchange)
+exchange.price_to_precision('BTC/USD', 1.2666)
+formatter = exchange.precision_formatter('price', 1)
+assert(exchange.precision_formatter('price', 1) is formatter)
+exchange.markets['BTC/USD']['precision']['price'] = 3
+exchange.markets['BTC/USD']['precision']['amount'] = 2
+assert(exchange.price_to_precision('BTC/USD', 1.2666) == '1.267')
+assert(exchange.amount_to_precision('BTC/USD', 1.2666) == 1.26)
+assert(attached.price_to_precision('BTC/USD', 1.2666) == '1.267')
+
+# the precisions of exchanges that count significant digits are significant digits
+
+significant = Exchange({'id': 'precision', 'precisionMode': SIGNIFICANT_DIGITS})
+significant.set_markets([{'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'precision': {'price': 3, 'amount': 2}}])
+assert(significant.price_to_precision('BTC/USD', 0.00123456) == '0.00123')
+assert(significant.price_to_precision('BTC/USD', 6543.21) == '6540')
+assert(significant.cost_to_precision('BTC/USD', 0.0012356) == '0.00124')
+assert(significant.amount_to_precision('BTC/USD', 0.0012999) == 0.0012)
+assert(significant.amount_to_precision('BTC/USD', 129.9) == 120.0)
+
+# a market added after set_markets, or with the precision of the amount only, formats amounts like it always did
+
+exchange.markets['XRP/USD'] = {'id': 'xrpusd', 'symbol': 'XRP/USD', 'precision': {'amount': 3}}
+assert(exchange.amount_to_precision('XRP/USD', 1.23456) == 1.234)
+try:
+    exchange.price_to_precision('XRP/USD', 1.23456)
+    assert(False)
+except KeyError:
+    pass
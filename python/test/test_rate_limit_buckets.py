@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.errors import ExchangeError  # noqa: E402
+from ccxt.binance import binance as Binance  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class weighted(Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(weighted, self).describe(), {
+            'id': 'weighted',
+            'rateLimit': 10,
+            'rateLimitBuckets': {
+                'requests': {'limit': 10, 'period': 100},
+                'orders': {'limit': 2, 'period': 100, 'api': ['private']},
+            },
+            'api': {
+                'public': {
+                    'get': {
+                        'ticker': 1,
+                        'depth': 5,
+                    },
+                },
+                'private': {
+                    'get': [
+                        'balance',
+                    ],
+                    'post': {
+                        'order': {'requests': 1, 'orders': 1},
+                    },
+                },
+            },
+        })
+
+
+exchange = weighted()
+
+# the cost table is built from the api definition
+
+assert(exchange.apiCosts[('public', 'GET', 'depth')] == 5)
+assert(('private', 'GET', 'balance') not in exchange.apiCosts)
+assert(hasattr(exchange, 'public_get_depth') and hasattr(exchange, 'privatePostOrder'))
+
+# numeric costs go to every bucket applicable to the api, the default cost is used for unlisted endpoints
+
+assert(exchange.request_cost('depth', 'public', 'GET') == {'requests': 5})
+assert(exchange.request_cost('balance', 'private', 'GET') == {'requests': None, 'orders': None})
+assert(exchange.request_cost('order', 'private', 'POST') == {'requests': 1, 'orders': 1})
+
+# buckets are refilled at limit / period units of cost per millisecond
+
+assert(set(exchange.rateLimiters.keys()) == set(['requests', 'orders']))
+assert(exchange.rateLimiters['orders'].config['capacity'] == 2)
+assert(abs(exchange.rateLimiters['orders'].config['refillRate'] - 0.02) < 1e-9)
+
+# three orders cost 1 + 1 + 1, the first one is free, then the orders bucket has to refill 2 units at 0.02 per ms
+
+start = time.time()
+for i in range(0, 3):
+    exchange.throttle(exchange.request_cost('order', 'private', 'POST'))
+elapsed = (time.time() - start) * 1000
+assert(elapsed >= 100 * 0.9)
+assert(elapsed < 100 * 3)
+
+# without buckets the cost is consumed from the default token bucket, refilled at 1 / rateLimit per ms
+
+plain = Exchange({'rateLimit': 10})
+assert(plain.rateLimiters == {})
+assert(plain.request_cost('ticker', 'public', 'GET') is None)
+start = time.time()
+plain.throttle(5)
+plain.throttle()
+assert((time.time() - start) * 1000 >= 50 * 0.9)
+
+# requests through fetch2 consume their costs from the buckets
+
+
+class signed(weighted):
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': path, 'method': method, 'headers': headers, 'body': body}
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        self.requests.append((method, url))
+        return {}
+
+
+exchange = signed({'enableRateLimit': True})
+exchange.requests = []
+start = time.time()
+for i in range(0, 3):
+    exchange.private_post_order()
+elapsed = (time.time() - start) * 1000
+assert(exchange.requests == [('POST', 'order')] * 3)
+assert(elapsed >= 100 * 0.9)
+assert(elapsed < 100 * 3)
+
+# requests that no bucket applies to are throttled by the default rateLimit bucket
+
+
+class private_only(signed):
+
+    def describe(self):
+        return self.deep_extend(super(private_only, self).describe(), {
+            'rateLimit': 20,
+            'rateLimitBuckets': {
+                'requests': {'api': ['private']},
+            },
+        })
+
+
+exchange = private_only({'enableRateLimit': True})
+exchange.requests = []
+assert(exchange.request_cost('ticker', 'public', 'GET') == 1)
+start = time.time()
+for i in range(0, 6):
+    exchange.public_get_ticker()
+elapsed = (time.time() - start) * 1000
+assert(len(exchange.requests) == 6)
+assert(elapsed >= 20 * 5 * 0.9)
+
+# a cost that names an undeclared bucket is an ExchangeError that names the bucket
+
+
+class misnamed(weighted):
+
+    def describe(self):
+        return self.deep_extend(super(misnamed, self).describe(), {
+            'api': {
+                'private': {
+                    'delete': {
+                        'order': {'requests': 1, 'cancels': 1},
+                    },
+                },
+            },
+        })
+
+
+try:
+    misnamed()
+    assert(False)
+except ExchangeError as e:
+    assert('cancels' in str(e))
+
+try:
+    exchange.throttle({'cancels': 1})
+    assert(False)
+except ExchangeError as e:
+    assert('cancels' in str(e))
+
+# the weights of binance, orders are also charged to the orders bucket, the wapi is limited by rateLimit only
+
+binance = Binance()
+assert(binance.request_cost('account', 'private', 'GET') == {'weight': 5})
+assert(binance.request_cost('order', 'private', 'POST') == {'weight': 1, 'orders': 1})
+assert(binance.request_cost('depositHistory', 'wapi', 'GET') is None)
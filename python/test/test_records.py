@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import os
+import sys
+import weakref
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base import records as records_module  # noqa: E402
+from ccxt.base.records import LazyDatetime  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class records(Exchange):
+
+    def parse_trade(self, trade, market=None):
+        timestamp = trade['time']
+        return {
+            'id': str(trade['id']),
+            'info': trade,
+            'timestamp': timestamp,
+            'datetime': self.iso8601(timestamp),
+            'symbol': market['symbol'] if market else None,
+            'order': None,
+            'type': None,
+            'side': 'buy',
+            'takerOrMaker': None,
+            'price': trade['price'],
+            'amount': 1.0,
+            'cost': trade['price'],
+            'fee': None,
+        }
+
+    def parse_order(self, order, market=None):
+        return {
+            'id': order['id'],
+            'info': order,
+            'timestamp': None,
+            'datetime': order['created'],  # a datetime without a timestamp is kept
+            'status': 'open',
+            'trades': [self.parse_trade(trade, market) for trade in order['trades']],
+            'clientOrderId': 'x',  # not a unified key
+        }
+
+    def parse_ticker(self, ticker, market=None):
+        return {
+            'symbol': 'BTC/USD',
+            'timestamp': ticker['time'],
+            'datetime': '2018-01-01',  # not the iso8601 of the timestamp, kept as it is
+            'last': ticker['last'],
+            'info': ticker,
+        }
+
+
+start = 1530000000000
+raw_trades = [{'id': i, 'time': start + (5 - i) * 1000, 'price': 100.0 + i} for i in range(0, 5)]
+market = {'symbol': 'BTC/USD'}
+
+# dicts by default
+
+exchange = records({'id': 'records'})
+dicts = exchange.parse_trades(raw_trades, market)
+assert(type(dicts[0]) is dict)
+assert(type(dicts[0]['datetime']) is str)
+
+# lean records are the same dicts, with a datetime formatted when it is used
+
+exchange = records({'id': 'records', 'leanRecords': True})
+trades = exchange.parse_trades(raw_trades, market)
+assert(all(type(trade) is dict for trade in trades))
+assert(trades == dicts)
+assert(exchange.parseTrade(raw_trades[0], market)['id'] == '0')
+assert([trade['id'] for trade in exchange.parse_trades(raw_trades, market, start + 3000, 2)] == ['2', '1'])
+
+trade = exchange.parse_trade(raw_trades[0], market)
+assert(type(trade['datetime']) is LazyDatetime)
+assert(trade['datetime'] == '2018-06-26T08:00:05.000Z')
+assert(str(trade['datetime']) == '2018-06-26T08:00:05.000Z')
+assert(trade['datetime'].split('T')[0] == '2018-06-26')
+assert(trade['datetime'][0:4] == '2018')
+assert('T' + trade['datetime'] == 'T2018-06-26T08:00:05.000Z')
+assert(exchange.extend(trade, {'side': 'sell'})['datetime'] == '2018-06-26T08:00:05.000Z')
+assert(exchange.json(trade) == exchange.json(dicts[4]))
+
+# the iso8601 of the requests is formatted right away
+
+assert(exchange.iso8601(start) == '2018-06-26T08:00:00.000Z')
+assert(type(exchange.iso8601(start)) is str)
+
+# the parsers do not format the datetimes, each one is formatted once when it is used
+
+calls = [0]
+iso8601 = records_module.iso8601
+
+
+def counting_iso8601(timestamp=None):
+    calls[0] += 1
+    return iso8601(timestamp)
+
+
+records_module.iso8601 = counting_iso8601
+trades = exchange.parse_trades(raw_trades, market)
+assert(calls[0] == 0)
+assert(str(trades[0]['datetime']) == dicts[0]['datetime'])
+assert(trades[0]['datetime'] == dicts[0]['datetime'])
+assert(calls[0] == 1)
+records_module.iso8601 = iso8601
+
+# a parser can use the datetime as a string, like bitz splits it
+
+
+class splitting(records):
+
+    def parse_trade(self, trade, market=None):
+        result = super(splitting, self).parse_trade(trade, market)
+        result['order'] = self.iso8601(trade['time']).split('T')[0]
+        return result
+
+
+exchange = splitting({'leanRecords': True})
+assert(exchange.parse_trade(raw_trades[0], market)['order'] == '2018-06-26')
+exchange = records({'id': 'records', 'leanRecords': True})
+
+# datetimes that are not the iso8601 of a timestamp and keys that are not unified are kept
+
+order = exchange.parse_order({'id': '1', 'created': '2018-06-26', 'trades': raw_trades[0:2]}, market)
+assert(order['datetime'] == '2018-06-26')
+assert(order['clientOrderId'] == 'x')
+assert(type(order['trades'][0]['datetime']) is LazyDatetime)
+ticker = exchange.parse_ticker({'time': start, 'last': 1.0})
+assert(ticker['datetime'] == '2018-01-01')
+
+# the raw info is optional
+
+exchange = records({'id': 'records', 'leanRecords': True, 'recordsInfo': 'drop'})
+trade = exchange.parse_trade(raw_trades[0], market)
+assert(trade['info'] is None)
+assert(exchange.parse_trades(raw_trades, market)[0]['info'] is None)
+exchange = records({'id': 'records', 'leanRecords': True, 'recordsInfo': 'lazy'})
+trade = exchange.parse_trade(raw_trades[0], market)
+assert(trade['info'] == raw_trades[0])
+assert(trade['info']['price'] == 100.0)
+assert(trade['info'].get('id') == 0)
+assert(exchange.json(trade) == exchange.json(dicts[4]))
+exchange = records({'id': 'records', 'leanRecords': True})
+trade = exchange.parse_trade(raw_trades[0], market)
+assert(trade['info'] is raw_trades[0])  # kept by reference
+
+# the wrapping is never done twice
+
+exchange.use_lean_records()
+assert(type(exchange.parse_trade(raw_trades[0], market)['datetime']) is LazyDatetime)
+assert(exchange.parse_trade(raw_trades[0], market)['info'] is raw_trades[0])
+
+# the wrappers do not keep the exchange alive, it is released without the garbage collector
+
+gc.disable()
+reference = weakref.ref(exchange)
+del exchange
+assert(reference() is None)
+gc.enable()
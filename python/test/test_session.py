@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer  # python 2
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.session import close_shared_sessions  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# the pool settings are applied to the adapters of the session
+
+exchange = Exchange({
+    'id': 'pooled',
+    'sessionPoolConnections': 4,
+    'sessionPoolMaxSize': 32,
+    'sessionPoolBlock': True,
+    'sessionMaxRetries': 2,
+})
+adapter = exchange.session.get_adapter('https://api.example.com')
+assert(adapter._pool_connections == 4)
+assert(adapter._pool_maxsize == 32)
+assert(adapter._pool_block is True)
+assert(adapter.max_retries.total == 2)
+assert(exchange.session.get_adapter('http://api.example.com') is adapter)
+assert('Connection' not in exchange.session.headers or exchange.session.headers['Connection'] != 'close')
+
+# keep-alive can be disabled
+
+closing = Exchange({'id': 'closing', 'keepAlive': False})
+assert(closing.session.headers['Connection'] == 'close')
+
+# instances of the same exchange share a session when asked to
+
+first = Exchange({'id': 'shared', 'shareSession': True})
+second = Exchange({'id': 'shared', 'shareSession': True})
+other = Exchange({'id': 'other', 'shareSession': True})
+separate = Exchange({'id': 'shared'})
+assert(first.session is second.session)
+assert(first.session is not other.session)
+assert(first.session is not separate.session)
+
+# a shared session outlives the instances using it
+
+session = first.session
+del first
+assert(second.session is session)
+close_shared_sessions()
+assert(Exchange({'id': 'shared', 'shareSession': True}).session is not session)
+
+# a session passed in the config is used as is
+
+assert(Exchange({'session': session}).session is session)
+
+# a shared session stores no cookies and its cookies are not cleared by the instances using it
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path == '/login':
+            # a cookie set in a redirect is sent with the rest of the same request
+            self.send_response(302)
+            self.send_header('Set-Cookie', 'session=1; Path=/')
+            self.send_header('Location', '/data')
+            self.end_headers()
+            return
+        body = ('{"cookie":"' + (self.headers.get('Cookie') or '') + '"}').encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Set-Cookie', 'tracking=2; Path=/')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = HTTPServer(('127.0.0.1', 0), Handler)
+thread = threading.Thread(target=server.serve_forever)
+thread.daemon = True
+thread.start()
+url = 'http://127.0.0.1:' + str(server.server_address[1])
+
+first = Exchange({'id': 'cookies', 'shareSession': True})
+second = Exchange({'id': 'cookies', 'shareSession': True})
+assert(first.fetch(url + '/login') == {'cookie': 'session=1'})
+assert(len(first.session.cookies) == 0)
+assert(second.fetch(url + '/data') == {'cookie': ''})
+first.session.cookies.set('preset', '3')  # set directly, not from a response
+second.fetch(url + '/data')
+assert(first.session.cookies.get('preset') == '3')
+
+# an own session keeps the cookies of a response until the next request clears them
+
+separate = Exchange({'id': 'cookies'})
+separate.fetch(url + '/data')
+assert(separate.session.cookies.get('tracking') == '2')
+assert(separate.fetch(url + '/data') == {'cookie': ''})
+server.shutdown()
+close_shared_sessions()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.throttle import TokenBucket  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+rate_limit = 10  # milliseconds
+num_threads = 8
+requests_per_thread = 5
+num_requests = num_threads * requests_per_thread
+
+
+def record_releases(bucket):
+    # the exact times the bucket releases the requests at, the threads may wake up later than that
+    releases = []
+    release_time = bucket.release_time
+
+    def recording_release_time(cost=None):
+        timestamp = release_time(cost)
+        releases.append(timestamp)
+        return timestamp
+
+    bucket.release_time = recording_release_time
+    return releases
+
+
+def stress(throttle):
+    timestamps = []
+
+    def worker():
+        for i in range(0, requests_per_thread):
+            throttle()
+            timestamps.append(time.time())  # list.append is atomic
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for i in range(0, num_threads):
+            executor.submit(worker)
+    return start, sorted(timestamps)
+
+
+def assert_rate(start, timestamps, releases, rate_limit=rate_limit):
+    assert(len(timestamps) == num_requests)
+    # the first request is free, every other one waits for a whole refill
+    elapsed = (timestamps[-1] - start) * 1000
+    assert(elapsed >= (num_requests - 1) * rate_limit * 0.9)
+    # no burst beyond the capacity of 1 at any moment
+    releases = sorted(releases)
+    assert(len(releases) == num_requests)
+    for i in range(0, len(releases) - 2):
+        assert((releases[i + 2] - releases[i]) * 1000 >= rate_limit * 0.9)
+
+
+# concurrent threads sharing one bucket never exceed its rate
+
+bucket = TokenBucket({'refillRate': 1.0 / rate_limit, 'capacity': 1.0})
+releases = record_releases(bucket)
+assert_rate(*stress(bucket.throttle), releases=releases)
+
+# one exchange instance shared across a thread pool
+
+exchange = Exchange({'id': 'shared', 'rateLimit': rate_limit})
+releases = record_releases(exchange.rateLimiter)
+assert_rate(*stress(exchange.throttle), releases=releases)
+
+# a rateLimit set after the instance is created applies to the next requests
+
+exchange.rateLimit = rate_limit * 2
+releases = record_releases(exchange.rateLimiter)
+assert_rate(*stress(exchange.throttle), releases=releases, rate_limit=rate_limit * 2)
+
+# instances with the same apiKey share the limiter when asked to, others do not
+
+first = Exchange({'id': 'shared', 'apiKey': 'key', 'rateLimit': rate_limit, 'shareRateLimiter': True})
+second = Exchange({'id': 'shared', 'apiKey': 'key', 'rateLimit': rate_limit, 'shareRateLimiter': True})
+other = Exchange({'id': 'shared', 'apiKey': 'other', 'rateLimit': rate_limit, 'shareRateLimiter': True})
+separate = Exchange({'id': 'shared', 'apiKey': 'key', 'rateLimit': rate_limit})
+assert(first.rateLimiter is second.rateLimiter)
+assert(first.rateLimiter is not other.rateLimiter)
+assert(first.rateLimiter is not separate.rateLimiter)
+
+instances = [first, second]
+releases = record_releases(first.rateLimiter)
+calls = [0]
+
+
+def alternate():
+    calls[0] += 1
+    instances[calls[0] % 2].throttle()
+
+
+assert_rate(*stress(alternate), releases=releases)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.async_support.base.throttle import throttle  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+async def test_throttle():
+    rate_limit = 20  # milliseconds
+    limiter = throttle({'refillRate': 1.0 / rate_limit, 'capacity': 1.0, 'defaultCost': 1.0})
+    futures = [limiter(), limiter(3), limiter()]
+    assert(limiter.queue_depth == 3)
+    start = time.time()
+    await asyncio.gather(*futures)
+    elapsed = (time.time() - start) * 1000
+    # the first request is free, then 1 + 3 units of cost have to be refilled
+    assert(elapsed >= 4 * rate_limit * 0.9)
+    assert(elapsed < 4 * rate_limit * 2)
+    assert(limiter.queue_depth == 0)
+    assert(limiter.metrics['requests'] == 3)
+    assert(limiter.metrics['maxWaitTime'] >= limiter.metrics['lastWaitTime'] > 0)
+
+    # cancelled requests do not consume tokens
+    cancelled = limiter(10)
+    cancelled.cancel()
+    start = time.time()
+    await limiter()
+    assert((time.time() - start) * 1000 < 3 * rate_limit)
+
+
+asyncio.get_event_loop().run_until_complete(test_throttle())
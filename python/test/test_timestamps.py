@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import calendar
+import datetime
+import os
+import random
+import re
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.timestamps import iso8601  # noqa: E402
+from ccxt.base.timestamps import parse8601  # noqa: E402
+from ccxt.base.timestamps import days_from_civil  # noqa: E402
+from ccxt.base.timestamps import civil_from_days  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def datetime_iso8601(timestamp):
+    # the previous implementation through datetime, for comparison
+    utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
+    return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
+
+
+def datetime_parse8601(timestamp):
+    regex = r'([0-9]{4})-?([0-9]{2})-?([0-9]{2})(?:T|[\s])?([0-9]{2}):?([0-9]{2}):?([0-9]{2})(\.[0-9]{1,3})?(?:(\+|\-)([0-9]{2})\:?([0-9]{2})|Z)?'
+    try:
+        match = re.search(regex, timestamp, re.IGNORECASE)
+        if match is None:
+            return None
+        yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
+        ms = ms or '.000'
+        sign = int((sign or '') + '1')
+        offset = datetime.timedelta(hours=int(hours or 0) * sign, minutes=int(minutes or 0) * sign)
+        dt = datetime.datetime.strptime(yyyy + mm + dd + h + m + s + ms + 'Z', "%Y%m%d%H%M%S.%fZ") + offset
+        return calendar.timegm(dt.utctimetuple()) * 1000 + int(ms[1:])
+    except (TypeError, OverflowError, OSError, ValueError):
+        return None
+
+
+# the calendar arithmetic agrees with datetime over the whole range of datetime
+
+epoch = datetime.date(1970, 1, 1)
+for date in [datetime.date(1, 1, 1), datetime.date(1600, 2, 29), datetime.date(1900, 3, 1), datetime.date(9999, 12, 31)]:
+    days = (date - epoch).days
+    assert(days_from_civil(date.year, date.month, date.day) == days)
+    assert(civil_from_days(days) == (date.year, date.month, date.day))
+random.seed(0)
+for i in range(0, 2000):
+    days = random.randint((datetime.date(1, 1, 1) - epoch).days, (datetime.date(9999, 12, 31) - epoch).days)
+    date = epoch + datetime.timedelta(days=days)
+    assert(days_from_civil(date.year, date.month, date.day) == days)
+    assert(civil_from_days(days) == (date.year, date.month, date.day))
+
+# timestamps to strings and back, twice to go through the caches
+
+timestamps = [0, 999, 1000, 951782400000, 951868799999, 253402300799999]
+timestamps += [random.randint(0, 253402300799999) for i in range(0, 2000)]
+timestamps += [1530000000000 + random.randint(0, 5000) for i in range(0, 2000)]
+for repeat in range(0, 2):
+    for timestamp in timestamps:
+        string = iso8601(timestamp)
+        assert(string == datetime_iso8601(timestamp))
+        assert(parse8601(string) == timestamp)
+
+# the other formats, offsets and invalid dates parse like they did
+
+strings = [
+    '2000-02-29T00:00:00Z', '1900-02-29T00:00:00Z', '2001-02-29T00:00:00Z', '2000-04-31T00:00:00Z',
+    '2000-01-01T00:00:60Z', '2018-01-01T24:00:00Z', '0000-01-01T00:00:00Z', '0001-01-01T00:00:00Z',
+    '0001-01-01T00:00:00-01:00', '0001-01-01T00:00:00+01:00', '9999-12-31T23:59:59+01:00', '9999-12-31T23:59:59-01:00',
+    '2018-01-01 12:00:00.5', '2018-01-01 12:00:00.12', 'x2018-01-01T12:00:00.123Zjunk', '20180101T120000',
+    '2018-01-01t12:00:00.123z', '2018-01-01T12:00:00+0530', '2018-01-01T12:00:00.12345Z', '2018-01-0112:00:00',
+    '2018-01-01T12:00:00+99:99', '2018-01-01T12:00:00.123+01:00', '2018-01-01T12:00:00.123-0100', '2018-01-01T12:00:00.1a3Z',
+    '2018-01-01T12:00:00', '', '3333', 'Sr90', b'2018-01-01T12:00:00.000Z', 33, {}, [],
+]
+for repeat in range(0, 2):
+    for string in strings:
+        assert(parse8601(string) == datetime_parse8601(string))
+
+# a string of a cached second with other milliseconds
+
+assert(parse8601('1986-04-26T01:23:47.000Z') == 514862627000)
+assert(parse8601('1986-04-26T01:23:47.9x9Z') == datetime_parse8601('1986-04-26T01:23:47.9x9Z'))
+assert(parse8601('1986-04-26T01:23:47.99Z') == 514862627099)
+
+assert(iso8601(None) is None)
+assert(iso8601(-1) is None)
+assert(iso8601(1.5) is None)
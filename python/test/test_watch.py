@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+start = 1530000000000
+
+
+class poller(Exchange):
+
+    def __init__(self, config={}):
+        super(poller, self).__init__(config)
+        self.requests = 0
+        self.tickers = []
+        self.books = []
+        self.trades = []
+
+    async def next_response(self, responses):
+        await asyncio.sleep(0)
+        self.requests += 1
+        return responses.pop(0)
+
+    async def fetch_ticker(self, symbol, params={}):
+        return await self.next_response(self.tickers)
+
+    async def fetch_order_book(self, symbol, limit=None, params={}):
+        return await self.next_response(self.books)
+
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        return await self.next_response(self.trades)
+
+
+def ticker(i, last):
+    return {'symbol': 'BTC/USD', 'timestamp': start + i, 'datetime': None, 'last': last, 'info': {'i': i}}
+
+
+def trade(id, timestamp):
+    return {'id': None if id is None else str(id), 'timestamp': start + timestamp, 'price': 1.0, 'amount': 1.0}
+
+
+async def take(iterator, count):
+    results = []
+    async for result in iterator:
+        results.append(result)
+        if len(results) == count:
+            break
+    return results
+
+
+loop = asyncio.get_event_loop()
+
+# unchanged tickers are skipped, the timestamp and the info are ignored
+
+exchange = poller({'id': 'poller', 'enableRateLimit': True})
+exchange.tickers = [ticker(0, 1.0), ticker(1, 1.0), ticker(2, 1.0), ticker(3, 1.1), ticker(4, 1.0)]
+tickers = loop.run_until_complete(take(exchange.watch_ticker('BTC/USD'), 3))
+assert([t['last'] for t in tickers] == [1.0, 1.1, 1.0])
+assert(exchange.requests == 5)
+
+# polls are only made when the next result is awaited
+
+exchange.requests = 0
+exchange.tickers = [ticker(5, 1.2), ticker(6, 1.3)]
+watcher = exchange.watchTicker('BTC/USD')
+assert(exchange.requests == 0)
+assert(loop.run_until_complete(watcher.__anext__())['last'] == 1.2)
+assert(exchange.requests == 1)
+
+# order books
+
+bids = [[1.0, 1.0]]
+exchange.books = [
+    {'bids': bids, 'asks': [[2.0, 1.0]], 'nonce': 1},
+    {'bids': bids, 'asks': [[2.0, 1.0]], 'nonce': 2},
+    {'bids': bids, 'asks': [[2.0, 2.0]], 'nonce': 3},
+]
+books = loop.run_until_complete(take(exchange.watch_order_book('BTC/USD'), 2))
+assert([book['nonce'] for book in books] == [1, 3])
+
+# trades are returned once, by timestamp and by id at the same timestamp
+
+exchange.trades = [
+    [trade(1, 0), trade(2, 1), trade(3, 1)],
+    [trade(2, 1), trade(3, 1)],
+    [trade(2, 1), trade(3, 1), trade(4, 1), trade(5, 2)],
+    [trade(4, 1), trade(5, 2), trade(6, 3)],
+]
+batches = loop.run_until_complete(take(exchange.watch_trades('BTC/USD'), 3))
+assert([[t['id'] for t in batch] for batch in batches] == [['1', '2', '3'], ['4', '5'], ['6']])
+
+# trades without an id are told apart by their timestamp, price, amount and side
+
+exchange.trades = [
+    [trade(None, 10), trade(None, 11)],
+    [trade(None, 11), dict(trade(None, 11), price=1.5)],
+    [trade(None, 11), dict(trade(None, 11), price=1.5), trade(None, 12)],
+]
+batches = loop.run_until_complete(take(exchange.watch_trades('BTC/USD'), 3))
+assert([[(t['timestamp'] - start, t['price']) for t in batch] for batch in batches] == [[(10, 1.0), (11, 1.0)], [(11, 1.5)], [(12, 1.0)]])
+loop.run_until_complete(exchange.close())
+
+# without the rate limiter the polls are spaced by the interval
+
+exchange = poller({'id': 'poller', 'rateLimit': 50})
+exchange.tickers = [ticker(0, 1.0), ticker(1, 1.0), ticker(2, 1.1)]
+started = exchange.milliseconds()
+loop.run_until_complete(take(exchange.watch_ticker('BTC/USD'), 2))
+assert(exchange.milliseconds() - started >= 90)
+
+loop.run_until_complete(exchange.close())